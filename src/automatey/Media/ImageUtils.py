@@ -5,6 +5,7 @@ import PIL.Image
 import PIL.ImageOps
 import PIL.ImageEnhance
 import PIL.ImageFilter
+import PIL.GifImagePlugin
 import imageio
 import numpy as np
 import typing
@@ -14,6 +15,13 @@ import automatey.OS.FileUtils as FileUtils
 import automatey.Abstract.Graphics as AbstractGraphics
 import automatey.Utils.ColorUtils as ColorUtils
 import automatey.Utils.ExceptionUtils as ExceptionUtils
+import automatey.Utils.TimeUtils as TimeUtils
+
+# Standard libraries
+import os
+import math
+import time
+import concurrent.futures
 
 class INTERNAL_FrameProcessing:
     '''
@@ -88,6 +96,20 @@ class INTERNAL_FrameProcessing:
             # ? Read image(s) from file(s).
             imgHandlers = [cv2.imread(str(f)) for f in f_list]
 
+            return INTERNAL_FrameProcessing.CV2Wrapper.tile(imgHandlers, rowCount, columnCount)
+
+        @staticmethod
+        def tile(imgHandlers:list, rowCount:int, columnCount:int):
+            '''
+            Tile image(s) in a grid.
+            
+            Note, if image(s) are less than grid cell(s), remaining cell(s) are left black.
+            '''
+            
+            # ? Pad image(s), with black image(s).
+            paddingCount = (rowCount * columnCount) - len(imgHandlers)
+            imgHandlers = list(imgHandlers) + [np.zeros_like(imgHandlers[0]) for _ in range(paddingCount)]
+            
             # ? Tile image(s).
             rowImgHandlers = []
             for rowIdx in range(rowCount):
@@ -141,30 +163,36 @@ class INTERNAL_FrameProcessing:
             return imgHandler
 
         @staticmethod
-        def grayscale(imgHandler):
+        def grayscale(imgHandler, dst=None):
             '''
             Convert into grayscale.
+            
+            If `dst` is specified, output is written into it (i.e., unless already grayscale).
             '''
             if len(imgHandler.shape) > 2:
-                imgHandler = cv2.cvtColor(imgHandler, cv2.COLOR_BGR2GRAY)
+                imgHandler = cv2.cvtColor(imgHandler, cv2.COLOR_BGR2GRAY, dst=dst)
             return imgHandler
 
         @staticmethod
-        def blackWhite(imgHandler, threshold=0.5):
+        def blackWhite(imgHandler, threshold=0.5, dst=None):
             '''
             Convert grayscale into black-and-white.
             
             Threshold range is (0, 1). A lower threshold leads to more white regions.
+            
+            If `dst` is specified, output is written into it.
             '''
-            _, imgHandler = cv2.threshold(imgHandler, int(threshold*255), 255, cv2.THRESH_BINARY)
+            _, imgHandler = cv2.threshold(imgHandler, int(threshold*255), 255, cv2.THRESH_BINARY, dst=dst)
             return imgHandler
 
         @staticmethod
-        def invert(imgHandler):
+        def invert(imgHandler, dst=None):
             '''
             Invert value(s).
+            
+            If `dst` is specified, output is written into it.
             '''
-            imgHandler = cv2.bitwise_not(imgHandler)
+            imgHandler = cv2.bitwise_not(imgHandler, dst=dst)
             return imgHandler
 
         sepiaToneMatrix = np.array([[0.272, 0.534, 0.131],
@@ -172,11 +200,13 @@ class INTERNAL_FrameProcessing:
                                     [0.393, 0.769, 0.189]])
 
         @staticmethod
-        def sepiaTone(imgHandler):
+        def sepiaTone(imgHandler, dst=None):
             '''
             Applies sepia-tone (i.e., a yellow-ish, vintage effect).
+            
+            If `dst` is specified, output is written into it.
             '''
-            imgHandler = cv2.transform(imgHandler, INTERNAL_FrameProcessing.CV2Wrapper.sepiaToneMatrix)
+            imgHandler = cv2.transform(imgHandler, INTERNAL_FrameProcessing.CV2Wrapper.sepiaToneMatrix, dst=dst)
             return imgHandler
 
         @staticmethod
@@ -209,6 +239,113 @@ class INTERNAL_FrameProcessing:
             imgHandler = cv2.bilateralFilter(imgHandler, d=kernelSize, sigmaColor=75, sigmaSpace=75)
             return imgHandler
 
+        @staticmethod
+        def INTERNAL_filter3x3(imgHandler, kernel:np.ndarray, delta:float=0):
+            '''
+            Applies a 3x3 kernel (i.e., a correlation), as 'Pillow' does.
+            
+            Note, the outer-most pixel(s) are copied as-is from the input (i.e., as 'Pillow' does).
+            '''
+            outImgHandler = cv2.filter2D(imgHandler, -1, kernel, delta=delta, borderType=cv2.BORDER_REPLICATE)
+            outImgHandler[[0, -1], :] = imgHandler[[0, -1], :]
+            outImgHandler[:, [0, -1]] = imgHandler[:, [0, -1]]
+            return outImgHandler
+
+        # Kernel(s) are equivalent to those of 'Pillow' (i.e., 'SMOOTH', 'FIND_EDGES', and 'EMBOSS'), as correlation(s).
+        smoothKernel = np.array([[1, 1, 1],
+                                 [1, 5, 1],
+                                 [1, 1, 1]], dtype=np.float32) / 13
+        findEdgesKernel = np.array([[-1, -1, -1],
+                                    [-1,  8, -1],
+                                    [-1, -1, -1]], dtype=np.float32)
+        embossKernel = np.array([[ 0, 0, 0],
+                                 [ 0, 1, 0],
+                                 [-1, 0, 0]], dtype=np.float32)
+
+        @staticmethod
+        def brightnessContrast(imgHandler, brightness=1.0, contrast=1.0, dst=None):
+            '''
+            Adjust brightness and contrast.
+            
+            Value(s) are factor(s) (i.e., '1.0' has no effect).
+            
+            If `dst` is specified, output is written into it (i.e., unless both are '1.0').
+            
+            Note, output is identical to that of 'Pillow' (i.e., contrast blends with the rounded mean of the grayscale).
+            '''
+            if np.float32(brightness) != 1.0:
+                imgHandler = cv2.LUT(imgHandler, INTERNAL_FrameProcessing.CV2Wrapper.createBrightnessLUT(brightness), dst=dst)
+            if np.float32(contrast) != 1.0:
+                mean = INTERNAL_FrameProcessing.CV2Wrapper.computeContrastMean(imgHandler)
+                imgHandler = cv2.LUT(imgHandler, INTERNAL_FrameProcessing.CV2Wrapper.createContrastLUT(contrast, mean), dst=dst)
+            
+            return imgHandler
+        
+        @staticmethod
+        def createBrightnessLUT(brightness) -> np.ndarray:
+            '''
+            Returns the look-up table of a brightness adjustment (see `brightnessContrast`).
+            '''
+            values = np.arange(256, dtype=np.float32)
+            return np.clip(values * np.float32(brightness), 0, 255).astype(np.uint8)
+        
+        @staticmethod
+        def computeContrastMean(imgHandler) -> int:
+            '''
+            Returns the mean (rounded) of the grayscale of an image, that a contrast adjustment blends with (see `brightnessContrast`).
+            '''
+            return int(INTERNAL_FrameProcessing.CV2Wrapper.grayscale(imgHandler).mean() + 0.5)
+        
+        @staticmethod
+        def createContrastLUT(contrast, mean:int) -> np.ndarray:
+            '''
+            Returns the look-up table of a contrast adjustment, given the mean it blends with (see `brightnessContrast`).
+            '''
+            values = np.arange(256, dtype=np.float32)
+            mean = np.float32(mean)
+            return np.clip(mean + np.float32(contrast) * (values - mean), 0, 255).astype(np.uint8)
+
+        @staticmethod
+        def sharpen(imgHandler, factor):
+            '''
+            Sharpen an image.
+            
+            Value(s) are factor(s) (i.e., '1.0' has no effect).
+            
+            Note, the blend with the smoothed image is folded into a single kernel (i.e., unlike 'Pillow', the smoothed image is not rounded first, so output may differ from that of 'Pillow' by up to `(|factor - 1| + 1) / 2` level(s), rounded up, e.g., up to 2 level(s) for a factor within [0, 4]).
+            '''
+            factor = float(factor)
+            
+            if factor != 1.0:
+                kernel = (1 - factor) * INTERNAL_FrameProcessing.CV2Wrapper.smoothKernel
+                kernel[1, 1] += factor
+                imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.INTERNAL_filter3x3(imgHandler, kernel)
+                
+            return imgHandler
+
+        @staticmethod
+        def findEdges(imgHandler):
+            '''
+            Finds and leaves only edges.
+            '''
+            return INTERNAL_FrameProcessing.CV2Wrapper.INTERNAL_filter3x3(imgHandler, INTERNAL_FrameProcessing.CV2Wrapper.findEdgesKernel)
+
+        @staticmethod
+        def emboss(imgHandler):
+            '''
+            Emboss.
+            '''
+            return INTERNAL_FrameProcessing.CV2Wrapper.INTERNAL_filter3x3(imgHandler, INTERNAL_FrameProcessing.CV2Wrapper.embossKernel, delta=128)
+
+        @staticmethod
+        def addBorder(imgHandler, border:AbstractGraphics.Border):
+            '''
+            Adds a border.
+            '''
+            thickness = border.thickness
+            color = INTERNAL_FrameProcessing.CV2Wrapper.convertRGBtoBGR(border.color)
+            return cv2.copyMakeBorder(imgHandler, thickness, thickness, thickness, thickness, cv2.BORDER_CONSTANT, value=color)
+
         @staticmethod
         def pixelate(imgHandler, factor):
             '''
@@ -308,22 +445,284 @@ class INTERNAL_FrameConversion:
     def CV2ToImageIO(imgHandler):
         return cv2.cvtColor(imgHandler, cv2.COLOR_BGR2RGB)
 
+class INTERNAL_OperationGraph:
+    '''
+    A (lazy) graph of operation(s) on a 'CV2' image, that is optimized, then applied, once materialized.
+    
+    Note that,
+    - Operation(s) are recorded by name, along with their argument(s) (i.e., names of `Image` method(s)).
+    - Crop(s) are moved ahead of pixel-wise operation(s), and down-scale(s) ahead of affine pixel-wise operation(s) that do not clip (i.e., so that these process fewer pixel(s)).
+    - Consecutive per-channel operation(s) (i.e., invert, brightness/contrast, and black-and-white) are fused into a single look-up pass, by composing their look-up table(s) (i.e., the result is identical to that of the eager operation(s)). A pass that maps each value into itself is skipped.
+    - A contrast adjustment blends with the mean of the image it applies to, which is computed from the histogram of a grayscale image (i.e., with no extra pass), while a pending pass over a color image is applied first.
+    - Otherwise, operation(s) are applied as eager operation(s) are, hence, only a re-ordered down-scale may differ from the eager result (i.e., by a level, which any subsequent gain amplifies, e.g., by up to 4 level(s), over randomized chain(s) of up to 5 operation(s), with factor(s) within [0.5, 1.6]). Down-scale(s) are not re-ordered up to (and including) the last thresholding operation (i.e., black-and-white), as a rounding difference may flip a pixel (i.e., by 255).
+    - The input image is never modified, while the output of any pass (i.e., a buffer of the graph) is re-used by subsequent look-up pass(es).
+    '''
+    
+    PixelwiseOperations = ('invert', 'sepiaTone', 'grayscale', 'brightnessContrast', 'blackWhite')
+    ThresholdingOperations = ('blackWhite',)
+    LookupOperations = ('invert', 'brightnessContrast', 'blackWhite')
+    
+    def __init__(self):
+        self.operations = []
+    
+    def append(self, name:str, args:tuple):
+        self.operations.append((name, args))
+    
+    def isEmpty(self) -> bool:
+        return len(self.operations) == 0
+    
+    @staticmethod
+    def INTERNAL_isPixelwise(operation) -> bool:
+        '''
+        Checks if operation is pixel-wise (i.e., each output pixel depends on its input pixel only).
+        
+        Note, contrast is not pixel-wise, as it depends on the mean of the image.
+        '''
+        name, args = operation
+        if name == 'brightnessContrast':
+            return float(args[1]) == 1.0
+        return name in INTERNAL_OperationGraph.PixelwiseOperations
+    
+    @staticmethod
+    def INTERNAL_isLinearPixelwise(operation) -> bool:
+        '''
+        Checks if operation is affine, and pixel-wise, with no clipping (i.e., it commutes with a down-scale, up to rounding).
+        '''
+        name, args = operation
+        if name in ('invert', 'grayscale'):
+            return True
+        if name == 'brightnessContrast':
+            return (float(args[1]) == 1.0) and (0.0 <= float(args[0]) <= 1.0)
+        return False
+    
+    @staticmethod
+    def INTERNAL_inferDimensions(operation, dimensions:tuple) -> tuple:
+        '''
+        Infers the '(width, height)' of the output of an operation, given that of its input.
+        '''
+        name, args = operation
+        width, height = dimensions
+        if name == 'resize':
+            newWidth, newHeight = args
+            if newWidth == -1:
+                newWidth = int(newHeight * (width / height))
+            elif newHeight == -1:
+                newHeight = int(newWidth / (width / height))
+            return (newWidth, newHeight)
+        if name == 'crop':
+            topLeft, bottomRight = args
+            return (len(range(width)[topLeft.x - 1:bottomRight.x]), len(range(height)[topLeft.y - 1:bottomRight.y]))
+        if name == 'addBorder':
+            border = args[0]
+            return (width + 2 * border.thickness, height + 2 * border.thickness)
+        return (width, height)
+    
+    def inferDimensions(self, dimensions:tuple) -> tuple:
+        '''
+        Infers the '(width, height)' of the output of the graph, given that of its input.
+        '''
+        for operation in self.operations:
+            dimensions = INTERNAL_OperationGraph.INTERNAL_inferDimensions(operation, dimensions)
+        return dimensions
+    
+    @staticmethod
+    def INTERNAL_optimize(operations:list, dimensions:tuple, isExact:bool=False) -> list:
+        '''
+        Returns a (re-ordered) list of operation(s), where crop(s), and down-scale(s), are moved ahead where possible.
+        
+        Note, if `isExact` is set, only crop(s) are moved (i.e., the result is identical).
+        '''
+        operations = list(operations)
+        isChanged = True
+        while isChanged:
+            isChanged = False
+            currentDimensions = dimensions
+            for idx in range(1, len(operations)):
+                previousOperation = operations[idx - 1]
+                previousDimensions = currentDimensions
+                currentDimensions = INTERNAL_OperationGraph.INTERNAL_inferDimensions(previousOperation, currentDimensions)
+                operation = operations[idx]
+                
+                isCommutable = False
+                if operation[0] == 'crop':
+                    isCommutable = INTERNAL_OperationGraph.INTERNAL_isPixelwise(previousOperation)
+                elif (operation[0] == 'resize') and (not isExact):
+                    newWidth, newHeight = INTERNAL_OperationGraph.INTERNAL_inferDimensions(operation, currentDimensions)
+                    isDownscale = (newWidth <= currentDimensions[0]) and (newHeight <= currentDimensions[1]) and ((newWidth, newHeight) != currentDimensions)
+                    isCommutable = isDownscale and INTERNAL_OperationGraph.INTERNAL_isLinearPixelwise(previousOperation)
+                
+                if isCommutable:
+                    # Pixel-wise operation(s) preserve dimension(s), hence, a resize's '-1' is resolved as before.
+                    if operation[0] == 'resize':
+                        operation = ('resize', INTERNAL_OperationGraph.INTERNAL_inferDimensions(operation, currentDimensions))
+                    operations[idx - 1], operations[idx] = operation, previousOperation
+                    currentDimensions = INTERNAL_OperationGraph.INTERNAL_inferDimensions(operation, previousDimensions)
+                    isChanged = True
+        return operations
+    
+    class INTERNAL_LookupPass:
+        '''
+        A (fused) look-up pass, that maps each value `x` (of every channel) into `lut[x]`.
+        '''
+        
+        IdentityLUT = np.arange(256, dtype=np.uint8)
+        
+        def __init__(self):
+            self.lut = None
+            self.operations = []
+        
+        def isIdentity(self) -> bool:
+            return (self.lut is None) or np.array_equal(self.lut, INTERNAL_OperationGraph.INTERNAL_LookupPass.IdentityLUT)
+        
+        def compose(self, operation, lut:np.ndarray):
+            '''
+            Composes the look-up table (of an operation), after this one.
+            '''
+            self.lut = lut if (self.lut is None) else lut[self.lut]
+            if (len(self.operations) == 0) or (self.operations[-1] is not operation):
+                self.operations.append(operation)
+        
+        def map(self, lut:np.ndarray) -> np.ndarray:
+            '''
+            Returns a look-up table, of the value(s) this pass maps into (e.g., a histogram, as mapped by this pass).
+            '''
+            return lut if (self.lut is None) else lut[self.lut]
+        
+        def apply(self, imgHandler, operationFcns:dict, dst=None):
+            '''
+            Applies (then, resets) the pass, returning the output image.
+            
+            If `dst` is specified, output is written into it.
+            
+            Note, a pass of a single invert, or black-and-white, operation is applied as the eager operation is (i.e., a bitwise, or thresholding, pass is faster than a look-up).
+            '''
+            if not self.isIdentity():
+                name, args = self.operations[0]
+                if (len(self.operations) == 1) and (name in ('invert', 'blackWhite')):
+                    imgHandler = operationFcns[name](imgHandler, *args, dst=dst)
+                else:
+                    imgHandler = cv2.LUT(imgHandler, self.lut, dst=dst)
+            self.lut = None
+            self.operations = []
+            return imgHandler
+    
+    # Count(s) of a 'CV2' histogram are single-precision float(s) (i.e., exact up to 2^24).
+    MaxHistogramCount = 2 ** 24
+    
+    @staticmethod
+    def INTERNAL_computeContrastMean(imgHandler, lookupPass:'INTERNAL_OperationGraph.INTERNAL_LookupPass') -> int:
+        '''
+        Returns the mean a contrast adjustment blends with (see `CV2Wrapper.computeContrastMean`), of a grayscale image, as mapped by a (pending) look-up pass.
+        
+        Note, the mean is that of the histogram (i.e., the sum is exact, as that of the eager operation), hence, the image must not exceed `MaxHistogramCount` pixel(s).
+        '''
+        if lookupPass.isIdentity():
+            return INTERNAL_FrameProcessing.CV2Wrapper.computeContrastMean(imgHandler)
+        histogram = cv2.calcHist([imgHandler], [0], None, [256], [0, 256]).ravel().astype(np.int64)
+        mappedValues = lookupPass.map(INTERNAL_OperationGraph.INTERNAL_LookupPass.IdentityLUT).astype(np.int64)
+        return int(float((histogram * mappedValues).sum()) / imgHandler.size + 0.5)
+    
+    def materialize(self, imgHandler, operationFcns:dict):
+        '''
+        Optimizes, and applies, all operation(s), returning the output image.
+        '''
+        # ? Optimize operation(s), where down-scale(s) are not re-ordered up to the last thresholding operation.
+        thresholdingIdx = max((idx for idx, (name, _) in enumerate(self.operations) if name in INTERNAL_OperationGraph.ThresholdingOperations), default=-1)
+        dimensions = INTERNAL_FrameProcessing.CV2Wrapper.getDimensions(imgHandler)
+        exactOperations = INTERNAL_OperationGraph.INTERNAL_optimize(self.operations[:thresholdingIdx + 1], dimensions, isExact=True)
+        for operation in exactOperations:
+            dimensions = INTERNAL_OperationGraph.INTERNAL_inferDimensions(operation, dimensions)
+        operations = exactOperations + INTERNAL_OperationGraph.INTERNAL_optimize(self.operations[thresholdingIdx + 1:], dimensions)
+
+        srcImgHandler = imgHandler
+        lookupPass = INTERNAL_OperationGraph.INTERNAL_LookupPass()
+
+        def flushLookup():
+            nonlocal imgHandler
+            # A buffer of the graph (i.e., not sharing memory with the input image) is written in-place.
+            dst = None if np.may_share_memory(imgHandler, srcImgHandler) else imgHandler
+            imgHandler = lookupPass.apply(imgHandler, operationFcns, dst=dst)
+
+        for operation in operations:
+            name, args = operation
+            if name == 'invert':
+                lookupPass.compose(operation, 255 - INTERNAL_OperationGraph.INTERNAL_LookupPass.IdentityLUT)
+            elif name == 'blackWhite':
+                lookupPass.compose(operation, INTERNAL_FrameProcessing.CV2Wrapper.blackWhite(INTERNAL_OperationGraph.INTERNAL_LookupPass.IdentityLUT, *args).ravel())
+            elif name == 'brightnessContrast':
+                brightness, contrast = args
+                if np.float32(brightness) != 1.0:
+                    lookupPass.compose(operation, INTERNAL_FrameProcessing.CV2Wrapper.createBrightnessLUT(brightness))
+                if np.float32(contrast) != 1.0:
+                    # Case: Color image (i.e., mean is that of its grayscale), or too large for an exact histogram (i.e., pending pass is applied first).
+                    if (len(imgHandler.shape) > 2) or (imgHandler.size > INTERNAL_OperationGraph.MaxHistogramCount):
+                        flushLookup()
+                    mean = INTERNAL_OperationGraph.INTERNAL_computeContrastMean(imgHandler, lookupPass)
+                    lookupPass.compose(operation, INTERNAL_FrameProcessing.CV2Wrapper.createContrastLUT(contrast, mean))
+            else:
+                flushLookup()
+                imgHandler = operationFcns[name](imgHandler, *args)
+
+        flushLookup()
+        self.operations = []
+        return imgHandler
+
 # Uses 'CV2' as its format
 class Image:
     '''
     Image handler.
+    
+    Note,
+    - If `isLazy` is set, operation(s) are recorded, and are only applied once the image is materialized (i.e., on `saveAs`, or `EXTERNAL_toCV2`), as an optimized graph (see `INTERNAL_OperationGraph`).
     '''
 
-    def __init__(self, f:FileUtils.File, INTERNAL_imgHandler=None):
+    def __init__(self, f:FileUtils.File, INTERNAL_imgHandler=None, isLazy:bool=False):
         if (f != None):
             self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.createFromFile(f)
         else:
             self.imgHandler = INTERNAL_imgHandler
+        self.operationGraph = INTERNAL_OperationGraph() if isLazy else None
+    
+    INTERNAL_OperationFcns = {
+        'resize' : INTERNAL_FrameProcessing.CV2Wrapper.resize,
+        'grayscale' : INTERNAL_FrameProcessing.CV2Wrapper.grayscale,
+        'blackWhite' : INTERNAL_FrameProcessing.CV2Wrapper.blackWhite,
+        'invert' : INTERNAL_FrameProcessing.CV2Wrapper.invert,
+        'sepiaTone' : INTERNAL_FrameProcessing.CV2Wrapper.sepiaTone,
+        'brightnessContrast' : INTERNAL_FrameProcessing.CV2Wrapper.brightnessContrast,
+        'gaussianBlur' : INTERNAL_FrameProcessing.CV2Wrapper.gaussianBlur,
+        'medianBlur' : INTERNAL_FrameProcessing.CV2Wrapper.medianBlur,
+        'bilateralFilter' : INTERNAL_FrameProcessing.CV2Wrapper.bilateralFilter,
+        'sharpen' : INTERNAL_FrameProcessing.CV2Wrapper.sharpen,
+        'findEdges' : INTERNAL_FrameProcessing.CV2Wrapper.findEdges,
+        'emboss' : INTERNAL_FrameProcessing.CV2Wrapper.emboss,
+        'pixelate' : INTERNAL_FrameProcessing.CV2Wrapper.pixelate,
+        'addBorder' : INTERNAL_FrameProcessing.CV2Wrapper.addBorder,
+        'crop' : INTERNAL_FrameProcessing.CV2Wrapper.crop,
+        'overlayDrawable' : INTERNAL_FrameProcessing.CV2Wrapper.overlayDrawable,
+    }
+    
+    def INTERNAL_apply(self, name:str, *args):
+        '''
+        Applies an operation (or, records it, if lazy).
+        '''
+        if self.operationGraph is None:
+            self.imgHandler = Image.INTERNAL_OperationFcns[name](self.imgHandler, *args)
+        else:
+            self.operationGraph.append(name, args)
+    
+    def INTERNAL_materialize(self):
+        '''
+        Applies all recorded operation(s) (if lazy).
+        '''
+        if (self.operationGraph is not None) and (not self.operationGraph.isEmpty()):
+            self.imgHandler = self.operationGraph.materialize(self.imgHandler, Image.INTERNAL_OperationFcns)
     
     def EXTERNAL_toCV2(self):
         '''
         Get CV2 representation.
         '''
+        self.INTERNAL_materialize()
         return self.imgHandler
 
     @staticmethod
@@ -334,6 +733,16 @@ class Image:
         imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.createByTiling(f_list, rows, columns)
         return Image(None, INTERNAL_imgHandler=imgHandler)
 
+    @staticmethod
+    def createByTilingImages(images:typing.List["Image"], rows:int, columns:int):
+        '''
+        Create an `Image` by tiling (in-memory) `Image`(s) in a grid.
+        
+        Note, all image(s) must share the same dimension(s).
+        '''
+        imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.tile([image.EXTERNAL_toCV2() for image in images], rows, columns)
+        return Image(None, INTERNAL_imgHandler=imgHandler)
+
     @staticmethod
     def INTERNAL_createFromCV2(imgHandler):
         return Image(None, INTERNAL_imgHandler=imgHandler)
@@ -341,8 +750,13 @@ class Image:
     def getDimensions(self):
         '''
         Returns a '(width, height)' tuple.
+        
+        Note, if lazy, dimension(s) are inferred (i.e., without materializing).
         '''
-        return INTERNAL_FrameProcessing.CV2Wrapper.getDimensions(self.imgHandler)
+        dimensions = INTERNAL_FrameProcessing.CV2Wrapper.getDimensions(self.imgHandler)
+        if self.operationGraph is not None:
+            dimensions = self.operationGraph.inferDimensions(dimensions)
+        return dimensions
 
     def resize(self, width, height):
         '''
@@ -350,13 +764,13 @@ class Image:
         
         If either set to '-1', aspect ratio is preserved.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.resize(self.imgHandler, width, height)
+        self.INTERNAL_apply('resize', width, height)
 
     def grayscale(self):
         '''
         Convert into grayscale.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.grayscale(self.imgHandler)
+        self.INTERNAL_apply('grayscale')
         
     def blackWhite(self, threshold=0.5):
         '''
@@ -364,19 +778,19 @@ class Image:
         
         Threshold range is (0, 1). A lower threshold leads to more white regions.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.blackWhite(self.imgHandler, threshold)
+        self.INTERNAL_apply('blackWhite', threshold)
 
     def invert(self):
         '''
         Invert value(s).
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.invert(self.imgHandler)
+        self.INTERNAL_apply('invert')
 
     def sepiaTone(self):
         '''
         Applies sepia-tone (i.e., a yellow-ish, vintage effect).
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.sepiaTone(self.imgHandler)
+        self.INTERNAL_apply('sepiaTone')
 
     def brightnessContrast(self, brightness=1.0, contrast=1.0):
         '''
@@ -384,9 +798,7 @@ class Image:
         
         Value(s) are factor(s) (i.e., '1.0' has no effect).
         '''
-        pillowImgHandler = INTERNAL_FrameConversion.CV2ToPillow(self.imgHandler)
-        pillowImgHandler = INTERNAL_FrameProcessing.PillowWrapper.brightnessContrast(pillowImgHandler, brightness, contrast)
-        self.imgHandler = INTERNAL_FrameConversion.PillowToCV2(pillowImgHandler)
+        self.INTERNAL_apply('brightnessContrast', brightness, contrast)
 
     def gaussianBlur(self, kernelSize):
         '''
@@ -394,7 +806,7 @@ class Image:
         
         Kernel-size must be odd.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.gaussianBlur(self.imgHandler, kernelSize)
+        self.INTERNAL_apply('gaussianBlur', kernelSize)
         
     def medianBlur(self, kernelSize):
         '''
@@ -402,7 +814,7 @@ class Image:
         
         Kernel-size must be odd.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.medianBlur(self.imgHandler, kernelSize)
+        self.INTERNAL_apply('medianBlur', kernelSize)
 
     def bilateralFilter(self, kernelSize):
         '''
@@ -410,7 +822,7 @@ class Image:
         
         Kernel-size must be odd.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.bilateralFilter(self.imgHandler, kernelSize)
+        self.INTERNAL_apply('bilateralFilter', kernelSize)
 
     def sharpen(self, factor):
         '''
@@ -418,25 +830,19 @@ class Image:
         
         Value(s) are factor(s) (i.e., '1.0' has no effect).
         '''
-        pillowImgHandler = INTERNAL_FrameConversion.CV2ToPillow(self.imgHandler)
-        pillowImgHandler = INTERNAL_FrameProcessing.PillowWrapper.sharpen(pillowImgHandler, factor)
-        self.imgHandler = INTERNAL_FrameConversion.PillowToCV2(pillowImgHandler)
+        self.INTERNAL_apply('sharpen', factor)
     
     def findEdges(self):
         '''
         Finds and leaves only edges.
         '''
-        pillowImgHandler = INTERNAL_FrameConversion.CV2ToPillow(self.imgHandler)
-        pillowImgHandler = INTERNAL_FrameProcessing.PillowWrapper.findEdges(pillowImgHandler)
-        self.imgHandler = INTERNAL_FrameConversion.PillowToCV2(pillowImgHandler)
+        self.INTERNAL_apply('findEdges')
 
     def emboss(self):
         '''
         Emboss.
         '''
-        pillowImgHandler = INTERNAL_FrameConversion.CV2ToPillow(self.imgHandler)
-        pillowImgHandler = INTERNAL_FrameProcessing.PillowWrapper.emboss(pillowImgHandler)
-        self.imgHandler = INTERNAL_FrameConversion.PillowToCV2(pillowImgHandler)
+        self.INTERNAL_apply('emboss')
 
     def pixelate(self, factor):
         '''
@@ -444,15 +850,13 @@ class Image:
         
         Value(s) are factor(s) (i.e., '1.0' has no effect).
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.pixelate(self.imgHandler, factor)
+        self.INTERNAL_apply('pixelate', factor)
 
     def addBorder(self, border:AbstractGraphics.Border):
         '''
         Adds a border.
         '''
-        pillowImgHandler = INTERNAL_FrameConversion.CV2ToPillow(self.imgHandler)
-        pillowImgHandler = INTERNAL_FrameProcessing.PillowWrapper.addBorder(pillowImgHandler, border)
-        self.imgHandler = INTERNAL_FrameConversion.PillowToCV2(pillowImgHandler)
+        self.INTERNAL_apply('addBorder', border)
     
     def crop(self, topLeft:AbstractGraphics.Point, bottomRight:AbstractGraphics.Point):
         '''
@@ -460,13 +864,13 @@ class Image:
         
         Note that (1, 1) specifies the pixel at the top-left corner.
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.crop(self.imgHandler, topLeft, bottomRight)
+        self.INTERNAL_apply('crop', topLeft, bottomRight)
         
     def overlayDrawable(self, shape):
         '''
         Add a drawable (e.g., Rectangle).
         '''
-        self.imgHandler = INTERNAL_FrameProcessing.CV2Wrapper.overlayDrawable(self.imgHandler, shape)
+        self.INTERNAL_apply('overlayDrawable', shape)
     
     def saveAs(self, f:FileUtils.File):
         '''
@@ -474,6 +878,7 @@ class Image:
         '''
         if f.isExists():
             raise ExceptionUtils.ValidationError('Destination file must not exist.')
+        self.INTERNAL_materialize()
         INTERNAL_FrameProcessing.CV2Wrapper.saveAs(self.imgHandler, f)
 
     class Utils:
@@ -484,52 +889,287 @@ class Image:
         def isImage(f:FileUtils.File):
             return f.getExtension() in Image.Utils.SupportedExtensions
 
-# Uses 'ImageIO' as its format (Like CV2's, but in 'RGB' instead of 'BGR')
+class INTERNAL_GIFStreamWriter:
+    '''
+    Writes a GIF, frame-by-frame (i.e., unlike 'imageio', which holds all frame(s) until closed).
+    
+    Note,
+    - Frame(s) are in 'RGB' (or, grayscale), and each is quantized into its own (adaptive) palette.
+    - Only the region that changed since the previous frame is written, with unchanged pixel(s) in it being transparent (i.e., the previous frame is kept).
+    '''
+    
+    def __init__(self, f:FileUtils.File, fps:float):
+        self.f = f.openFile('wb')
+        self.duration = 1000 / fps
+        self.prevFrame = None
+
+    def append_data(self, frame):
+        # ? Crop into the region that changed since the previous frame.
+        offset = (0, 0)
+        region = frame
+        isUnchanged = None
+        if self.prevFrame is not None:
+            isChanged = (frame != self.prevFrame)
+            if len(isChanged.shape) > 2:
+                isChanged = isChanged.any(axis=2)
+            rowIndices = np.flatnonzero(isChanged.any(axis=1))
+            columnIndices = np.flatnonzero(isChanged.any(axis=0))
+            # Case: Identical frame (i.e., a single pixel is re-written, to preserve timing).
+            if len(rowIndices) == 0:
+                rowIndices = columnIndices = np.array([0])
+            y1, y2 = rowIndices[0], rowIndices[-1] + 1
+            x1, x2 = columnIndices[0], columnIndices[-1] + 1
+            region = frame[y1:y2, x1:x2]
+            isUnchanged = ~isChanged[y1:y2, x1:x2]
+            offset = (int(x1), int(y1))
+        
+        # ? Quantize, reserving a palette index (i.e., after the used one(s)) for unchanged pixel(s), as transparent.
+        pillowImgHandler = PIL.Image.fromarray(np.ascontiguousarray(region)).convert('P', palette=PIL.Image.Palette.ADAPTIVE, colors=255)
+        params = {}
+        if isUnchanged is not None:
+            palette = pillowImgHandler.getpalette()
+            transparencyIdx = len(palette) // 3
+            indices = np.asarray(pillowImgHandler).copy()
+            indices[isUnchanged] = transparencyIdx
+            pillowImgHandler = PIL.Image.fromarray(indices, mode='P')
+            pillowImgHandler.putpalette(palette + [0, 0, 0])
+            params['transparency'] = transparencyIdx
+        
+        # ? Write header (i.e., on first frame).
+        if self.prevFrame is None:
+            header, _ = PIL.GifImagePlugin.getheader(pillowImgHandler, info={'duration': self.duration})
+            for data in header:
+                self.f.writeAny(data)
+        
+        for data in PIL.GifImagePlugin.getdata(pillowImgHandler, offset, duration=self.duration, disposal=1, include_color_table=True, **params):
+            self.f.writeAny(data)
+        self.prevFrame = frame
+
+    def close(self):
+        # ? Write trailer.
+        self.f.writeAny(b';')
+        self.f.closeFile()
+
+# Uses 'CV2' as its format (i.e., frame(s) are stacked in a single '(N, H, W, C)' array, in 'BGR')
 class GIF:
     '''
     GIF-handler.
+    
+    Note,
+    - Frame(s) are converted from/to 'RGB' only when read/saved (i.e., operation(s) do not convert color-order).
+    - Pixel-wise operation(s) (e.g., invert, sepia-tone, threshold) are applied to chunk(s) of frame(s) at once, in-place where possible, and crop/selection(s) are view(s) where possible.
+    - If `f_scratchDir` is specified, frame(s) are memory-mapped from file(s) under it (i.e., for GIF(s) that do not fit in memory).
+    - If `isStreamed` is set, frame(s) are not read up-front. Operation(s) are queued, and are applied frame-by-frame, as frame(s) are read from the source file (e.g., on `saveAs`), holding only a few frame(s) in memory. The source file must remain available, and backward range(s) may not be selected (i.e., the source would be re-read from the start, per frame).
     '''
-
-    def __init__(self, f:FileUtils.File):
+    
+    # Operation(s) that are pixel-wise (i.e., may be applied to all frame(s), stacked vertically, as a single image).
+    INTERNAL_StackableOperations = ('grayscale', 'blackWhite', 'invert', 'sepiaTone')
+    
+    # Size of a chunk of frame(s), processed at once (i.e., small enough to stay in cache).
+    INTERNAL_ChunkBytes = 1024 * 1024
+
+    def __init__(self, f:FileUtils.File, f_scratchDir:FileUtils.File=None, isStreamed:bool=False):
+        self.f = f
+        self.isStreamed = isStreamed
+        self.f_storeDir = None if ((f_scratchDir is None) or isStreamed) else FileUtils.File.Utils.getTemporaryDirectory(f_scratchDir)
+        self.f_store = None
+        self.fps = None
+        
+        # Case: Streamed (i.e., each frame keeps its index, per selection, for queued operation(s)).
+        if isStreamed:
+            reader = imageio.get_reader(str(f))
+            self.frames = None
+            self.positions = np.arange(reader.get_length())[:, None]
+            self.operations = []
+            reader.close()
+            return
+        
         reader = imageio.get_reader(str(f))
-        self.frames = []
+        frameCount = reader.get_length()
         totalDuration = 0
         for i, frame in enumerate(reader):
+            if i == 0:
+                self.INTERNAL_setFrames(self.INTERNAL_allocate((frameCount,) + frame.shape[:2] + (3,)))
+            # ? Convert into 'BGR', directly into the store (i.e., alpha, if any, is dropped).
+            cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=self.frames[i])
             meta = reader.get_meta_data(i)
-            self.frames.append(frame)
             frameDuration = meta.get("duration", 0)
             totalDuration += frameDuration
+        reader.close()
         self.fps = len(self.frames) / (totalDuration / 1000)
     
+    def __del__(self):
+        if getattr(self, 'f_storeDir', None) is not None:
+            self.frames = None
+            FileUtils.File.Utils.delete(self.f_storeDir)
+
+    def INTERNAL_allocate(self, shape:tuple):
+        '''
+        Allocates a store of frame(s) (i.e., memory-mapped, if a scratch directory is specified).
+        '''
+        if self.f_storeDir is None:
+            return np.empty(shape, dtype=np.uint8)
+        f_store = self.f_storeDir.traverseDirectory(FileUtils.File.Utils.Path.randomizeName('frames.bin'))
+        return np.memmap(str(f_store), dtype=np.uint8, mode='w+', shape=shape)
+    
+    def INTERNAL_setFrames(self, frames):
+        '''
+        Sets the frame(s), deleting the previous store (i.e., if memory-mapped, and replaced).
+        '''
+        self.frames = frames
+        f_store = FileUtils.File(frames.filename) if isinstance(frames, np.memmap) else None
+        if (self.f_store is not None) and ((f_store is None) or (str(f_store) != str(self.f_store))):
+            FileUtils.File.Utils.delete(self.f_store)
+        self.f_store = f_store
+    
+    def INTERNAL_iterateChunks(self, frameCount:int):
+        '''
+        Yields '(start, end)' range(s) of frame(s), each to be processed at once.
+        '''
+        chunkSize = max(1, GIF.INTERNAL_ChunkBytes // self.frames[0].nbytes)
+        for startIdx in range(0, frameCount, chunkSize):
+            yield startIdx, min(startIdx + chunkSize, frameCount)
+
+    def INTERNAL_StackApplier(self, fcn, *args):
+        '''
+        Applies a pixel-wise operation, to all frame(s), chunk-wise (i.e., each chunk is stacked vertically, as a single image).
+        
+        Note, output is written in-place, if the shape is preserved, and the store is contiguous (i.e., not a crop view).
+        '''
+        frameCount = len(self.frames)
+        newFrames = None
+        for startIdx, endIdx in self.INTERNAL_iterateChunks(frameCount):
+            chunk = self.frames[startIdx:endIdx]
+            stackShape = (-1,) + chunk.shape[2:]
+            # ? Allocate output, given the shape of the output of the first chunk (i.e., or, re-use the store).
+            if newFrames is None:
+                newChunk = fcn(chunk.reshape(stackShape), *args)
+                newShape = (frameCount,) + chunk.shape[1:3] + newChunk.shape[2:]
+                isInPlace = (newShape == self.frames.shape) and self.frames.flags['C_CONTIGUOUS']
+                newFrames = self.frames if isInPlace else self.INTERNAL_allocate(newShape)
+                newFrames[startIdx:endIdx] = newChunk.reshape((endIdx - startIdx,) + newShape[1:])
+                continue
+            dstChunk = newFrames[startIdx:endIdx].reshape((-1,) + newFrames.shape[2:])
+            newChunk = fcn(chunk.reshape(stackShape), *args, dst=dstChunk)
+            # Case: Output was not written into destination (e.g., no-op).
+            if newChunk is not dstChunk:
+                dstChunk[...] = newChunk
+        self.INTERNAL_setFrames(newFrames)
+
+    def INTERNAL_FrameApplier(self, fcn):
+        '''
+        Applies an operation, frame-by-frame (i.e., `fcn` receives the frame index, and the frame).
+        '''
+        # Case: Streamed (i.e., queued, along with the current selection).
+        if self.isStreamed:
+            self.operations.append((fcn, self.positions.shape[1] - 1))
+            return
+        
+        frameCount = len(self.frames)
+        newFrames = None
+        for i in range(frameCount):
+            newFrame = fcn(i, self.frames[i])
+            if newFrames is None:
+                newFrames = self.INTERNAL_allocate((frameCount,) + newFrame.shape)
+            newFrames[i] = newFrame
+        self.INTERNAL_setFrames(newFrames)
+
+    def INTERNAL_apply(self, name:str, *args):
+        '''
+        Applies an operation (i.e., to all frame(s) at once, if pixel-wise).
+        '''
+        fcn = Image.INTERNAL_OperationFcns[name]
+        # Brightness (only) is pixel-wise, unlike contrast (i.e., which depends on the mean of each frame).
+        isStackable = (name in GIF.INTERNAL_StackableOperations) or ((name == 'brightnessContrast') and (float(args[1]) == 1.0))
+        if isStackable and (not self.isStreamed):
+            self.INTERNAL_StackApplier(fcn, *args)
+        else:
+            self.INTERNAL_FrameApplier(lambda frameIdx, frame: fcn(frame, *args))
+    
+    def INTERNAL_processStreamedFrame(self, reader, position):
+        '''
+        Reads a frame, and applies all queued operation(s) to it.
+        '''
+        frame = INTERNAL_FrameConversion.ImageIOToCV2(reader.get_data(int(position[0])))
+        for fcn, selectionIdx in self.operations:
+            frame = fcn(int(position[selectionIdx]), frame)
+        return frame
+
+    def INTERNAL_iterateFrames(self, positions=None):
+        '''
+        Yields frame(s) (i.e., if streamed, each is read and processed, as requested).
+        '''
+        if not self.isStreamed:
+            yield from self.frames
+            return
+        
+        reader = imageio.get_reader(str(self.f))
+        try:
+            for position in (self.positions if (positions is None) else positions):
+                yield self.INTERNAL_processStreamedFrame(reader, position)
+        finally:
+            reader.close()
+
+    @staticmethod
+    def INTERNAL_getIndices(ranges) -> np.ndarray:
+        '''
+        Returns the ('0'-indexed) frame indices of range(s).
+        '''
+        indices = []
+        for _range in ranges:
+            start = _range[0] - 1
+            stop = _range[1] - 1
+            step = -1 if (stop < start) else 1
+            indices.extend(range(start, (stop + step), step))
+        return np.array(indices)
+
     def getFrameCount(self):
         '''
         Get frame count.
         '''
-        return len(self.frames)
+        return len(self.positions) if self.isStreamed else len(self.frames)
     
     def getFPS(self):
         '''
         Get FPS.
         '''
+        # ? Compute from frame duration(s) (i.e., if streamed, on first request).
+        if self.fps is None:
+            reader = imageio.get_reader(str(self.f))
+            frameCount = reader.get_length()
+            totalDuration = sum(reader.get_meta_data(i).get("duration", 0) for i in range(frameCount))
+            reader.close()
+            self.fps = frameCount / (totalDuration / 1000)
         return self.fps
 
     def selectFrames(self, ranges):
         '''
         Select specific range(s) of frame(s).
         
-        Note that backward range(s) are supported.
+        Note that backward range(s) are supported (i.e., unless streamed).
         
         Note that frame(s) are '1'-indexed.
         '''
-        newFrames = []
-        for _range in ranges:
-            start = _range[0] - 1
-            stop = _range[1] - 1
-            step = -1 if (stop < start) else 1
-            for i in range(start, (stop + step), step):
-                copiedFrame = np.copy(self.frames[i])
-                newFrames.append(copiedFrame)
-        self.frames = newFrames
+        # Case: Streamed (i.e., a new selection is appended, per frame).
+        if self.isStreamed:
+            if any((_range[1] < _range[0]) for _range in ranges):
+                raise ExceptionUtils.ValidationError('Backward range(s) may not be selected, if streamed.')
+            indices = GIF.INTERNAL_getIndices(ranges)
+            self.positions = np.hstack([self.positions[indices], np.arange(len(indices))[:, None]])
+            return
+        
+        # Case: Single forward range (i.e., a view).
+        if (len(ranges) == 1) and (ranges[0][0] <= ranges[0][1]):
+            self.INTERNAL_setFrames(self.frames[(ranges[0][0] - 1):ranges[0][1]])
+            return
+        
+        indices = GIF.INTERNAL_getIndices(ranges)
+        
+        # ? Gather frame(s) (i.e., chunk-wise, if memory-mapped).
+        newFrames = self.INTERNAL_allocate((len(indices),) + self.frames.shape[1:])
+        for startIdx, endIdx in self.INTERNAL_iterateChunks(len(indices)):
+            np.take(self.frames, indices[startIdx:endIdx], axis=0, out=newFrames[startIdx:endIdx])
+        self.INTERNAL_setFrames(newFrames)
 
     def asImage(self, frameIdx) -> Image:
         '''
@@ -537,26 +1177,23 @@ class GIF:
         
         Note that frame(s) are '1'-indexed.
         '''
-        cv2ImgHandler = INTERNAL_FrameConversion.ImageIOToCV2(self.frames[frameIdx-1])
+        if self.isStreamed:
+            frames = self.INTERNAL_iterateFrames(self.positions[(frameIdx-1):frameIdx])
+            cv2ImgHandler = next(frames)
+            frames.close()
+        else:
+            cv2ImgHandler = np.array(self.frames[frameIdx-1])
         return Image.INTERNAL_createFromCV2(cv2ImgHandler)
 
-    def INTERNAL_CV2Applier(self, fcn, *args, **kwargs):
-        for i in range(len(self.frames)):
-            cv2ImgHandler = INTERNAL_FrameConversion.ImageIOToCV2(self.frames[i])
-            cv2ImgHandler = fcn(cv2ImgHandler, *args, **kwargs)
-            self.frames[i] = INTERNAL_FrameConversion.CV2ToImageIO(cv2ImgHandler)
-
-    def INTERNAL_PillowApplier(self, fcn, *args, **kwargs):
-        for i in range(len(self.frames)):
-            pillowImgHandler = INTERNAL_FrameConversion.ImageIOToPillow(self.frames[i])
-            pillowImgHandler = fcn(pillowImgHandler, *args, **kwargs)
-            self.frames[i] = INTERNAL_FrameConversion.PillowToImageIO(pillowImgHandler)
-
     def getDimensions(self):
         '''
         Returns a '(width, height)' tuple.
+        
+        Note, if streamed, the first frame is read and processed.
         '''
-        return INTERNAL_FrameProcessing.CV2Wrapper.getDimensions(self.frames[0])
+        if self.isStreamed:
+            return self.asImage(1).getDimensions()
+        return (self.frames.shape[2], self.frames.shape[1])
 
     def resize(self, width, height):
         '''
@@ -564,13 +1201,13 @@ class GIF:
         
         If either set to '-1', aspect ratio is preserved.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.resize, width, height)
+        self.INTERNAL_apply('resize', width, height)
 
     def grayscale(self):
         '''
         Convert into grayscale.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.grayscale)
+        self.INTERNAL_apply('grayscale')
 
     def blackWhite(self, threshold=0.5):
         '''
@@ -578,19 +1215,19 @@ class GIF:
         
         Threshold range is (0, 1). A lower threshold leads to more white regions.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.blackWhite, threshold)
+        self.INTERNAL_apply('blackWhite', threshold)
 
     def invert(self):
         '''
         Invert value(s).
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.invert)
+        self.INTERNAL_apply('invert')
 
     def sepiaTone(self):
         '''
         Applies sepia-tone (i.e., a yellow-ish, vintage effect).
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.sepiaTone)
+        self.INTERNAL_apply('sepiaTone')
 
     def brightnessContrast(self, brightness=1.0, contrast=1.0):
         '''
@@ -598,7 +1235,7 @@ class GIF:
         
         Value(s) are factor(s) (i.e., '1.0' has no effect).
         '''
-        self.INTERNAL_PillowApplier(INTERNAL_FrameProcessing.PillowWrapper.brightnessContrast, brightness, contrast)
+        self.INTERNAL_apply('brightnessContrast', brightness, contrast)
 
     def gaussianBlur(self, kernelSize):
         '''
@@ -606,7 +1243,7 @@ class GIF:
         
         Kernel-size must be odd.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.gaussianBlur, kernelSize)
+        self.INTERNAL_apply('gaussianBlur', kernelSize)
         
     def medianBlur(self, kernelSize):
         '''
@@ -614,7 +1251,7 @@ class GIF:
         
         Kernel-size must be odd.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.medianBlur, kernelSize)
+        self.INTERNAL_apply('medianBlur', kernelSize)
 
     def bilateralFilter(self, kernelSize):
         '''
@@ -622,7 +1259,7 @@ class GIF:
         
         Kernel-size must be odd.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.bilateralFilter, kernelSize)
+        self.INTERNAL_apply('bilateralFilter', kernelSize)
 
     def sharpen(self, factor):
         '''
@@ -630,19 +1267,19 @@ class GIF:
         
         Value(s) are factor(s) (i.e., '1.0' has no effect).
         '''
-        self.INTERNAL_PillowApplier(INTERNAL_FrameProcessing.PillowWrapper.sharpen, factor)
+        self.INTERNAL_apply('sharpen', factor)
     
     def findEdges(self):
         '''
         Finds and leaves only edges.
         '''
-        self.INTERNAL_PillowApplier(INTERNAL_FrameProcessing.PillowWrapper.findEdges)
+        self.INTERNAL_apply('findEdges')
 
     def emboss(self):
         '''
         Emboss.
         '''
-        self.INTERNAL_PillowApplier(INTERNAL_FrameProcessing.PillowWrapper.emboss)
+        self.INTERNAL_apply('emboss')
 
     def pixelate(self, factor):
         '''
@@ -650,13 +1287,13 @@ class GIF:
         
         Value(s) are factor(s) (i.e., '1.0' has no effect).
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.pixelate, factor)
+        self.INTERNAL_apply('pixelate', factor)
 
     def addBorder(self, border:AbstractGraphics.Border):
         '''
         Adds a border.
         '''
-        self.INTERNAL_PillowApplier(INTERNAL_FrameProcessing.PillowWrapper.addBorder, border)
+        self.INTERNAL_apply('addBorder', border)
     
     def crop(self, topLeft:AbstractGraphics.Point, bottomRight:AbstractGraphics.Point):
         '''
@@ -664,13 +1301,18 @@ class GIF:
         
         Note that (1, 1) specifies the pixel at the top-left corner.
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.crop, topLeft, bottomRight)
+        if self.isStreamed:
+            self.INTERNAL_FrameApplier(lambda frameIdx, frame: INTERNAL_FrameProcessing.CV2Wrapper.crop(frame, topLeft, bottomRight))
+            return
+        
+        # Crop(s) are view(s), of all frame(s) at once.
+        self.INTERNAL_setFrames(self.frames[:, (topLeft.y - 1):bottomRight.y, (topLeft.x - 1):bottomRight.x])
 
     def overlayDrawable(self, shape):
         '''
         Add a drawable (e.g., Rectangle).
         '''
-        self.INTERNAL_CV2Applier(INTERNAL_FrameProcessing.CV2Wrapper.overlayShape, shape)
+        self.INTERNAL_apply('overlayDrawable', shape)
         
     def overlayDrawablePerFrame(self, callout):
         '''
@@ -678,11 +1320,7 @@ class GIF:
         
         Callout receives the current frame index (1 to FRAME-COUNT), and returns a shape.
         '''
-        # Cannot use CV2Applier, must do it manually.
-        for i in range(len(self.frames)):
-            cv2ImgHandler = INTERNAL_FrameConversion.ImageIOToCV2(self.frames[i])
-            cv2ImgHandler = INTERNAL_FrameProcessing.CV2Wrapper.overlayDrawable(cv2ImgHandler, callout(i+1))
-            self.frames[i] = INTERNAL_FrameConversion.CV2ToImageIO(cv2ImgHandler)
+        self.INTERNAL_FrameApplier(lambda frameIdx, frame: INTERNAL_FrameProcessing.CV2Wrapper.overlayDrawable(frame, callout(frameIdx+1)))
 
     def saveAs(self, f:FileUtils.File, fps=None):
         '''
@@ -692,9 +1330,160 @@ class GIF:
             raise ExceptionUtils.ValidationError('Destination file must not exist.')
         
         if fps == None:
-            fps = self.fps
+            fps = self.getFPS()
         
-        writer = imageio.get_writer(str(f), fps=fps)
-        for frame in self.frames:
+        writer = INTERNAL_GIFStreamWriter(f, fps) if self.isStreamed else imageio.get_writer(str(f), fps=fps)
+        for frame in self.INTERNAL_iterateFrames():
+            # ? Convert into 'RGB' (i.e., unless grayscale).
+            if len(frame.shape) > 2:
+                frame = INTERNAL_FrameConversion.CV2ToImageIO(frame)
             writer.append_data(frame)
         writer.close()
+
+class BatchProcessor:
+    '''
+    Processes every image of a source tree (i.e., applies a recipe to it), into a destination tree of the same structure.
+    
+    Note that,
+    - Recipe is a list of '(operation-name, args)' tuple(s), where operation-name is that of an `Image` method (e.g., `[('resize', (800, -1)), ('sharpen', (2.0,))]`). Image(s) are processed lazily (see `Image`).
+    - Image(s) are processed across a pool of process(es). Work is distributed in chunk(s) of path(s) (i.e., image data is never passed between process(es), as each worker reads and writes its own file(s)).
+    - An output is up-to-date (i.e., skipped) if it is newer than its source.
+    - If `extension` is specified, output(s) are converted into it (e.g., 'jpg').
+    - Output(s) are written under a temporary name, then renamed (i.e., an interrupted run never leaves an up-to-date looking output).
+    - A failure is captured (i.e., it does not abort the remaining image(s)).
+    - As process(es) may be spawned (e.g., on Windows), `run` must be called from within a `if __name__ == '__main__':` block.
+    '''
+    
+    class Status:
+        Processed = 'processed'
+        Skipped = 'skipped'
+        Failed = 'failed'
+    
+    def __init__(self, f_srcDir:FileUtils.File, f_dstDir:FileUtils.File, recipe:list, extension:str=None, workerCount:int=None, chunkSize:int=None):
+        if (not f_srcDir.isDirectory()):
+            raise ExceptionUtils.ValidationError('Source directory does not exist.')
+        for name, _ in recipe:
+            if name not in Image.INTERNAL_OperationFcns:
+                raise ExceptionUtils.ValidationError(f"Unknown operation '{name}'.")
+        self.f_srcDir = f_srcDir
+        self.f_dstDir = f_dstDir
+        self.recipe = [(name, tuple(args)) for name, args in recipe]
+        self.extension = extension
+        self.workerCount = os.cpu_count() if (workerCount is None) else workerCount
+        self.chunkSize = chunkSize
+    
+    @staticmethod
+    def INTERNAL_initializeWorker():
+        # Parallelism is across process(es) (i.e., not within 'CV2').
+        cv2.setNumThreads(1)
+    
+    @staticmethod
+    def INTERNAL_process(f_src:FileUtils.File, f_dst:FileUtils.File, recipe:list) -> dict:
+        '''
+        Processes a single image (unless it is up-to-date), and returns its result.
+        '''
+        result = {
+            'source' : f_src,
+            'destination' : f_dst,
+            'status' : None,
+            'duration' : TimeUtils.Time(0),
+            'read-bytes' : 0,
+            'written-bytes' : 0,
+            'error' : None,
+        }
+        startTime = time.perf_counter()
+        
+        try:
+            if f_dst.isExists() and (f_src.getModificationTime() <= f_dst.getModificationTime()):
+                result['status'] = BatchProcessor.Status.Skipped
+            else:
+                # ? Process (i.e., into a temporary name, then rename).
+                f_dst.makeAncestorDirectories()
+                f_partialDst = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_dst), suffix='.partial'))
+                FileUtils.File.Utils.delete(f_partialDst)
+                
+                image = Image(f_src, isLazy=True)
+                if image.imgHandler is None:
+                    raise ExceptionUtils.ValidationError('Image could not be read.')
+                for name, args in recipe:
+                    getattr(image, name)(*args)
+                image.saveAs(f_partialDst)
+                if not f_partialDst.isExists():
+                    raise ExceptionUtils.BackendError('Image could not be written.')
+                os.replace(str(f_partialDst), str(f_dst))
+                
+                result['read-bytes'] = f_src.getSize()
+                result['written-bytes'] = f_dst.getSize()
+                result['status'] = BatchProcessor.Status.Processed
+        except Exception as e:
+            result['status'] = BatchProcessor.Status.Failed
+            result['error'] = e
+        
+        result['duration'] = TimeUtils.Time.createFromSeconds(time.perf_counter() - startTime)
+        return result
+    
+    @staticmethod
+    def INTERNAL_processChunk(f_srcDir:FileUtils.File, f_dstDir:FileUtils.File, recipe:list, extension:str, relPaths:list) -> list:
+        '''
+        Processes a chunk of image(s) (i.e., within a worker), and returns their result(s).
+        '''
+        results = []
+        for relPath in relPaths:
+            f_src = f_srcDir.traverseDirectory(relPath)
+            f_dst = f_dstDir.traverseDirectory(relPath)
+            if extension is not None:
+                f_dst = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_dst), extension=extension))
+            results.append(BatchProcessor.INTERNAL_process(f_src, f_dst, recipe))
+        return results
+    
+    def INTERNAL_computeChunkSize(self, count:int) -> int:
+        '''
+        Computes chunk size, such that each worker receives a few chunk(s) (i.e., to balance load, while amortizing dispatch overhead).
+        '''
+        if self.chunkSize is not None:
+            return self.chunkSize
+        return max(1, min(64, math.ceil(count / (self.workerCount * 4))))
+    
+    def run(self, progressCallout=None) -> dict:
+        '''
+        Processes all image(s), and returns a summary, as a dictionary, with,
+        
+        - Result of every image, as `files`, each a `dict` with `source`, `destination`, `status` (see `BatchProcessor.Status`), `duration`, `read-bytes`, `written-bytes`, and `error` (i.e., `None` unless failed)
+        - Count of image(s) per status, as `processed`, `skipped`, and `failed`
+        - Wall-time, as `wall-time`
+        - Throughput of processed image(s), as `images-per-second`, and `megabytes-per-second` (i.e., of read byte(s))
+        
+        Note, if specified, progress callout is called with the result of every image, as soon as its chunk is complete (from the calling thread).
+        '''
+        startTime = time.perf_counter()
+        self.f_dstDir.makeAncestorDirectories()
+        self.f_dstDir.makeDirectory()
+        
+        relPaths = sorted(self.f_srcDir.listDirectoryRelatively(isRecursive=True, conditional=lambda f: f.isFile() and Image.Utils.isImage(f)))
+        chunkSize = self.INTERNAL_computeChunkSize(len(relPaths))
+        
+        results = []
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workerCount, initializer=BatchProcessor.INTERNAL_initializeWorker)
+        try:
+            futures = [executor.submit(BatchProcessor.INTERNAL_processChunk, self.f_srcDir, self.f_dstDir, self.recipe, self.extension, relPaths[startIdx:(startIdx + chunkSize)]) for startIdx in range(0, len(relPaths), chunkSize)]
+            for future in concurrent.futures.as_completed(futures):
+                for result in future.result():
+                    results.append(result)
+                    if progressCallout is not None:
+                        progressCallout(result)
+        finally:
+            # If interrupted, pending (i.e., not started) chunk(s) are cancelled.
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        wallTime = time.perf_counter() - startTime
+        processedResults = [result for result in results if (result['status'] == BatchProcessor.Status.Processed)]
+        results.sort(key=lambda result: str(result['source']))
+        return {
+            'files' : results,
+            BatchProcessor.Status.Processed : len(processedResults),
+            BatchProcessor.Status.Skipped : sum(1 for result in results if (result['status'] == BatchProcessor.Status.Skipped)),
+            BatchProcessor.Status.Failed : sum(1 for result in results if (result['status'] == BatchProcessor.Status.Failed)),
+            'wall-time' : TimeUtils.Time.createFromSeconds(wallTime),
+            'images-per-second' : len(processedResults) / wallTime,
+            'megabytes-per-second' : sum(result['read-bytes'] for result in processedResults) / (1024 * 1024) / wallTime,
+        }
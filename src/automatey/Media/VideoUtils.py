@@ -1,5 +1,18 @@
+# Standard libraries
+import os
+import json
+import copy
+import shutil
+import hashlib
+import sqlite3
+import time
+import queue
+import itertools
+import threading
+import concurrent.futures
+
 # External libraries
-# ...
+import numpy as np
 
 # Internal libraries
 import automatey.OS.FileUtils as FileUtils
@@ -11,6 +24,8 @@ import automatey.Abstract.Graphics as AbstractGraphics
 import automatey.Utils.ColorUtils as ColorUtils
 import automatey.Utils.Validation as Validation
 import automatey.Resources as Resources
+import automatey.Utils.MathUtils as MathUtils
+import automatey.Media.ImageUtils as ImageUtils
 
 class INTERNAL_Utils:    
 
@@ -35,11 +50,21 @@ class INTERNAL_Utils:
     class AudioTransition(AudioModifier):
         pass
 
+    class AudioFilter(AudioModifier):
+        pass
+
 class Actions:
 
     class Trim(INTERNAL_Utils.Action):
         '''
         Trim sequence.
+        
+        Note,
+        - If `isSmartCut` is set, only the head (i.e., up to the first key-frame) and the tail (i.e., from the last key-frame) are re-encoded, while the rest is stream-copied.
+        - Smart-cut applies only if no modifier(s) are specified, and the source is encoded as the re-encoded piece(s) are (i.e., H.264, by default, with AAC audio, if any). Otherwise, the trim is re-encoded in full.
+        - If an encoding profile is specified, it overrides the one passed to `Video.saveAs`. A CRF value, if specified, overrides that of the encoding profile.
+        - Smart-cut applies only to 'H264' and 'H265' (i.e., piece(s) are MPEG-TS file(s)).
+        - Re-encoded piece(s) of a smart-cut match the profile, pixel format, and dimension(s) of the source's video, and the sample rate, and channel count, of its audio (i.e., otherwise, if the profile may not be encoded, the trim is re-encoded in full).
         '''
         
         def __init__(self, startTime:TimeUtils.Time, 
@@ -47,21 +72,31 @@ class Actions:
                      isMute=False,
                      isNearestKeyframe:bool=False,
                      CRF:int=None,
-                     modifiers=None):
+                     modifiers=None,
+                     isSmartCut:bool=False,
+                     encodingProfile:'EncodingProfile'=None):
             self.startTime = startTime
             self.endTime = endTime
             self.isMute = isMute
             self.isNearestKeyframe = isNearestKeyframe
+            self.isSmartCut = isSmartCut
             self.CRF = CRF
+            self.encodingProfile = encodingProfile
             self.modifiers = [] if (modifiers is None) else modifiers
 
     class Join(INTERNAL_Utils.Action):
         '''
         Join sequence(s).
+        
+        Note,
+        - If `isSinglePass` is set, and no 'Trim' action is at nearest key-frame (or, is a smart-cut), all sequence(s) are trimmed, modified and joined in a single pass (i.e., a single process, with no intermediate file(s)).
+        - In a single pass, each sequence is an input of its own (i.e., seeked to, and decoded from, its start), and all 'Trim' action(s) must share the CRF value (and encoding profile), and dimension-changing modifier(s) (i.e., 'Resize', 'Crop', 'AddBorder', and 'Rotate' by 90 degree(s)).
+        - All re-encoded 'Trim' action(s) must share a codec (i.e., they are joined by stream-copying).
         '''
         
-        def __init__(self, *trimActions):
+        def __init__(self, *trimActions, isSinglePass:bool=False):
             self.trimActions = trimActions
+            self.isSinglePass = isSinglePass
             
     class GIF(INTERNAL_Utils.Action):
         '''
@@ -69,13 +104,74 @@ class Actions:
         
         Note,
         - Capture FPS specifies the FPS at which frame(s) are sampled.
+        - If `isOptimized` is set, a palette (of up to `maxColors` color(s)) is generated for the GIF, and used, in a single pass. Palette statistics are either over all frame(s) (`full`), or only the changed pixel(s) of each frame (`diff`, i.e., favoring moving object(s)), or per frame (`single`, i.e., a new palette per frame, which is slower, and larger).
+        - If optimized, and `isDeduplicate` is set, (near-)duplicate frame(s) are dropped, where kept frame(s) are displayed for longer.
+        - If optimized, and a target size (in bytes) is specified, the GIF is re-rendered, lossily (i.e., no dithering, then fewer color(s)), until it fits, or quality may not be reduced any further.
+        - Palette option(s) (i.e., `isDeduplicate`, `statsMode`, `maxColors`, and `targetBytes`) may only be specified if optimized (by default, deduplicating, with `diff` statistics, and 256 color(s)).
         '''
         
-        def __init__(self, captureFPS, playbackFactor=1.0, width=-1, height=-1):
+        class StatsModes:
+            Full = 'full'
+            Diff = 'diff'
+            Single = 'single'
+        
+        def __init__(self, captureFPS, playbackFactor=1.0, width=-1, height=-1, isOptimized:bool=False, isDeduplicate:bool=None, statsMode:str=None, maxColors:int=None, targetBytes:int=None):
+            # Palette option(s) apply only to an optimized GIF.
+            if (not isOptimized) and any((option is not None) for option in (isDeduplicate, statsMode, maxColors, targetBytes)):
+                raise ExceptionUtils.ValidationError("Option(s) 'isDeduplicate', 'statsMode', 'maxColors' and 'targetBytes' apply only if 'isOptimized' is set.")
+            isDeduplicate = True if (isDeduplicate is None) else isDeduplicate
+            statsMode = Actions.GIF.StatsModes.Diff if (statsMode is None) else statsMode
+            maxColors = 256 if (maxColors is None) else maxColors
+            if statsMode not in (Actions.GIF.StatsModes.Full, Actions.GIF.StatsModes.Diff, Actions.GIF.StatsModes.Single):
+                raise ExceptionUtils.ValidationError(f"Unsupported palette statistics mode '{statsMode}'.")
+            if not (2 <= maxColors <= 256):
+                raise ExceptionUtils.ValidationError('Color count must be within [2, 256].')
             self.captureFPS = captureFPS
             self.playbackFactor = playbackFactor
             self.width=width
             self.height=height
+            self.isOptimized = isOptimized
+            self.isDeduplicate = isDeduplicate
+            self.statsMode = statsMode
+            self.maxColors = maxColors
+            self.targetBytes = targetBytes
+
+    class Ladder(INTERNAL_Utils.Action):
+        '''
+        Output is an adaptive bitrate ladder (i.e., a directory of HLS, or DASH, segment(s) and playlist(s)), of one or more rendition(s).
+        
+        Note,
+        - The input is decoded once, and split (via a filter-graph) into all rendition(s), which are encoded concurrently, in a single pass.
+        - Key-frame(s) are forced at every segment boundary (i.e., aligned across rendition(s)).
+        - Encoding profile applies (e.g., codec, preset), except for its CRF value (i.e., rendition(s) are bitrate-constrained).
+        - For HLS, the master playlist is 'master.m3u8', and each rendition is within a 'stream_<index>' sub-directory. For DASH, the manifest is 'manifest.mpd'.
+        - If `isAudio` is set, and the input has audio, it is encoded at the audio bitrate of each rendition (i.e., an input with no audio yields video-only rendition(s)).
+        - HLS segment(s) are MPEG-TS for 'H264' and 'H265', and fragmented MP4 otherwise (i.e., MPEG-TS may not carry 'VP9', nor 'AV1').
+        '''
+        
+        class Formats:
+            HLS = 'hls'
+            DASH = 'dash'
+        
+        class Rendition:
+            '''
+            A rendition, of a specified height (i.e., aspect ratio is preserved), and bitrate(s) (in bits per second).
+            '''
+            
+            def __init__(self, height:int, videoBitrate:int, audioBitrate:int=128000):
+                self.height = height
+                self.videoBitrate = videoBitrate
+                self.audioBitrate = audioBitrate
+        
+        def __init__(self, *renditions, format:str='hls', segmentDuration:float=4.0, isAudio:bool=True):
+            if len(renditions) == 0:
+                raise ExceptionUtils.ValidationError('At least one rendition must be specified.')
+            if format not in (Actions.Ladder.Formats.HLS, Actions.Ladder.Formats.DASH):
+                raise ExceptionUtils.ValidationError(f"Unsupported ladder format '{format}'.")
+            self.renditions = renditions
+            self.format = format
+            self.segmentDuration = segmentDuration
+            self.isAudio = isAudio
 
 class Modifiers:
     
@@ -206,6 +302,23 @@ class Modifiers:
 
 class AudioModifiers:
     
+    class Filters:
+        
+        class Normalize(INTERNAL_Utils.AudioFilter):
+            '''
+            Normalize loudness (as per EBU R128), in two pass(es).
+            
+            Note,
+            - Loudness of the sequence is measured first (i.e., while planning, after any preceding audio modifier(s)), so that normalization is linear (i.e., a constant gain, where possible).
+            - Measurement(s) are cached (i.e., per source, and sequence), hence, re-planning does not re-measure.
+            - Applies only to sequence(s) of the source (i.e., not to the output of a preceding action, which is not rendered yet, while planning).
+            - Target loudness is in LUFS, true-peak in dBTP, and loudness range in LU.
+            '''
+            def __init__(self, targetLoudness:float=-23.0, truePeak:float=-2.0, loudnessRange:float=7.0):
+                self.targetLoudness = targetLoudness
+                self.truePeak = truePeak
+                self.loudnessRange = loudnessRange
+    
     class Transitions:
         
         class FadeIn(INTERNAL_Utils.AudioTransition):
@@ -241,10 +354,213 @@ class ThumbnailTimestampAttributes:
         self.sizeRatio = sizeRatio
         self.cornerAlignment = cornerAlignment
 
+class EncodingProfile:
+    
+    '''
+    Encoding profile (i.e., codec, and speed/quality trade-off), of re-encoded video.
+    
+    Note that,
+    - Preset is one of x264's preset name(s) (e.g., 'ultrafast', 'medium', 'veryslow'), and is mapped onto the closest equivalent of each codec.
+    - Tune (e.g., 'film', 'animation') applies only to 'H264' and 'H265'.
+    - Codec parameter(s) are a `dict` (e.g., `{'keyint' : 50}`), passed as the codec's private parameter(s) (e.g., '-x264-params'), and do not apply to 'VP9'.
+    - Any unspecified attribute is left to the encoder's default (i.e., by default, H.264 at 'medium' preset).
+    '''
+    
+    class Codecs:
+        class H264: pass
+        class H265: pass
+        class VP9: pass
+        class AV1: pass
+    
+    Presets = ('ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow')
+    
+    def __init__(self,
+                 codec=Codecs.H264,
+                 preset:str=None,
+                 CRF:int=None,
+                 tune:str=None,
+                 threadCount:int=None,
+                 codecParams:dict=None):
+        if (preset is not None) and (preset not in EncodingProfile.Presets):
+            raise ExceptionUtils.ValidationError('Preset must be one of: ' + ', '.join(EncodingProfile.Presets) + '.')
+        if (tune is not None) and (codec not in (EncodingProfile.Codecs.H264, EncodingProfile.Codecs.H265)):
+            raise ExceptionUtils.ValidationError("Tune applies only to 'H264' and 'H265'.")
+        if (codecParams is not None) and (codec == EncodingProfile.Codecs.VP9):
+            raise ExceptionUtils.ValidationError("Codec parameter(s) do not apply to 'VP9'.")
+        self.codec = codec
+        self.preset = preset
+        self.CRF = CRF
+        self.tune = tune
+        self.threadCount = threadCount
+        self.codecParams = {} if (codecParams is None) else codecParams
+
+class ProgressEvent:
+    
+    '''
+    Progress of a (running) ffmpeg command, as periodically reported by ffmpeg.
+    
+    Note that,
+    - Any field not (yet) reported by ffmpeg is `None` (e.g., `speed`, early on).
+    - Speed is relative to real-time (e.g., '2.0' is twice as fast), and bitrate is in kbit/s.
+    - `isEnd` is set for the last event of a command.
+    '''
+    
+    def __init__(self,
+                 command:str,
+                 frame:int,
+                 fps:float,
+                 outTime:TimeUtils.Time,
+                 speed:float,
+                 bitrate:float,
+                 isEnd:bool):
+        self.command = command
+        self.frame = frame
+        self.fps = fps
+        self.outTime = outTime
+        self.speed = speed
+        self.bitrate = bitrate
+        self.isEnd = isEnd
+    
+    def __str__(self):
+        return f"frame={self.frame} fps={self.fps} out-time={self.outTime} speed={self.speed} bitrate={self.bitrate}"
+    
+    def __repr__(self):
+        return str(self)
+
+class RenderMetrics:
+    
+    '''
+    Timing (and throughput) metrics, of executed ffmpeg command(s) (e.g., for profiling).
+    
+    Note that,
+    - Metrics accumulate over all execution(s) they are passed to.
+    - Wall-time is the time spent waiting for command-list(s) to complete, while command-time is the sum of the execution time(s) of all command(s) (i.e., their ratio is the effective parallelism).
+    '''
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = []
+        self.wallTime = TimeUtils.Time(0)
+    
+    def INTERNAL_recordCommand(self, command:str, duration:TimeUtils.Time, lastEvent:ProgressEvent):
+        with self.lock:
+            self.records.append({
+                'command' : command,
+                'duration' : duration,
+                'frame-count' : None if (lastEvent is None) else lastEvent.frame,
+                'speed' : None if (lastEvent is None) else lastEvent.speed,
+            })
+    
+    def INTERNAL_recordWallTime(self, duration:TimeUtils.Time):
+        with self.lock:
+            self.wallTime = self.wallTime + duration
+    
+    def getRecords(self) -> list:
+        '''
+        Returns a list of `dict`(s), one per executed command, with `command`, `duration`, `frame-count` and `speed`.
+        '''
+        with self.lock:
+            return list(self.records)
+    
+    def getSummary(self) -> dict:
+        '''
+        Returns a dictionary, with,
+        
+        - Count of executed command(s), as `command-count`
+        - Wall-time, as `wall-time`
+        - Command-time, as `command-time`
+        - Effective parallelism, as `parallelism`
+        - Count of frame(s) output, as `frame-count`
+        - Frame(s) output per second (of wall-time), as `fps`
+        '''
+        with self.lock:
+            commandTime = TimeUtils.Time(sum(int(record['duration']) for record in self.records))
+            frameCount = sum(record['frame-count'] for record in self.records if (record['frame-count'] is not None))
+            wallSeconds = self.wallTime.toSeconds()
+            return {
+                'command-count' : len(self.records),
+                'wall-time' : self.wallTime,
+                'command-time' : commandTime,
+                'parallelism' : (commandTime.toSeconds() / wallSeconds) if (wallSeconds > 0) else None,
+                'frame-count' : frameCount,
+                'fps' : (frameCount / wallSeconds) if (wallSeconds > 0) else None,
+            }
+
+class StagingBackend:
+    '''
+    Where the intermediate file(s) of a render are staged (i.e., a temporary directory, per render).
+    
+    Note that,
+    - Scratch directories (e.g., '/dev/shm') are tried in order, and a render is staged in the first one with enough free space, for its (estimated) temporary space plus the reserve. Otherwise, it falls back to the system's temporary directory.
+    - If temporary space can not be estimated, scratch directories are skipped.
+    - If `isRecycle` is set, temporary directories are recycled, otherwise (by default) they are deleted permanently.
+    '''
+    
+    def __init__(self, scratchDirs:list=None, reserveBytes:int=0, isRecycle:bool=False):
+        self.scratchDirs = [] if (scratchDirs is None) else scratchDirs
+        self.reserveBytes = reserveBytes
+        self.isRecycle = isRecycle
+    
+    def getCandidates(self) -> list:
+        '''
+        Returns the (existing) scratch directories, in order, followed by `None` (i.e., the system's temporary directory).
+        '''
+        return [f_scratchDir for f_scratchDir in self.scratchDirs if f_scratchDir.isDirectory()] + [None]
+    
+    def isFitting(self, f_scratchDir:FileUtils.File, requiredBytes:int) -> bool:
+        '''
+        Checks whether the required space (plus the reserve) fits into the free space of a scratch directory.
+        '''
+        if requiredBytes is None:
+            return False
+        return (requiredBytes + self.reserveBytes) <= shutil.disk_usage(str(f_scratchDir)).free
+    
+    def acquire(self, f_baseDir:FileUtils.File=None) -> FileUtils.File:
+        '''
+        Creates a temporary directory, under a scratch directory (by default, the system's temporary directory).
+        '''
+        return FileUtils.File.Utils.getTemporaryDirectory(f_baseDir)
+    
+    def release(self, f_tmpDir:FileUtils.File):
+        '''
+        Removes a temporary directory, and all its content.
+        '''
+        if self.isRecycle:
+            FileUtils.File.Utils.recycle(f_tmpDir)
+        else:
+            FileUtils.File.Utils.delete(f_tmpDir)
+
 class INTERNAL_VideoProcessing:
     
     class FFMPEGWrapper:
 
+        class Command:
+            '''
+            A (formatted) command, along with the command(s) it depends on, and the file it outputs (if any).
+            
+            Note,
+            - Size of output (in bytes) may be estimated (i.e., `None` if unknown).
+            - A command either re-encodes (i.e., decodes, and encodes, every frame), or stream-copies.
+            - Duration is that of the sequence processed by the command (i.e., `None` if unknown).
+            - If a maximum size (in bytes) is specified, and the output exceeds it, fallback command(s) (i.e., outputting the same file) are executed in order, until it does not.
+            '''
+            
+            def __init__(self, command, dependencies:list=None, f_dst:FileUtils.File=None, estimatedBytes:int=None, isReencode:bool=False, duration:TimeUtils.Time=None, maxBytes:int=None, fallbackCommands:list=None):
+                self.command = str(command)
+                self.dependencies = [] if (dependencies is None) else dependencies
+                self.f_dst = f_dst
+                self.estimatedBytes = estimatedBytes
+                self.isReencode = isReencode
+                self.duration = duration
+                self.maxBytes = maxBytes
+                self.fallbackCommands = [] if (fallbackCommands is None) else [str(fallbackCommand) for fallbackCommand in fallbackCommands]
+            
+            def __str__(self):
+                return self.command
+            
+            def __repr__(self):
+                return str(self)
+
         class Utils:
             
             @staticmethod
@@ -256,12 +572,112 @@ class INTERNAL_VideoProcessing:
                     p.x = p.x + generalInfo['width'] + 1
                 if p.y < 0:
                     p.y = p.y + generalInfo['height'] + 1
+            
+            @staticmethod
+            def computeDuration(generalInfo:dict, startTime:TimeUtils.Time, endTime:TimeUtils.Time) -> TimeUtils.Time:
+                '''
+                Computes the duration of a sequence (i.e., where unspecified start/end are that of the source).
+                '''
+                startTime = TimeUtils.Time(0) if (startTime is None) else startTime
+                endTime = generalInfo['duration'] if (endTime is None) else endTime
+                return (endTime - startTime) if (startTime < endTime) else TimeUtils.Time(0)
+            
+            @staticmethod
+            def estimateBytes(generalInfo:dict, startTime:TimeUtils.Time, endTime:TimeUtils.Time) -> int:
+                '''
+                Estimates the size (in bytes) of a sequence, from the (average) byte-rate of the source, or `None` if it is unknown.
+                '''
+                if 'byte-rate' not in generalInfo:
+                    return None
+                duration = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.computeDuration(generalInfo, startTime, endTime)
+                return int(generalInfo['byte-rate'] * duration.toSeconds())
+            
+            @staticmethod
+            def computeInputDuration(generalInfo:dict, dependencies:list) -> TimeUtils.Time:
+                '''
+                Computes the duration of the input of an action, which is the output of the preceding action (if any), otherwise, the source.
+                '''
+                if len(dependencies) == 0:
+                    return generalInfo['duration']
+                return INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.sumDurations(dependencies)
+            
+            @staticmethod
+            def sumDurations(commands:list) -> TimeUtils.Time:
+                '''
+                Sums the duration(s) of command(s), or `None` if any is unknown.
+                '''
+                if any((command.duration is None) for command in commands):
+                    return None
+                return TimeUtils.Time(sum(int(command.duration) for command in commands))
+            
+            @staticmethod
+            def formatOutputOptions(command:ProcessUtils.CommandTemplate.Formatter, outputOptions:list):
+                '''
+                Asserts (or, excludes) the 'output-options' section of a command.
+                '''
+                if len(outputOptions) == 0:
+                    command.excludeSection('output-options')
+                else:
+                    command.assertSection('output-options', {'value' : ' '.join(outputOptions)})
+        
+        class Stage:
+            '''
+            A (yet to be materialized) command, that consumes the output of the preceding stage (if any).
+            
+            Note,
+            - A re-mux stage only stream-copies (i.e., its effect is entirely due to its output option(s)), hence, it may share the invocation of the preceding stage.
+            '''
+            
+            def __init__(self, command:ProcessUtils.CommandTemplate.Formatter, isRemux:bool=False, outputOptions:list=None, isReencode:bool=False):
+                self.command = command
+                self.isRemux = isRemux
+                self.outputOptions = [] if (outputOptions is None) else outputOptions
+                self.isReencode = isReencode
+        
+        class StagePlanner:
+            
+            @staticmethod
+            def merge(stages:list) -> list:
+                '''
+                Merges each re-mux stage into its preceding stage (i.e., folds its output option(s) into it).
+                '''
+                mergedStages = []
+                for stage in stages:
+                    if stage.isRemux and (len(mergedStages) > 0):
+                        mergedStages[-1].outputOptions += stage.outputOptions
+                    else:
+                        mergedStages.append(stage)
+                return mergedStages
+            
+            @staticmethod
+            def materialize(stages:list, f_tmpBase:FileUtils.File, dependencies:list, estimatedBytes:int=None, duration:TimeUtils.Time=None):
+                '''
+                Materializes (a chain of) stage(s) into command(s), each outputting an intermediate file, consumed by the next.
+                
+                Returns a tuple of `(command-list, output-file)`.
+                
+                Note, input of the first stage must be asserted already.
+                '''
+                commandList = []
+                f_tmpDst = None
+                for stage in stages:
+                    if f_tmpDst is not None:
+                        stage.command.assertParameter('input-file', str(f_tmpDst))
+                    INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.formatOutputOptions(stage.command, stage.outputOptions)
+                    
+                    f_tmpDst = FileUtils.File(FileUtils.File.Utils.Path.randomizeName(str(f_tmpBase)))
+                    stage.command.assertParameter('output-file', str(f_tmpDst))
+                    commandList.append(INTERNAL_VideoProcessing.FFMPEGWrapper.Command(stage.command, dependencies, f_tmpDst, estimatedBytes, stage.isReencode, duration))
+                    dependencies = [commandList[-1]]
+                
+                return commandList, f_tmpDst
         
         CommandTemplates = {
             'VideoTrimNearestKeyframe' : ProcessUtils.CommandTemplate(
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
                 r'-noaccurate_seek',
                 r'{{{START-TIME: -ss {{{TIME}}} :}}}',
                 r'-i {{{INPUT-FILE}}}',
@@ -269,50 +685,143 @@ class INTERNAL_VideoProcessing:
                 r'-vcodec copy',
                 r'-acodec copy',
                 r'-avoid_negative_ts make_zero',
+                r'{{{OUTPUT-OPTIONS: {{{VALUE}}} :}}}',
                 r'{{{OUTPUT-FILE}}}',
             ),
             'VideoTrim' : ProcessUtils.CommandTemplate(
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
                 r'{{{START-TIME: -ss {{{TIME}}} :}}}',
                 r'-i {{{INPUT-FILE}}}',
                 r'{{{DURATION: -to {{{TIME}}} :}}}',
-                r'-crf {{{CRF}}}',
-                r'-c:v libx264',
+                r'-c:v {{{VIDEO-CODEC}}}',
+                r'{{{ENCODER-OPTIONS: {{{VALUE}}} :}}}',
                 r'-c:a aac',
                 r'{{{VIDEO-FILTER: -vf {{{VALUE}}} :}}}',
                 r'{{{AUDIO-FILTER: -af {{{VALUE}}} :}}}',
+                r'{{{OUTPUT-OPTIONS: {{{VALUE}}} :}}}',
                 r'{{{OUTPUT-FILE}}}',
             ),
-            'VideoMute' : ProcessUtils.CommandTemplate(
+            'VideoTrimJoin' : ProcessUtils.CommandTemplate(
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
+                r'{{{INPUTS}}}',
+                r'-filter_complex {{{FILTER-GRAPH}}}',
+                r'-map [v]',
+                r'{{{AUDIO: -map [a] :}}}',
+                r'-c:v {{{VIDEO-CODEC}}}',
+                r'{{{ENCODER-OPTIONS: {{{VALUE}}} :}}}',
+                r'-c:a aac',
+                r'{{{OUTPUT-FILE}}}',
+            ),
+            'VideoTrimJoinInput' : ProcessUtils.CommandTemplate(
+                r'{{{START-TIME: -ss {{{TIME}}} :}}}',
+                r'{{{DURATION: -t {{{TIME}}} :}}}',
+                r'-i {{{INPUT-FILE}}}',
+            ),
+            'VideoRemux' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'-progress pipe:1 -nostats',
                 r'-i {{{INPUT-FILE}}}',
                 r'-c copy',
-                r'-an',
+                r'{{{OUTPUT-OPTIONS: {{{VALUE}}} :}}}',
                 r'{{{OUTPUT-FILE}}}',
             ),
             'VideoConcat' : ProcessUtils.CommandTemplate(
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
                 r'-f concat',
                 r'-safe 0',
                 r'-i {{{LIST-FILE}}}',
                 r'-c copy',
+                r'{{{OUTPUT-OPTIONS: {{{VALUE}}} :}}}',
                 r'{{{OUTPUT-FILE}}}',
             ),
             'GIFGenerate' : ProcessUtils.CommandTemplate(
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
                 r'-i {{{INPUT-FILE}}}',
                 r'-vf fps={{{CAPTURE-FPS}}},scale={{{WIDTH}}}:{{{HEIGHT}}}:flags=lanczos,setpts={{{PTS-FACTOR}}}*PTS[v]',
                 r'-loop 0',
                 r'{{{OUTPUT-FILE}}}',
             ),
+            'GIFGenerateOptimized' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'-progress pipe:1 -nostats',
+                r'-i {{{INPUT-FILE}}}',
+                r'-filter_complex [0:v]fps={{{CAPTURE-FPS}}},{{{DEDUPLICATE:mpdecimate,:}}}scale={{{WIDTH}}}:{{{HEIGHT}}}:flags=lanczos,setpts={{{PTS-FACTOR}}}*PTS,split[a][b];[a]palettegen=max_colors={{{MAX-COLORS}}}:stats_mode={{{STATS-MODE}}}[p];[b][p]paletteuse=dither={{{DITHER}}}:diff_mode=rectangle{{{NEW-PALETTE::new=1:}}}',
+                r'-fps_mode vfr',
+                r'-loop 0',
+                r'{{{OUTPUT-FILE}}}',
+            ),
+            'VideoLadder' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'-progress pipe:1 -nostats',
+                r'-i {{{INPUT-FILE}}}',
+                r'-filter_complex {{{FILTER-GRAPH}}}',
+                r'{{{STREAM-OPTIONS}}}',
+                r'-c:v {{{VIDEO-CODEC}}}',
+                r'{{{ENCODER-OPTIONS: {{{VALUE}}} :}}}',
+                r'-force_key_frames expr:gte(t,n_forced*{{{SEGMENT-DURATION}}})',
+                r'{{{AUDIO: -c:a aac :}}}',
+                r'{{{FORMAT-OPTIONS}}}',
+                r'{{{OUTPUT-FILE}}}',
+            ),
+            'AudioExtract' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'-progress pipe:1 -nostats',
+                r'{{{START-TIME: -ss {{{TIME}}} :}}}',
+                r'-i {{{INPUT-FILE}}}',
+                r'{{{DURATION: -to {{{TIME}}} :}}}',
+                r'-map 0:a:0',
+                r'-vn',
+                r'{{{AUDIO-CODEC: -c:a {{{VALUE}}} :}}}',
+                r'{{{OUTPUT-FILE}}}',
+            ),
+            'LoudnessAnalyze' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-nostats',
+                r'-loglevel info',
+                r'{{{START-TIME: -ss {{{TIME}}} :}}}',
+                r'-i {{{INPUT-FILE}}}',
+                r'{{{DURATION: -to {{{TIME}}} :}}}',
+                r'-map 0:a:0',
+                r'-vn',
+                r'-af {{{AUDIO-FILTER:{{{VALUE}}},:}}}loudnorm=print_format=json',
+                r'-f null',
+                r'-',
+            ),
+            'FramesStream' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'{{{START-TIME: -ss {{{TIME}}} :}}}',
+                r'-i {{{INPUT-FILE}}}',
+                r'{{{DURATION: -to {{{TIME}}} :}}}',
+                r'{{{VIDEO-FILTER: -vf {{{VALUE}}} :}}}',
+                r'{{{FRAME-COUNT: -frames:v {{{COUNT}}} :}}}',
+                r'-an',
+                r'-f rawvideo',
+                r'-pix_fmt bgr24',
+                r'pipe:1',
+            ),
             'QueryGeneralInfo' : ProcessUtils.CommandTemplate(
                 r'ffprobe',
                 r'-v error',
@@ -321,6 +830,30 @@ class INTERNAL_VideoProcessing:
                 r'-of default=noprint_wrappers=1',
                 r'{{{INPUT-FILE}}}',
             ),
+            'QueryAudioCodec' : ProcessUtils.CommandTemplate(
+                r'ffprobe',
+                r'-v error',
+                r'-select_streams a:0',
+                r'-show_entries stream=codec_name',
+                r'-of default=noprint_wrappers=1:nokey=1',
+                r'{{{INPUT-FILE}}}',
+            ),
+            'QueryVideoStream' : ProcessUtils.CommandTemplate(
+                r'ffprobe',
+                r'-v error',
+                r'-select_streams v:0',
+                r'-show_entries stream=codec_name,profile,pix_fmt,width,height',
+                r'-of default=noprint_wrappers=1',
+                r'{{{INPUT-FILE}}}',
+            ),
+            'QueryAudioStream' : ProcessUtils.CommandTemplate(
+                r'ffprobe',
+                r'-v error',
+                r'-select_streams a:0',
+                r'-show_entries stream=codec_name,sample_rate,channels',
+                r'-of default=noprint_wrappers=1',
+                r'{{{INPUT-FILE}}}',
+            ),
             'QueryKeyframes' : ProcessUtils.CommandTemplate(
                 r'ffprobe',
                 r'-v error',
@@ -328,15 +861,18 @@ class INTERNAL_VideoProcessing:
                 r'-show_entries frame=pts_time,pict_type',
                 r'-of csv=print_section=0',
                 r'-skip_frame nokey',
+                r'{{{INTERVAL: -read_intervals {{{START}}}%{{{END}}} :}}}',
                 r'{{{INPUT-FILE}}}',
             ),
             'ThumbnailGenerate' : ProcessUtils.CommandTemplate(
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
+                r'-ss {{{TIME}}}',
+                r'-copyts',
                 r'-i {{{INPUT-FILE}}}',
                 r"{{{TIMESTAMP: -vf drawtext=text='%{pts\:hms}':{{{LOCATION}}}:fontsize={{{TEXT-SIZE}}}*h:fontcolor={{{TEXT-COLOR}}}:fontfile='{{{FONT-PATH}}}' :}}}",
-                r'-ss {{{TIME}}}',
                 r'-vframes 1',
                 r'{{{OUTPUT-FILE}}}',
             ),
@@ -344,10 +880,30 @@ class INTERNAL_VideoProcessing:
                 r'ffmpeg',
                 r'-hide_banner',
                 r'-loglevel error',
+                r'-progress pipe:1 -nostats',
                 r'-i {{{INPUT-FILE}}}',
                 r"-vf {{{TIMESTAMP:drawtext=text='%{pts\:hms}':{{{LOCATION}}}:fontsize={{{TEXT-SIZE}}}*h:fontcolor={{{TEXT-COLOR}}}:fontfile='{{{FONT-PATH}}}',:}}}fps={{{CAPTURE-FPS}}}",
                 r'{{{OUTPUT-DIRECTORY}}}/%03d.png',
             ),
+            'BenchmarkEncode' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'-f lavfi -i testsrc2=size={{{WIDTH}}}x{{{HEIGHT}}}:rate={{{FPS}}}',
+                r'-frames:v {{{FRAME-COUNT}}}',
+                r'-pix_fmt yuv420p',
+                r'-c:v {{{VIDEO-CODEC}}}',
+                r'{{{ENCODER-OPTIONS: {{{VALUE}}} :}}}',
+                r'{{{OUTPUT-FILE}}}',
+            ),
+            'BenchmarkOverhead' : ProcessUtils.CommandTemplate(
+                r'ffmpeg',
+                r'-hide_banner',
+                r'-loglevel error',
+                r'-f lavfi -i nullsrc=size=16x16',
+                r'-frames:v 1',
+                r'-f null -',
+            ),
         }
         
         ThumbnailTimestampDefaults = {
@@ -369,15 +925,35 @@ class INTERNAL_VideoProcessing:
             ),
         }
 
+        FilterGraphTemplates = {
+            'VideoSegment' : ProcessUtils.CommandTemplate(
+                r'[{{{INDEX}}}:v]setpts=PTS-STARTPTS{{{FILTER:,{{{VALUE}}}:}}}[v{{{INDEX}}}]',
+            ),
+            'AudioSegment' : ProcessUtils.CommandTemplate(
+                r'[{{{INDEX}}}:a]asetpts=PTS-STARTPTS{{{FILTER:,{{{VALUE}}}:}}}{{{MUTE:,volume=0:}}}[a{{{INDEX}}}]',
+            ),
+            'Concat' : ProcessUtils.CommandTemplate(
+                r'{{{INPUT-LABELS}}}concat=n={{{COUNT}}}:v=1:a={{{AUDIO-COUNT}}}[v]{{{AUDIO:[a]:}}}',
+            ),
+        }
+
         @staticmethod
-        def queryInfo(f_src:FileUtils.File, commandName) -> str:
+        def queryInfo(f_src:FileUtils.File, commandName, sections:dict=None) -> str:
             '''
             Executes a command, with a single `input-file`, and meant to extract info.
+            
+            Note, section(s) (if any) are specified as a `dict` of section name(s) to parameter(s), where a section is excluded if its parameter(s) are `None`.
             '''
             
             # Format command.
             command_QueryInfo = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates[commandName].createFormatter()
             command_QueryInfo.assertParameter('input-file', str(f_src))
+            sections = {} if (sections is None) else sections
+            for sectionName, params in sections.items():
+                if params is None:
+                    command_QueryInfo.excludeSection(sectionName)
+                else:
+                    command_QueryInfo.assertSection(sectionName, params)
             
             # Execute.
             proc = ProcessUtils.Process(str(command_QueryInfo))
@@ -429,13 +1005,23 @@ class INTERNAL_VideoProcessing:
             return generalInfoDict
 
         @staticmethod
-        def queryKeyframes(f_src:FileUtils.File) -> list:
+        def queryKeyframes(f_src:FileUtils.File, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None) -> list:
             '''
             Get a list of all key-frame(s).
+            
+            Note, if a time window is specified (i.e., `startTime`, and `endTime`), only that window is probed (i.e., starting at the nearest key-frame before `startTime`).
             '''
-
+            
+            # ? Probe a window, if specified.
+            interval = None
+            if (startTime is not None) or (endTime is not None):
+                interval = {
+                    'start' : '' if (startTime is None) else startTime.toString(precision=6),
+                    'end' : '' if (endTime is None) else endTime.toString(precision=6),
+                }
+            
             # Fetch, and extract info from result.
-            result = INTERNAL_VideoProcessing.FFMPEGWrapper.queryInfo(f_src, 'QueryKeyframes')
+            result = INTERNAL_VideoProcessing.FFMPEGWrapper.queryInfo(f_src, 'QueryKeyframes', {'interval' : interval})
             result = StringUtils.Normalize.asSentence(result)
             resultList = result.split(' ')
             
@@ -446,10 +1032,130 @@ class INTERNAL_VideoProcessing:
                     floatValue = Validation.asFloat(floatAsString)
                 except:
                     continue
-                keyframes.append(TimeUtils.Time.createFromSeconds(floatValue))
+                # Rounded (i.e., not truncated), since a time printed to the microsecond is not exact in floating-point (e.g., '2.002' being '2.001999...').
+                keyframes.append(TimeUtils.Time(round(floatValue * 1000000)))
             
             return keyframes
 
+        @staticmethod
+        def queryAudioCodec(f_src:FileUtils.File) -> str:
+            '''
+            Get the codec name of the (first) audio stream (e.g., 'aac'), or `None` if there is no audio.
+            '''
+            result = INTERNAL_VideoProcessing.FFMPEGWrapper.queryInfo(f_src, 'QueryAudioCodec').strip()
+            return None if (result == '') else result
+        
+        @staticmethod
+        def queryStreamInfo(f_src:FileUtils.File, commandName:str) -> dict:
+            '''
+            Returns a dictionary of the (raw) field(s) of a stream (e.g., `QueryVideoStream`), or an empty one if there is no such stream.
+            '''
+            result = INTERNAL_VideoProcessing.FFMPEGWrapper.queryInfo(f_src, commandName)
+            
+            # Value(s) may contain space(s) (e.g., 'Constrained Baseline'), hence, field(s) are split per line.
+            streamInfo = {}
+            for line in result.splitlines():
+                fieldName, _, fieldValue = line.strip().partition('=')
+                if fieldName != '':
+                    streamInfo[fieldName] = fieldValue
+            return streamInfo
+        
+        @staticmethod
+        def formatTimeWindow(command:ProcessUtils.CommandTemplate.Formatter, startTime:TimeUtils.Time, endTime:TimeUtils.Time):
+            '''
+            Asserts (or, excludes) the 'start-time', and 'duration', section(s) of a command.
+            '''
+            if startTime is None:
+                startTime = TimeUtils.Time(0)
+                command.excludeSection('start-time')
+            else:
+                command.assertSection('start-time', {'time' : startTime.toString(precision=6)})
+            
+            if endTime is None:
+                command.excludeSection('duration')
+            else:
+                command.assertSection('duration', {'time' : (endTime - startTime).toString(precision=6)})
+        
+        # Per audio codec, extension(s) of container(s) it may be stream-copied into.
+        AudioCodecToExtensions = {
+            'aac' : ['m4a', 'aac', 'mp4', 'mka'],
+            'mp3' : ['mp3', 'mka'],
+            'opus' : ['opus', 'ogg', 'webm', 'mka'],
+            'vorbis' : ['ogg', 'webm', 'mka'],
+            'flac' : ['flac', 'mka'],
+            'ac3' : ['ac3', 'mka'],
+            'pcm_s16le' : ['wav', 'mka'],
+            'pcm_s24le' : ['wav', 'mka'],
+        }
+        
+        @staticmethod
+        def extractAudio(f_src:FileUtils.File, f_dst:FileUtils.File, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None, progressCallout=None):
+            '''
+            Extract (first) audio stream, stream-copied if the codec is compatible with the destination's container, or re-encoded otherwise.
+            '''
+            command_AudioExtract = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['AudioExtract'].createFormatter()
+            command_AudioExtract.assertParameter('input-file', str(f_src))
+            command_AudioExtract.assertParameter('output-file', str(f_dst))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatTimeWindow(command_AudioExtract, startTime, endTime)
+            
+            audioCodec = INTERNAL_VideoProcessing.FFMPEGWrapper.queryAudioCodec(f_src)
+            if audioCodec is None:
+                raise ExceptionUtils.ValidationError('Video has no audio stream.')
+            
+            # If incompatible, encoder is decided (by ffmpeg) from the destination's extension.
+            if f_dst.getExtension() in INTERNAL_VideoProcessing.FFMPEGWrapper.AudioCodecToExtensions.get(audioCodec, []):
+                command_AudioExtract.assertSection('audio-codec', {'value' : 'copy'})
+            else:
+                command_AudioExtract.excludeSection('audio-codec')
+            
+            proc = INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommand(command_AudioExtract, progressCallout)
+            if proc.wait() != 0:
+                raise ExceptionUtils.BackendError(proc.STDERR())
+        
+        # Per 'loudnorm' (measured) field, its label.
+        LoudnessFieldSpecification = {
+            'input_i' : 'integrated',
+            'input_tp' : 'true-peak',
+            'input_lra' : 'range',
+            'input_thresh' : 'threshold',
+            'target_offset' : 'offset',
+        }
+        
+        @staticmethod
+        def measureLoudness(f_src:FileUtils.File, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None, audioFilters:str=None) -> dict:
+            '''
+            Measures loudness (as per EBU R128), decoding audio only, and returns a dictionary, with,
+            
+            - Integrated loudness (LUFS), as `integrated`
+            - True-peak (dBTP), as `true-peak`
+            - Loudness range (LU), as `range`
+            - Gating threshold (LUFS), as `threshold`
+            - Offset (LU), as `offset`
+            
+            Note, if specified, loudness is measured after the audio filter(s) (e.g., a fade-in) are applied.
+            '''
+            command_LoudnessAnalyze = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['LoudnessAnalyze'].createFormatter()
+            command_LoudnessAnalyze.assertParameter('input-file', str(f_src))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatTimeWindow(command_LoudnessAnalyze, startTime, endTime)
+            if (audioFilters is None) or (audioFilters == ''):
+                command_LoudnessAnalyze.excludeSection('audio-filter')
+            else:
+                command_LoudnessAnalyze.assertSection('audio-filter', {'value' : audioFilters})
+            
+            proc = ProcessUtils.Process(str(command_LoudnessAnalyze))
+            if proc.wait() != 0:
+                raise ExceptionUtils.BackendError(proc.STDERR())
+            
+            # ? Measurement is the (last) JSON object, printed (by 'loudnorm') to STDERR.
+            result = proc.STDERR()
+            startIdx = result.rfind('{')
+            endIdx = result.rfind('}')
+            if (startIdx < 0) or (endIdx < startIdx):
+                raise ExceptionUtils.BackendError('Failed to parse loudness measurement.')
+            measurement = json.loads(result[startIdx:endIdx + 1])
+            
+            return {label : float(measurement[fieldName]) for fieldName, label in INTERNAL_VideoProcessing.FFMPEGWrapper.LoudnessFieldSpecification.items()}
+
         @staticmethod
         def formatThumbnailTimestampAttributes(command:ProcessUtils.CommandTemplate.Formatter, timestampAttribs:ThumbnailTimestampAttributes):
             if timestampAttribs is not None:
@@ -466,7 +1172,7 @@ class INTERNAL_VideoProcessing:
                 command.excludeSection('timestamp')
 
         @staticmethod
-        def generateThumbnail(f_src:FileUtils.File, f_dst:FileUtils.File, time:TimeUtils.Time, timestampAttribs:ThumbnailTimestampAttributes):
+        def generateThumbnail(f_src:FileUtils.File, f_dst:FileUtils.File, time:TimeUtils.Time, timestampAttribs:ThumbnailTimestampAttributes, progressCallout=None):
             '''
             Generate thumbnail at a specific timestamp.
             '''
@@ -478,11 +1184,10 @@ class INTERNAL_VideoProcessing:
             command_GenerateThumbnail.assertParameter('time', str(time))
             INTERNAL_VideoProcessing.FFMPEGWrapper.formatThumbnailTimestampAttributes(command_GenerateThumbnail, timestampAttribs)
             
-            proc = ProcessUtils.Process(str(command_GenerateThumbnail))
-            proc.wait()
+            INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommand(command_GenerateThumbnail, progressCallout)
 
         @staticmethod
-        def generateThumbnails(f_src:FileUtils.File, f_dstDir:FileUtils.File, N:int, timestampAttribs:ThumbnailTimestampAttributes, generalInfo:dict):
+        def generateThumbnails(f_src:FileUtils.File, f_dstDir:FileUtils.File, N:int, timestampAttribs:ThumbnailTimestampAttributes, generalInfo:dict, progressCallout=None):
             '''
             Generate N thumbnails, at equidistant timestamps.
             '''
@@ -496,12 +1201,92 @@ class INTERNAL_VideoProcessing:
             command_GenerateThumbnails.assertParameter('capture-fps', f"{captureFPS:.6f}")
             INTERNAL_VideoProcessing.FFMPEGWrapper.formatThumbnailTimestampAttributes(command_GenerateThumbnails, timestampAttribs)
             
-            proc = ProcessUtils.Process(str(command_GenerateThumbnails))
-            proc.wait()
+            INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommand(command_GenerateThumbnails, progressCallout)
 
-        class VideoFilterConstructors:
-            
-            FilterTemplates = {
+        @staticmethod
+        def generateThumbnailsBySeeking(f_src:FileUtils.File, f_dstDir:FileUtils.File, times:list, timestampAttribs:ThumbnailTimestampAttributes, workerCount:int=None, progressCallout=None):
+            '''
+            Generate a thumbnail per timestamp, each by (input-side) seeking, concurrently.
+            '''
+            commandList = []
+            for idx, time in enumerate(times):
+                f_dst = f_dstDir.traverseDirectory(f"{idx + 1:03d}.png")
+                command_GenerateThumbnail = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['ThumbnailGenerate'].createFormatter()
+                command_GenerateThumbnail.assertParameter('input-file', str(f_src))
+                command_GenerateThumbnail.assertParameter('output-file', str(f_dst))
+                # Time is specified to the microsecond (i.e., a key-frame time is not to be truncated to before the key-frame).
+                command_GenerateThumbnail.assertParameter('time', time.toString(precision=6))
+                INTERNAL_VideoProcessing.FFMPEGWrapper.formatThumbnailTimestampAttributes(command_GenerateThumbnail, timestampAttribs)
+                commandList.append(INTERNAL_VideoProcessing.FFMPEGWrapper.Command(command_GenerateThumbnail, f_dst=f_dst))
+            
+            INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommands(commandList, workerCount, progressCallout=progressCallout)
+
+        @staticmethod
+        def streamFrames(f_src:FileUtils.File, generalInfo:dict, fps:float=None, size=None, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None, isReuseBuffer:bool=True, frameCount:int=None):
+            '''
+            Yields frame(s), as CV2 image-handler(s), read from a (raw-video) pipe.
+            
+            Note, if specified, at most `frameCount` frame(s) are decoded.
+            '''
+            
+            # Format command.
+            command_FramesStream = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['FramesStream'].createFormatter()
+            command_FramesStream.assertParameter('input-file', str(f_src))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatTimeWindow(command_FramesStream, startTime, endTime)
+            
+            # ? Derive filter(s), and frame dimension(s).
+            videoFilters = []
+            if fps is not None:
+                videoFilters.append(f"fps={fps:.6f}")
+            width, height = generalInfo['width'], generalInfo['height']
+            if size is not None:
+                size = list(size)
+                MathUtils.Media.keepAspectRatio(size, (width, height))
+                width, height = size
+                videoFilters.append(f"scale={width:d}:{height:d}")
+            
+            if len(videoFilters) == 0:
+                command_FramesStream.excludeSection('video-filter')
+            else:
+                command_FramesStream.assertSection('video-filter', {'value' : ','.join(videoFilters)})
+            
+            if frameCount is None:
+                command_FramesStream.excludeSection('frame-count')
+            else:
+                command_FramesStream.assertSection('frame-count', {'count' : str(frameCount)})
+            
+            # ? Read frame(s).
+            proc = ProcessUtils.Process(str(command_FramesStream), isStreamSTDOUT=True)
+            frameBuffer = np.empty((height, width, 3), dtype=np.uint8)
+            try:
+                while True:
+                    if not isReuseBuffer:
+                        frameBuffer = np.empty((height, width, 3), dtype=np.uint8)
+                    if proc.readSTDOUT(frameBuffer) < frameBuffer.nbytes:
+                        break
+                    yield frameBuffer
+            except GeneratorExit:
+                # If iteration is abandoned, process is terminated.
+                proc.terminate()
+                raise
+            
+            # ? Otherwise (i.e., end-of-stream), process is left to complete.
+            if proc.wait() != 0:
+                raise ExceptionUtils.BackendError(proc.STDERR())
+
+        @staticmethod
+        def captureFrame(f_src:FileUtils.File, generalInfo:dict, time:TimeUtils.Time, size=None):
+            '''
+            Captures a single frame (i.e., by input-side seeking), as a CV2 image-handler.
+            '''
+            imgHandlers = list(INTERNAL_VideoProcessing.FFMPEGWrapper.streamFrames(f_src, generalInfo, size=size, startTime=time, isReuseBuffer=False, frameCount=1))
+            if len(imgHandlers) == 0:
+                raise ExceptionUtils.BackendError(f"No frame exists at {time}.")
+            return imgHandlers[0]
+
+        class VideoFilterConstructors:
+            
+            FilterTemplates = {
                 # Filter(s)
                 'SepiaTone' : ProcessUtils.CommandTemplate(r'colorchannelmixer=.393:.769:.189:0:.349:.686:.168:0:.272:.534:.131'),
                 'Grayscale' : ProcessUtils.CommandTemplate(r'format=gray'),
@@ -690,7 +1475,58 @@ class INTERNAL_VideoProcessing:
                 # Transition(s)
                 'FadeIn' : ProcessUtils.CommandTemplate(r'afade=t=in:st=0:d={{{DURATION}}}'),
                 'FadeOut' : ProcessUtils.CommandTemplate(r"afade=t=out:st={{{OFFSET}}}:d={{{DURATION}}}"),
+                # Filter(s)
+                'Normalize' : ProcessUtils.CommandTemplate(r'loudnorm=I={{{I}}}:TP={{{TP}}}:LRA={{{LRA}}}:measured_I={{{MEASURED-I}}}:measured_TP={{{MEASURED-TP}}}:measured_LRA={{{MEASURED-LRA}}}:measured_thresh={{{MEASURED-THRESHOLD}}}:offset={{{OFFSET}}}:linear=true,aresample={{{SAMPLE-RATE}}}'),
             }
+            
+            # 'loudnorm' up-samples (internally), hence, output is re-sampled.
+            NormalizeSampleRate = 48000
+            
+            # Loudness measurement(s), cached for the lifetime of the process (i.e., as each plan re-derives filter(s)).
+            INTERNAL_loudnessCache = {}
+            INTERNAL_loudnessCacheMutex = threading.Lock()
+            
+            @staticmethod
+            def INTERNAL_measureLoudness(f_src:FileUtils.File, startTime:TimeUtils.Time, endTime:TimeUtils.Time, audioFilters:str) -> dict:
+                '''
+                Measures loudness (see `measureLoudness`), once per source (i.e., path, size, and modification time), time window, and preceding audio filter(s).
+                '''
+                key = (str(f_src), f_src.getSize(), int(f_src.getModificationTime()), int(startTime), int(endTime), audioFilters)
+                with INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.INTERNAL_loudnessCacheMutex:
+                    loudness = INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.INTERNAL_loudnessCache.get(key)
+                
+                # Measurement is not done while holding the mutex (i.e., so that distinct measurement(s) run concurrently).
+                if loudness is None:
+                    loudness = INTERNAL_VideoProcessing.FFMPEGWrapper.measureLoudness(f_src, startTime, endTime, audioFilters)
+                    with INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.INTERNAL_loudnessCacheMutex:
+                        INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.INTERNAL_loudnessCache[key] = loudness
+                return loudness
+
+            @staticmethod
+            def Normalize(modifier:AudioModifiers.Filters.Normalize, generalInfo, specificInfo):
+                # Input must exist to be measured (i.e., while planning).
+                if not generalInfo['is-source']:
+                    raise ExceptionUtils.ValidationError("'Normalize' applies only to sequence(s) of the source (i.e., not to the output of a preceding action).")
+                
+                # ? First pass (i.e., measurement, after any preceding filter(s)).
+                endTime = specificInfo['start-time'] + specificInfo['duration']
+                loudness = INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.INTERNAL_measureLoudness(specificInfo['input-file'], specificInfo['start-time'], endTime, specificInfo['audio-filters'])
+                
+                # Silence can not be normalized.
+                if not all(np.isfinite(value) for value in loudness.values()):
+                    return 'anull'
+                
+                formatter = INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.FilterTemplates['Normalize'].createFormatter()
+                formatter.assertParameter('i', f"{modifier.targetLoudness:.2f}")
+                formatter.assertParameter('tp', f"{modifier.truePeak:.2f}")
+                formatter.assertParameter('lra', f"{modifier.loudnessRange:.2f}")
+                formatter.assertParameter('measured-i', f"{loudness['integrated']:.2f}")
+                formatter.assertParameter('measured-tp', f"{loudness['true-peak']:.2f}")
+                formatter.assertParameter('measured-lra', f"{loudness['range']:.2f}")
+                formatter.assertParameter('measured-threshold', f"{loudness['threshold']:.2f}")
+                formatter.assertParameter('offset', f"{loudness['offset']:.2f}")
+                formatter.assertParameter('sample-rate', str(INTERNAL_VideoProcessing.FFMPEGWrapper.AudioFilterConstructors.NormalizeSampleRate))
+                return str(formatter)
 
             @staticmethod
             def FadeIn(modifier:AudioModifiers.Transitions.FadeIn, generalInfo, specificInfo):
@@ -716,6 +1552,8 @@ class INTERNAL_VideoProcessing:
             # Transition(s)
             AudioModifiers.Transitions.FadeIn : AudioFilterConstructors.FadeIn,
             AudioModifiers.Transitions.FadeOut : AudioFilterConstructors.FadeOut,
+            # Filter(s)
+            AudioModifiers.Filters.Normalize : AudioFilterConstructors.Normalize,
         }
         
         @staticmethod
@@ -723,13 +1561,124 @@ class INTERNAL_VideoProcessing:
             filters = []
             for modifier in modifiers:
                 filterConstructor = INTERNAL_VideoProcessing.FFMPEGWrapper.ModifierToAudioFilter[type(modifier)]
+                # Filter(s) preceding the modifier (e.g., for a measurement to account for them).
+                specificInfo['audio-filters'] = ','.join(filters)
                 filters.append(filterConstructor(modifier, generalInfo, specificInfo))
             return ','.join(filters)
         
+        # Per codec: (encoder, private-parameter(s) option, preset mapping).
+        CodecToEncoderInfo = {
+            EncodingProfile.Codecs.H264 : ('libx264', '-x264-params', {preset : ['-preset', preset] for preset in EncodingProfile.Presets}),
+            EncodingProfile.Codecs.H265 : ('libx265', '-x265-params', {preset : ['-preset', preset] for preset in EncodingProfile.Presets}),
+            EncodingProfile.Codecs.VP9 : ('libvpx-vp9', None, {
+                'ultrafast' : ['-deadline', 'realtime', '-cpu-used', '8'],
+                'superfast' : ['-deadline', 'realtime', '-cpu-used', '7'],
+                'veryfast' : ['-deadline', 'good', '-cpu-used', '5'],
+                'faster' : ['-deadline', 'good', '-cpu-used', '4'],
+                'fast' : ['-deadline', 'good', '-cpu-used', '3'],
+                'medium' : ['-deadline', 'good', '-cpu-used', '2'],
+                'slow' : ['-deadline', 'good', '-cpu-used', '1'],
+                'slower' : ['-deadline', 'good', '-cpu-used', '0'],
+                'veryslow' : ['-deadline', 'best', '-cpu-used', '0'],
+            }),
+            EncodingProfile.Codecs.AV1 : ('libsvtav1', '-svtav1-params', {
+                'ultrafast' : ['-preset', '12'],
+                'superfast' : ['-preset', '11'],
+                'veryfast' : ['-preset', '10'],
+                'faster' : ['-preset', '9'],
+                'fast' : ['-preset', '8'],
+                'medium' : ['-preset', '6'],
+                'slow' : ['-preset', '5'],
+                'slower' : ['-preset', '4'],
+                'veryslow' : ['-preset', '2'],
+            }),
+        }
+        
+        # Per codec, the codec name (i.e., as probed) of the video it encodes.
+        CodecToName = {
+            EncodingProfile.Codecs.H264 : 'h264',
+            EncodingProfile.Codecs.H265 : 'hevc',
+            EncodingProfile.Codecs.VP9 : 'vp9',
+            EncodingProfile.Codecs.AV1 : 'av1',
+        }
+        
+        # Codec(s) that smart-cut piece(s) (i.e., MPEG-TS file(s)) may be encoded with.
+        SmartCutCodecs = (EncodingProfile.Codecs.H264, EncodingProfile.Codecs.H265)
+        
         @staticmethod
-        def processTrimAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, trimAction:Actions.Trim, generalInfo:dict) -> list:
-            commandList = []
+        def resolveEncodingProfile(trimAction:Actions.Trim, encodingProfile:EncodingProfile) -> EncodingProfile:
+            '''
+            Returns the encoding profile that applies to a 'Trim' action (i.e., its own, if any, takes precedence over the one specified).
+            '''
+            if trimAction.encodingProfile is not None:
+                return trimAction.encodingProfile
+            if encodingProfile is None:
+                return EncodingProfile()
+            return encodingProfile
+        
+        @staticmethod
+        def formatEncoding(command:ProcessUtils.CommandTemplate.Formatter, trimAction:Actions.Trim, encodingProfile:EncodingProfile):
+            '''
+            Asserts video codec, and encoder option(s), of a command, based on the encoding profile (and CRF value) of a 'Trim' action.
+            
+            Note,
+            - The encoding profile of a 'Trim' action, if any, takes precedence over the one specified.
+            '''
+            encodingProfile = INTERNAL_VideoProcessing.FFMPEGWrapper.resolveEncodingProfile(trimAction, encodingProfile)
+            CRF = encodingProfile.CRF if (trimAction.CRF is None) else trimAction.CRF
+            
+            encoder, paramsOption, presetToOptions = INTERNAL_VideoProcessing.FFMPEGWrapper.CodecToEncoderInfo[encodingProfile.codec]
+            command.assertParameter('video-codec', encoder)
+            
+            options = []
+            if encodingProfile.preset is not None:
+                options += presetToOptions[encodingProfile.preset]
+            if encodingProfile.tune is not None:
+                options += ['-tune', encodingProfile.tune]
+            if CRF is not None:
+                options += ['-crf', str(CRF)]
+                # Constant quality (in VP9) requires the bitrate to be zero'ed.
+                if encodingProfile.codec == EncodingProfile.Codecs.VP9:
+                    options += ['-b:v', '0']
+            if encodingProfile.threadCount is not None:
+                options += ['-threads', str(encodingProfile.threadCount)]
+            if len(encodingProfile.codecParams) > 0:
+                options += [paramsOption, ':'.join(f"{key}={value}" for key, value in encodingProfile.codecParams.items())]
+            
+            if len(options) == 0:
+                command.excludeSection('encoder-options')
+            else:
+                command.assertSection('encoder-options', {'value' : ' '.join(options)})
+
+        @staticmethod
+        def deriveTrimFilters(f_src:FileUtils.File, trimAction:Actions.Trim, generalInfo:dict, startTime:TimeUtils.Time, duration:TimeUtils.Time):
+            '''
+            Returns a tuple of `(video-filters, audio-filters)`, derived from the modifier(s) of a 'Trim' action.
             
+            Note, audio filter(s) are derived only if audio is kept (i.e., the input has audio, and the trim is not mute'd), as some (e.g., 'Normalize') decode the audio.
+            '''
+            modifiers = [modifier for modifier in trimAction.modifiers if issubclass(type(modifier), INTERNAL_Utils.Modifier)]
+            audioModifiers = [modifier for modifier in trimAction.modifiers if issubclass(type(modifier), INTERNAL_Utils.AudioModifier)]
+            
+            # Used to pass specific info (i.e., info specific to this cut of the video).
+            specificInfo = {
+                'input-file' : f_src,
+                'start-time' : startTime,
+                'duration' : duration,
+            }
+            
+            videoFilters:str = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveVideoFilters(modifiers, generalInfo, specificInfo)
+            audioFilters = ''
+            if generalInfo['is-audio'] and (not trimAction.isMute):
+                audioFilters:str = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveAudioFilters(audioModifiers, generalInfo, specificInfo)
+            
+            return videoFilters, audioFilters
+
+        @staticmethod
+        def formatTrimCommand(f_src:FileUtils.File, trimAction:Actions.Trim, generalInfo:dict, encodingProfile:EncodingProfile=None, precision:int=3) -> ProcessUtils.CommandTemplate.Formatter:
+            '''
+            Formats a command that performs a 'Trim' action (i.e., with no output file asserted).
+            '''
             if (trimAction.isNearestKeyframe):
                 command_VideoTrim = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoTrimNearestKeyframe'].createFormatter()
             else:
@@ -739,34 +1688,25 @@ class INTERNAL_VideoProcessing:
             
             if not(trimAction.startTime is None):
                 startTime = trimAction.startTime
-                command_VideoTrim.assertSection('start-time', {'time' : startTime.toString(precision=3)})
+                command_VideoTrim.assertSection('start-time', {'time' : startTime.toString(precision=precision)})
             else:
                 startTime = TimeUtils.Time(0)
                 command_VideoTrim.excludeSection('start-time')
                 
             if not(trimAction.endTime is None):
                 duration = trimAction.endTime - startTime
-                command_VideoTrim.assertSection('duration', {'time' : duration.toString(precision=3)})
+                command_VideoTrim.assertSection('duration', {'time' : duration.toString(precision=precision)})
             else:
                 duration = generalInfo['duration'] - startTime
                 command_VideoTrim.excludeSection('duration')
             
-            # If trimming is not at nearest key-frame, then it is possible to specify filter(s), and CRF value.
+            # If trimming is not at nearest key-frame, then it is possible to specify filter(s), and encoding (e.g., CRF value).
             if not (trimAction.isNearestKeyframe):
-                # Deriving CRF value.
-                command_VideoTrim.assertParameter('crf', str(trimAction.CRF))
+                # Deriving encoding.
+                INTERNAL_VideoProcessing.FFMPEGWrapper.formatEncoding(command_VideoTrim, trimAction, encodingProfile)
                 
                 # Processing modifier(s).
-                modifiers = [modifier for modifier in trimAction.modifiers if issubclass(type(modifier), INTERNAL_Utils.Modifier)]
-                audioModifiers = [modifier for modifier in trimAction.modifiers if issubclass(type(modifier), INTERNAL_Utils.AudioModifier)]
-                
-                # Used to pass specific info (i.e., info specific to this cut of the video).
-                specificInfo = {
-                    'duration' : duration
-                }
-                
-                videoFilters:str = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveVideoFilters(modifiers, generalInfo, specificInfo)
-                audioFilters:str = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveAudioFilters(audioModifiers, generalInfo, specificInfo)
+                videoFilters, audioFilters = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveTrimFilters(f_src, trimAction, generalInfo, startTime, duration)
                 
                 if videoFilters == '':
                     command_VideoTrim.excludeSection('video-filter')
@@ -778,29 +1718,171 @@ class INTERNAL_VideoProcessing:
                 else:
                     command_VideoTrim.assertSection('audio-filter', {'value': audioFilters})
             
-            lastCommand = command_VideoTrim
+            return command_VideoTrim
+        
+        # Per (smart-cut) codec, the encoder's profile of each probed profile.
+        CodecToProfiles = {
+            EncodingProfile.Codecs.H264 : {
+                'Constrained Baseline' : 'baseline',
+                'Baseline' : 'baseline',
+                'Main' : 'main',
+                'High' : 'high',
+                'High 10' : 'high10',
+                'High 4:2:2' : 'high422',
+                'High 4:4:4 Predictive' : 'high444',
+            },
+            EncodingProfile.Codecs.H265 : {
+                'Main' : 'main',
+                'Main 10' : 'main10',
+                'Main Still Picture' : 'mainstillpicture',
+            },
+        }
+        
+        @staticmethod
+        def deriveSmartCutOptions(f_src:FileUtils.File, trimAction:Actions.Trim, encodingProfile:EncodingProfile) -> list:
+            '''
+            Returns the output option(s) of the re-encoded piece(s) of a smart-cut, that match the stream(s) of the source (i.e., so that stream-copied and re-encoded piece(s) may be joined), or `None` if the source is incompatible.
+            
+            Note,
+            - Video must be encoded per the encoding profile, in a profile the encoder supports, and is matched in profile, pixel format, and dimension(s).
+            - Audio (if any) must be AAC, and is matched in sample rate, and channel count.
+            '''
+            encodingProfile = INTERNAL_VideoProcessing.FFMPEGWrapper.resolveEncodingProfile(trimAction, encodingProfile)
+            
+            videoInfo = INTERNAL_VideoProcessing.FFMPEGWrapper.queryStreamInfo(f_src, 'QueryVideoStream')
+            if videoInfo.get('codec_name') != INTERNAL_VideoProcessing.FFMPEGWrapper.CodecToName[encodingProfile.codec]:
+                return None
+            profile = INTERNAL_VideoProcessing.FFMPEGWrapper.CodecToProfiles[encodingProfile.codec].get(videoInfo.get('profile'))
+            if profile is None:
+                return None
+            options = ['-profile:v', profile, '-pix_fmt', videoInfo['pix_fmt'], '-s', f"{videoInfo['width']}x{videoInfo['height']}"]
+            
+            audioInfo = INTERNAL_VideoProcessing.FFMPEGWrapper.queryStreamInfo(f_src, 'QueryAudioStream')
+            if len(audioInfo) > 0:
+                if audioInfo.get('codec_name') != 'aac':
+                    return None
+                options += ['-ar', audioInfo['sample_rate'], '-ac', audioInfo['channels']]
+            
+            return options
+        
+        @staticmethod
+        def findSmartCutKeyframes(f_src:FileUtils.File, trimAction:Actions.Trim, generalInfo:dict):
+            '''
+            Returns a tuple `(x, y)`, where,
+            - `x` is the first key-frame at, or after, the start of the trim.
+            - `y` is the last key-frame at, or before, the end of the trim.
+            
+            If there is no (non-empty) range of key-frame(s) within the trim, `None` is returned.
+            '''
+            startTime = TimeUtils.Time(0) if (trimAction.startTime is None) else trimAction.startTime
+            endTime = generalInfo['duration'] if (trimAction.endTime is None) else trimAction.endTime
+            
+            # A (full) index of the source is reused, if available. Otherwise, only the window of the trim is probed.
+            keyframeIndex = generalInfo.get('keyframe-index')
+            if keyframeIndex is None:
+                keyframeIndex = KeyframeIndex.createFromProbe(f_src, startTime, endTime)
+            keyframes = keyframeIndex.keyframesInRange(startTime, endTime)
+            if (len(keyframes) < 2):
+                return None
             
-            # Check if mute'ing is necessary.
+            return (keyframes[0], keyframes[-1])
+        
+        @staticmethod
+        def processSmartCut(f_src:FileUtils.File, f_tmpBase:FileUtils.File, trimAction:Actions.Trim, smartCutKeyframes:tuple, smartCutOptions:list, generalInfo:dict, encodingProfile:EncodingProfile, dependencies:list):
+            '''
+            Splits a 'Trim' action into (up to) three piece(s), and joins them, where,
+            - The head (i.e., start, up to the first key-frame) is re-encoded.
+            - The interior (i.e., first, up to the last key-frame) is stream-copied.
+            - The tail (i.e., last key-frame, up to the end) is re-encoded.
+            
+            Returns a tuple of `(command-list, join-command)`, where the join-command has no output file asserted.
+            
+            Note,
+            - Piece(s) are (intermediate) MPEG-TS file(s), so that the re-encoded and stream-copied piece(s) may be joined.
+            - Re-encoded piece(s) are formatted with the smart-cut option(s) (see `deriveSmartCutOptions`).
+            '''
+            firstKeyframe, lastKeyframe = smartCutKeyframes
+            f_pieceTmpBase = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_tmpBase), extension='ts'))
+            
+            # Piece(s) are expressed as 'Trim' action(s).
+            pieceTrimActions = []
+            if (trimAction.startTime is not None) and (trimAction.startTime < firstKeyframe):
+                pieceTrimActions.append(Actions.Trim(trimAction.startTime, firstKeyframe, CRF=trimAction.CRF, encodingProfile=trimAction.encodingProfile))
+            pieceTrimActions.append(Actions.Trim(firstKeyframe, lastKeyframe, isNearestKeyframe=True))
+            if (trimAction.endTime is None) or (lastKeyframe < trimAction.endTime):
+                pieceTrimActions.append(Actions.Trim(lastKeyframe, trimAction.endTime, CRF=trimAction.CRF, encodingProfile=trimAction.encodingProfile))
+            
+            # Piece(s) are independent of one another (i.e., key-frame time(s) are specified to the microsecond, at which they are exact).
+            commandList = []
+            f_pieceList = []
+            for pieceTrimAction in pieceTrimActions:
+                command_VideoTrim = INTERNAL_VideoProcessing.FFMPEGWrapper.formatTrimCommand(f_src, pieceTrimAction, generalInfo, encodingProfile, precision=6)
+                f_pieceTmpDst = FileUtils.File(FileUtils.File.Utils.Path.randomizeName(str(f_pieceTmpBase)))
+                command_VideoTrim.assertParameter('output-file', str(f_pieceTmpDst))
+                INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.formatOutputOptions(command_VideoTrim, [] if pieceTrimAction.isNearestKeyframe else smartCutOptions)
+                estimatedBytes = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.estimateBytes(generalInfo, pieceTrimAction.startTime, pieceTrimAction.endTime)
+                duration = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.computeDuration(generalInfo, pieceTrimAction.startTime, pieceTrimAction.endTime)
+                commandList.append(INTERNAL_VideoProcessing.FFMPEGWrapper.Command(command_VideoTrim, dependencies, f_pieceTmpDst, estimatedBytes, not pieceTrimAction.isNearestKeyframe, duration))
+                f_pieceList.append(f_pieceTmpDst)
+            
+            # Create listing (text) file
+            f_txtTmpDst = FileUtils.File(
+                FileUtils.File.Utils.Path.modifyName(
+                    FileUtils.File.Utils.Path.randomizeName(str(f_tmpBase)),
+                    extension='txt'
+                )
+            )
+            with f_txtTmpDst.openFile('wt') as f_txtTmpDstHandler:
+                for f in f_pieceList:
+                    f_txtTmpDstHandler.writeLine("file '" + str(f) + "'")
+            
+            command_VideoConcat = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoConcat'].createFormatter()
+            command_VideoConcat.assertParameter('list-file', str(f_txtTmpDst))
+            
+            return commandList, command_VideoConcat
+        
+        @staticmethod
+        def processTrimAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, trimAction:Actions.Trim, generalInfo:dict, encodingProfile:EncodingProfile, dependencies:list) -> list:
+            commandList = []
+            
+            # Smart-cut is possible only if trimming is not at nearest key-frame, no modifier(s) are specified, and the source is compatible (i.e., otherwise, trim is re-encoded in full).
+            smartCutKeyframes = None
+            if trimAction.isSmartCut and (INTERNAL_VideoProcessing.FFMPEGWrapper.resolveEncodingProfile(trimAction, encodingProfile).codec not in INTERNAL_VideoProcessing.FFMPEGWrapper.SmartCutCodecs):
+                raise ExceptionUtils.ValidationError("Smart-cut applies only to 'H264' and 'H265'.")
+            if trimAction.isSmartCut and (not trimAction.isNearestKeyframe) and (len(trimAction.modifiers) == 0):
+                smartCutOptions = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveSmartCutOptions(f_src, trimAction, encodingProfile)
+                if smartCutOptions is not None:
+                    smartCutKeyframes = INTERNAL_VideoProcessing.FFMPEGWrapper.findSmartCutKeyframes(f_src, trimAction, generalInfo)
+            
+            if smartCutKeyframes is None:
+                stages = [INTERNAL_VideoProcessing.FFMPEGWrapper.Stage(INTERNAL_VideoProcessing.FFMPEGWrapper.formatTrimCommand(f_src, trimAction, generalInfo, encodingProfile), isReencode=(not trimAction.isNearestKeyframe))]
+            else:
+                commandList, command_VideoConcat = INTERNAL_VideoProcessing.FFMPEGWrapper.processSmartCut(f_src, f_tmpBase, trimAction, smartCutKeyframes, smartCutOptions, generalInfo, encodingProfile, dependencies)
+                stages = [INTERNAL_VideoProcessing.FFMPEGWrapper.Stage(command_VideoConcat)]
+                dependencies = list(commandList)
+            
+            # Mute'ing is a re-mux stage (i.e., merged into the preceding stage).
             if trimAction.isMute:
-                f_tmpDst = FileUtils.File(FileUtils.File.Utils.Path.randomizeName(str(f_tmpBase)))
-                lastCommand.assertParameter('output-file', str(f_tmpDst))
-                commandList.append(str(lastCommand))
-                
-                command_VideoMute = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoMute'].createFormatter()
-                command_VideoMute.assertParameter('input-file', str(f_tmpDst))
-                lastCommand = command_VideoMute
+                stages.append(INTERNAL_VideoProcessing.FFMPEGWrapper.Stage(INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoRemux'].createFormatter(), isRemux=True, outputOptions=['-an']))
             
             # Finalization.
-            f_tmpDst = FileUtils.File(FileUtils.File.Utils.Path.randomizeName(str(f_tmpBase)))
-            lastCommand.assertParameter('output-file', str(f_tmpDst))
-            commandList.append(str(lastCommand))
+            estimatedBytes = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.estimateBytes(generalInfo, trimAction.startTime, trimAction.endTime)
+            duration = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.computeDuration(generalInfo, trimAction.startTime, trimAction.endTime)
+            stages = INTERNAL_VideoProcessing.FFMPEGWrapper.StagePlanner.merge(stages)
+            newCommandList, f_tmpDst = INTERNAL_VideoProcessing.FFMPEGWrapper.StagePlanner.materialize(stages, f_tmpBase, dependencies, estimatedBytes, duration)
             
-            return commandList, f_tmpDst
+            return commandList + newCommandList, f_tmpDst
         
         @staticmethod
-        def processJoinAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, joinAction:Actions.Join, generalInfo:dict) -> list:
+        def processJoinAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, joinAction:Actions.Join, generalInfo:dict, encodingProfile:EncodingProfile, dependencies:list) -> list:
             commandList = []
             f_joinList = []
+            joinDependencies = []
+            
+            # Re-encoded trim-action(s) are joined by stream-copying, hence, they must share a codec.
+            codecs = set(INTERNAL_VideoProcessing.FFMPEGWrapper.resolveEncodingProfile(trimAction, encodingProfile).codec for trimAction in joinAction.trimActions if not trimAction.isNearestKeyframe)
+            if len(codecs) > 1:
+                raise ExceptionUtils.ValidationError("All (re-encoded) 'Trim' action(s) of a 'Join' must share a codec.")
 
             # Check if trim-action(s) demand re-encoding. In this case, (force-)use '.mp4' extension as output.
             isNearestKeyframe = False
@@ -808,11 +1890,16 @@ class INTERNAL_VideoProcessing:
                 isNearestKeyframe = isNearestKeyframe or trimAction.isNearestKeyframe
             if not isNearestKeyframe:
                 f_tmpBase = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_tmpBase), extension='mp4'))
+                
+                # All trim-action(s) are re-encoded, hence, they may be rendered in a single pass (i.e., unless any is a smart-cut, which is rendered per trim).
+                if joinAction.isSinglePass and not any(trimAction.isSmartCut for trimAction in joinAction.trimActions):
+                    return INTERNAL_VideoProcessing.FFMPEGWrapper.processJoinActionSinglePass(f_src, f_tmpBase, joinAction, generalInfo, encodingProfile, dependencies)
 
-            # Process each associated 'Trim' action.
+            # Process each associated 'Trim' action (i.e., independent of one another).
             for trimAction in joinAction.trimActions:
-                newCommandList, f_trimTmpDst = INTERNAL_VideoProcessing.FFMPEGWrapper.processTrimAction(f_src, f_tmpBase, trimAction, generalInfo)
+                newCommandList, f_trimTmpDst = INTERNAL_VideoProcessing.FFMPEGWrapper.processTrimAction(f_src, f_tmpBase, trimAction, generalInfo, encodingProfile, dependencies)
                 commandList += newCommandList
+                joinDependencies.append(newCommandList[-1])
                 f_joinList.append(f_trimTmpDst)
             
             # Join video file(s), if necessary.
@@ -833,8 +1920,13 @@ class INTERNAL_VideoProcessing:
                 command_VideoConcat = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoConcat'].createFormatter()
                 command_VideoConcat.assertParameter('list-file', str(f_txtTmpDst))
                 command_VideoConcat.assertParameter('output-file', str(f_joinTmpDst))
+                INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.formatOutputOptions(command_VideoConcat, [])
                 
-                commandList.append(str(command_VideoConcat))
+                estimatedBytes = None
+                if all((command.estimatedBytes is not None) for command in joinDependencies):
+                    estimatedBytes = sum(command.estimatedBytes for command in joinDependencies)
+                duration = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.sumDurations(joinDependencies)
+                commandList.append(INTERNAL_VideoProcessing.FFMPEGWrapper.Command(command_VideoConcat, joinDependencies, f_joinTmpDst, estimatedBytes, duration=duration))
                 f_finalTmpDst = f_joinTmpDst
             else:
                 f_finalTmpDst = f_joinList[0]
@@ -842,7 +1934,152 @@ class INTERNAL_VideoProcessing:
             return commandList, f_finalTmpDst
             
         @staticmethod
-        def processGIFAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, GIFAction:Actions.GIF, generalInfo:dict) -> list:
+        def formatFilterGraphSegment(templateName:str, idx:int, filters:str) -> ProcessUtils.CommandTemplate.Formatter:
+            '''
+            Formats a (video/audio) segment of a filter-graph, that modifies a sequence (i.e., an input, trimmed as it is read).
+            '''
+            formatter = INTERNAL_VideoProcessing.FFMPEGWrapper.FilterGraphTemplates[templateName].createFormatter()
+            formatter.assertParameter('index', str(idx))
+                
+            if filters == '':
+                formatter.excludeSection('filter')
+            else:
+                formatter.assertSection('filter', {'value' : filters})
+            
+            return formatter
+
+        @staticmethod
+        def formatFilterGraphInput(f_src:FileUtils.File, trimAction:Actions.Trim) -> ProcessUtils.CommandTemplate.Formatter:
+            '''
+            Formats an input of a filter-graph, that is the sequence of a 'Trim' action (i.e., seeked to its start, and read up to its end).
+            '''
+            formatter = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoTrimJoinInput'].createFormatter()
+            formatter.assertParameter('input-file', str(f_src))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatTimeWindow(formatter, trimAction.startTime, trimAction.endTime)
+            return formatter
+        
+        # Modifier(s) that may change the dimension(s) of a sequence.
+        DimensionModifiers = (Modifiers.Filters.Resize, Modifiers.Filters.Crop, Modifiers.Filters.AddBorder, Modifiers.Transformations.Rotate)
+        
+        @staticmethod
+        def validateSinglePass(joinAction:Actions.Join, generalInfo:dict, encodingProfile:EncodingProfile):
+            '''
+            Validates that all 'Trim' action(s) of a 'Join' may be encoded as one (i.e., they share encoding, and dimension(s)).
+            '''
+            encodings = []
+            dimensionFilters = []
+            for trimAction in joinAction.trimActions:
+                trimEncodingProfile = INTERNAL_VideoProcessing.FFMPEGWrapper.resolveEncodingProfile(trimAction, encodingProfile)
+                CRF = trimEncodingProfile.CRF if (trimAction.CRF is None) else trimAction.CRF
+                encodings.append(dict(vars(trimEncodingProfile), CRF=CRF))
+                
+                # Dimension(s) are compared by the filter(s) that may change them (i.e., a rotation by 180 degree(s) does not).
+                modifiers = [modifier for modifier in trimAction.modifiers if isinstance(modifier, INTERNAL_VideoProcessing.FFMPEGWrapper.DimensionModifiers)]
+                modifiers = [modifier for modifier in modifiers if not (isinstance(modifier, Modifiers.Transformations.Rotate) and (int(modifier.rotation) % 180 == 0))]
+                dimensionFilters.append(INTERNAL_VideoProcessing.FFMPEGWrapper.deriveVideoFilters(modifiers, generalInfo, {}))
+            
+            if any((encoding != encodings[0]) for encoding in encodings):
+                raise ExceptionUtils.ValidationError("In a single pass, all 'Trim' action(s) of a 'Join' must share the CRF value, and encoding profile.")
+            if any((filters != dimensionFilters[0]) for filters in dimensionFilters):
+                raise ExceptionUtils.ValidationError("In a single pass, all 'Trim' action(s) of a 'Join' must share dimension-changing modifier(s) (i.e., 'Resize', 'Crop', 'AddBorder', and 'Rotate').")
+
+        @staticmethod
+        def processJoinActionSinglePass(f_src:FileUtils.File, f_tmpBase:FileUtils.File, joinAction:Actions.Join, generalInfo:dict, encodingProfile:EncodingProfile, dependencies:list) -> list:
+            '''
+            Trim, modify, and join all sequence(s) in a single command, via a filter-graph (i.e., with no intermediate file(s)).
+            
+            Note, each sequence is an input of its own, seeked to its start (i.e., sequence(s) are decoded one after another, in any order, and only within their window).
+            '''
+            INTERNAL_VideoProcessing.FFMPEGWrapper.validateSinglePass(joinAction, generalInfo, encodingProfile)
+            
+            # Audio is kept if the input has audio, and any sequence is not mute'd (i.e., mute'd sequence(s) are silenced).
+            isAudio = generalInfo['is-audio'] and not all(trimAction.isMute for trimAction in joinAction.trimActions)
+            
+            inputs = []
+            segments = []
+            inputLabels = ''
+            for idx, trimAction in enumerate(joinAction.trimActions):
+                inputs.append(str(INTERNAL_VideoProcessing.FFMPEGWrapper.formatFilterGraphInput(f_src, trimAction)))
+                
+                startTime = TimeUtils.Time(0) if (trimAction.startTime is None) else trimAction.startTime
+                endTime = generalInfo['duration'] if (trimAction.endTime is None) else trimAction.endTime
+                videoFilters, audioFilters = INTERNAL_VideoProcessing.FFMPEGWrapper.deriveTrimFilters(f_src, trimAction, generalInfo, startTime, endTime - startTime)
+                
+                videoSegmentFormatter = INTERNAL_VideoProcessing.FFMPEGWrapper.formatFilterGraphSegment('VideoSegment', idx, videoFilters)
+                segments.append(str(videoSegmentFormatter))
+                inputLabels += f"[v{idx}]"
+                
+                if isAudio:
+                    audioSegmentFormatter = INTERNAL_VideoProcessing.FFMPEGWrapper.formatFilterGraphSegment('AudioSegment', idx, audioFilters)
+                    if trimAction.isMute:
+                        audioSegmentFormatter.assertSection('mute')
+                    else:
+                        audioSegmentFormatter.excludeSection('mute')
+                    segments.append(str(audioSegmentFormatter))
+                    inputLabels += f"[a{idx}]"
+            
+            concatFormatter = INTERNAL_VideoProcessing.FFMPEGWrapper.FilterGraphTemplates['Concat'].createFormatter()
+            concatFormatter.assertParameter('input-labels', inputLabels)
+            concatFormatter.assertParameter('count', str(len(joinAction.trimActions)))
+            concatFormatter.assertParameter('audio-count', '1' if isAudio else '0')
+            
+            # Format command.
+            f_joinTmpDst = FileUtils.File(FileUtils.File.Utils.Path.randomizeName(str(f_tmpBase)))
+            command_VideoTrimJoin = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoTrimJoin'].createFormatter()
+            command_VideoTrimJoin.assertParameter('inputs', ' '.join(inputs))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatEncoding(command_VideoTrimJoin, joinAction.trimActions[0], encodingProfile)
+            command_VideoTrimJoin.assertParameter('output-file', str(f_joinTmpDst))
+            
+            if isAudio:
+                concatFormatter.assertSection('audio')
+                command_VideoTrimJoin.assertSection('audio')
+            else:
+                concatFormatter.excludeSection('audio')
+                command_VideoTrimJoin.excludeSection('audio')
+            
+            segments.append(str(concatFormatter))
+            command_VideoTrimJoin.assertParameter('filter-graph', ';'.join(segments))
+            
+            estimatedBytes = None
+            estimatedBytesList = [INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.estimateBytes(generalInfo, trimAction.startTime, trimAction.endTime) for trimAction in joinAction.trimActions]
+            if all((x is not None) for x in estimatedBytesList):
+                estimatedBytes = sum(estimatedBytesList)
+            duration = TimeUtils.Time(sum(int(INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.computeDuration(generalInfo, trimAction.startTime, trimAction.endTime)) for trimAction in joinAction.trimActions))
+            
+            return [INTERNAL_VideoProcessing.FFMPEGWrapper.Command(command_VideoTrimJoin, dependencies, f_joinTmpDst, estimatedBytes, True, duration)], f_joinTmpDst
+
+        @staticmethod
+        def formatOptimizedGIFCommand(f_src:FileUtils.File, f_dst:FileUtils.File, GIFAction:Actions.GIF, maxColors:int, dither:str) -> ProcessUtils.CommandTemplate.Formatter:
+            '''
+            Formats a (single pass) palette-based GIF command.
+            '''
+            command_GIFGenerate = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['GIFGenerateOptimized'].createFormatter()
+            command_GIFGenerate.assertParameter('input-file', str(f_src))
+            command_GIFGenerate.assertParameter('output-file', str(f_dst))
+            
+            command_GIFGenerate.assertParameter('capture-fps', f"{GIFAction.captureFPS:.3f}")
+            command_GIFGenerate.assertParameter('pts-factor', f"{1 / GIFAction.playbackFactor:.3f}")
+            command_GIFGenerate.assertParameter('width', str(GIFAction.width))
+            command_GIFGenerate.assertParameter('height', str(GIFAction.height))
+            command_GIFGenerate.assertParameter('max-colors', str(maxColors))
+            command_GIFGenerate.assertParameter('stats-mode', GIFAction.statsMode)
+            command_GIFGenerate.assertParameter('dither', dither)
+            
+            if GIFAction.isDeduplicate:
+                command_GIFGenerate.assertSection('deduplicate')
+            else:
+                command_GIFGenerate.excludeSection('deduplicate')
+            
+            # A new palette per frame, is to be used as such.
+            if GIFAction.statsMode == Actions.GIF.StatsModes.Single:
+                command_GIFGenerate.assertSection('new-palette')
+            else:
+                command_GIFGenerate.excludeSection('new-palette')
+            
+            return command_GIFGenerate
+        
+        @staticmethod
+        def processGIFAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, GIFAction:Actions.GIF, generalInfo:dict, encodingProfile:EncodingProfile, dependencies:list) -> list:
             
             f_gifTmpDst = FileUtils.File(
                 FileUtils.File.Utils.Path.modifyName(
@@ -851,73 +2088,909 @@ class INTERNAL_VideoProcessing:
                 )
             )
             
-            command_GIFGenerate = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['GIFGenerate'].createFormatter()
-            
-            command_GIFGenerate.assertParameter('input-file', str(f_src))
-            command_GIFGenerate.assertParameter('output-file', str(f_gifTmpDst))
-            
             captureFPS = GIFAction.captureFPS
             PTSFactor = 1 / GIFAction.playbackFactor
             width = GIFAction.width
             height = GIFAction.height
             
-            command_GIFGenerate.assertParameter('capture-fps', f"{captureFPS:.3f}")
-            command_GIFGenerate.assertParameter('pts-factor', f"{PTSFactor:.3f}")
-            command_GIFGenerate.assertParameter('width', str(width))
-            command_GIFGenerate.assertParameter('height', str(height))
+            # Ordered (i.e., Bayer) dithering is both faster, and compresses better, than error-diffusion dithering.
+            if GIFAction.isOptimized:
+                command_GIFGenerate = INTERNAL_VideoProcessing.FFMPEGWrapper.formatOptimizedGIFCommand(f_src, f_gifTmpDst, GIFAction, GIFAction.maxColors, 'bayer:bayer_scale=5')
+                
+                # Lossy fallback(s), for size-targeting (i.e., no dithering, then halving color count, down to 16).
+                fallbackCommands = []
+                if GIFAction.targetBytes is not None:
+                    maxColors = GIFAction.maxColors
+                    while True:
+                        fallbackCommands.append(INTERNAL_VideoProcessing.FFMPEGWrapper.formatOptimizedGIFCommand(f_src, f_gifTmpDst, GIFAction, maxColors, 'none'))
+                        if maxColors <= 16:
+                            break
+                        maxColors = max(16, maxColors // 2)
+            else:
+                command_GIFGenerate = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['GIFGenerate'].createFormatter()
+                
+                command_GIFGenerate.assertParameter('input-file', str(f_src))
+                command_GIFGenerate.assertParameter('output-file', str(f_gifTmpDst))
+                
+                command_GIFGenerate.assertParameter('capture-fps', f"{captureFPS:.3f}")
+                command_GIFGenerate.assertParameter('pts-factor', f"{PTSFactor:.3f}")
+                command_GIFGenerate.assertParameter('width', str(width))
+                command_GIFGenerate.assertParameter('height', str(height))
+                fallbackCommands = []
+            
+            duration = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.computeInputDuration(generalInfo, dependencies)
+            
+            # Size is bounded by one (palette) byte per pixel, per frame (i.e., prior to compression).
+            estimatedBytes = None
+            if duration is not None:
+                if (width == -1) and (height == -1):
+                    width, height = generalInfo['width'], generalInfo['height']
+                elif width == -1:
+                    width = height * generalInfo['width'] // generalInfo['height']
+                elif height == -1:
+                    height = width * generalInfo['height'] // generalInfo['width']
+                estimatedBytes = int(duration.toSeconds() * captureFPS) * width * height
+            
+            if GIFAction.isOptimized and (GIFAction.targetBytes is not None):
+                estimatedBytes = GIFAction.targetBytes if (estimatedBytes is None) else min(estimatedBytes, GIFAction.targetBytes)
+            
+            return [INTERNAL_VideoProcessing.FFMPEGWrapper.Command(command_GIFGenerate, dependencies, f_gifTmpDst, estimatedBytes, True, duration, GIFAction.targetBytes, fallbackCommands)], f_gifTmpDst
+        
+        @staticmethod
+        def processLadderAction(f_src:FileUtils.File, f_tmpBase:FileUtils.File, ladderAction:Actions.Ladder, generalInfo:dict, encodingProfile:EncodingProfile, dependencies:list) -> list:
+            '''
+            Encodes all rendition(s) of a ladder, in a single command (i.e., one decode, split into an encoder per rendition).
+            '''
+            f_ladderTmpDst = FileUtils.File(FileUtils.File.Utils.Path.modifyName(FileUtils.File.Utils.Path.randomizeName(str(f_tmpBase)), extension=''))
+            f_ladderTmpDst.makeDirectory()
+            renditionCount = len(ladderAction.renditions)
+            encodingProfile = EncodingProfile() if (encodingProfile is None) else copy.copy(encodingProfile)
+            
+            # Audio is encoded only if the input has audio.
+            isAudio = ladderAction.isAudio and generalInfo['is-audio']
+            
+            # ? Split, then scale, video (per rendition).
+            splitLabels = ''.join(f"[s{idx}]" for idx in range(renditionCount))
+            segments = [f"[0:v]split={renditionCount}{splitLabels}"]
+            for idx, rendition in enumerate(ladderAction.renditions):
+                segments.append(f"[s{idx}]scale=-2:{rendition.height}[v{idx}]")
+            
+            # ? Map stream(s) (per rendition), where bitrate is capped, with a buffer of 1.5x.
+            streamOptions = []
+            for idx, rendition in enumerate(ladderAction.renditions):
+                streamOptions += ['-map', f"[v{idx}]"]
+                streamOptions += [f"-b:v:{idx}", str(rendition.videoBitrate), f"-maxrate:v:{idx}", str(rendition.videoBitrate), f"-bufsize:v:{idx}", str(rendition.videoBitrate * 3 // 2)]
+            
+            # HLS pairs each rendition with its own audio stream, while DASH shares a single one.
+            if isAudio:
+                audioRenditions = ladderAction.renditions if (ladderAction.format == Actions.Ladder.Formats.HLS) else ladderAction.renditions[:1]
+                for idx, rendition in enumerate(audioRenditions):
+                    streamOptions += ['-map', '0:a:0', f"-b:a:{idx}", str(rendition.audioBitrate)]
+            
+            segmentDuration = f"{ladderAction.segmentDuration:.3f}"
+            if ladderAction.format == Actions.Ladder.Formats.HLS:
+                if isAudio:
+                    streamMap = ' '.join(f"v:{idx},a:{idx}" for idx in range(renditionCount))
+                else:
+                    streamMap = ' '.join(f"v:{idx}" for idx in range(renditionCount))
+                formatOptions = [
+                    '-f', 'hls',
+                    '-hls_time', segmentDuration,
+                    '-hls_playlist_type', 'vod',
+                ]
+                if encodingProfile.codec in (EncodingProfile.Codecs.H264, EncodingProfile.Codecs.H265):
+                    formatOptions += ['-hls_segment_filename', str(f_ladderTmpDst.traverseDirectory('stream_%v', 'segment_%05d.ts'))]
+                else:
+                    formatOptions += [
+                        '-hls_segment_type', 'fmp4',
+                        '-hls_fmp4_init_filename', 'init.mp4',
+                        '-hls_segment_filename', str(f_ladderTmpDst.traverseDirectory('stream_%v', 'segment_%05d.m4s')),
+                    ]
+                formatOptions += [
+                    '-master_pl_name', 'master.m3u8',
+                    '-var_stream_map', f'"{streamMap}"',
+                ]
+                f_output = f_ladderTmpDst.traverseDirectory('stream_%v', 'playlist.m3u8')
+            else:
+                adaptationSets = 'id=0,streams=v id=1,streams=a' if isAudio else 'id=0,streams=v'
+                formatOptions = [
+                    '-f', 'dash',
+                    '-seg_duration', segmentDuration,
+                    '-use_template', '1',
+                    '-use_timeline', '1',
+                    '-adaptation_sets', f'"{adaptationSets}"',
+                ]
+                f_output = f_ladderTmpDst.traverseDirectory('manifest.mpd')
+            
+            # Format command (i.e., CRF does not apply to bitrate-constrained rendition(s)).
+            encodingProfile.CRF = None
+            
+            command_VideoLadder = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoLadder'].createFormatter()
+            command_VideoLadder.assertParameter('input-file', str(f_src))
+            command_VideoLadder.assertParameter('filter-graph', ';'.join(segments))
+            command_VideoLadder.assertParameter('stream-options', ' '.join(streamOptions))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatEncoding(command_VideoLadder, Actions.Trim(None, None), encodingProfile)
+            command_VideoLadder.assertParameter('segment-duration', segmentDuration)
+            if isAudio:
+                command_VideoLadder.assertSection('audio')
+            else:
+                command_VideoLadder.excludeSection('audio')
+            command_VideoLadder.assertParameter('format-options', ' '.join(formatOptions))
+            command_VideoLadder.assertParameter('output-file', str(f_output))
+            
+            # Size is estimated from the bitrate(s) of all rendition(s).
+            duration = INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.computeInputDuration(generalInfo, dependencies)
+            estimatedBytes = None
+            if duration is not None:
+                totalBitrate = sum(rendition.videoBitrate + (rendition.audioBitrate if isAudio else 0) for rendition in ladderAction.renditions)
+                estimatedBytes = int(totalBitrate * duration.toSeconds() / 8)
             
-            return [str(command_GIFGenerate)], f_gifTmpDst
+            return [INTERNAL_VideoProcessing.FFMPEGWrapper.Command(command_VideoLadder, dependencies, f_ladderTmpDst, estimatedBytes, True, duration)], f_ladderTmpDst
         
         # 'Trim' action not included, since it is technically a sub-action.
         ActionToProcessor = {
             Actions.Join : processJoinAction,
             Actions.GIF : processGIFAction,
+            Actions.Ladder : processLadderAction,
         }
         
         @staticmethod
-        def processActions(f_src:FileUtils.File, f_dst:FileUtils.File, actions:list, generalInfo:dict):
-            f_tmpDir = FileUtils.File.Utils.getTemporaryDirectory()
+        def planActions(f_src:FileUtils.File, f_tmpDir:FileUtils.File, actions:list, generalInfo:dict, encodingProfile:EncodingProfile=None):
+            '''
+            Returns a tuple of `(command-list, output-file)`, where all intermediate file(s) are within the (temporary) directory.
+            
+            Note,
+            - General info may carry a (full) `KeyframeIndex` of the source, as `keyframe-index` (see `Video.INTERNAL_getPlanningInfo`).
+            - Whether the input of each action has audio, is passed as `is-audio` (i.e., the source is probed once, while the output(s) of action(s) are derived, as they are not rendered yet).
+            - Whether the input of each action is the source (i.e., exists while planning), is passed as `is-source`.
+            '''
             f_tmpBase = f_tmpDir.traverseDirectory(f_src.getName())
             commandList = []
             
+            # (Average) byte-rate of the source, used to estimate the size of output(s).
+            generalInfo = dict(generalInfo)
+            durationInSeconds = generalInfo['duration'].toSeconds()
+            if f_src.isExists() and (durationInSeconds > 0):
+                generalInfo['byte-rate'] = f_src.getSize() / durationInSeconds
+            generalInfo['is-audio'] = INTERNAL_VideoProcessing.FFMPEGWrapper.queryAudioCodec(f_src) is not None
+            generalInfo['is-source'] = True
+            
+            # Each action depends on the command that produces its input (i.e., the last command of the preceding action).
             f_finalTmpDst = f_src
+            dependencies = []
             for action in actions:
                 actionProcessor = INTERNAL_VideoProcessing.FFMPEGWrapper.ActionToProcessor[type(action)]
-                newCommandList, f_finalTmpDst = actionProcessor(f_finalTmpDst, f_tmpBase, action, generalInfo)
+                newCommandList, f_finalTmpDst = actionProcessor(f_finalTmpDst, f_tmpBase, action, generalInfo, encodingProfile, dependencies)
                 commandList += newCommandList
+                dependencies = [commandList[-1]]
+                
+                # Key-frame(s) of the source, do not apply to the output of an action.
+                generalInfo.pop('keyframe-index', None)
+                generalInfo['is-source'] = False
+                if isinstance(action, Actions.GIF) or (isinstance(action, Actions.Join) and all(trimAction.isMute for trimAction in action.trimActions)):
+                    generalInfo['is-audio'] = False
+            
+            return commandList, f_finalTmpDst
+        
+        @staticmethod
+        def planActionsStaged(f_src:FileUtils.File, actions:list, generalInfo:dict, encodingProfile:EncodingProfile, stagingBackend:StagingBackend):
+            '''
+            Plans action(s) within a temporary directory, of the first candidate of the staging backend that fits the (estimated) temporary space.
+            
+            Returns a tuple of `(command-list, output-file, temporary-directory)`.
+            
+            Note,
+            - Action(s) are planned once, within the system's temporary directory (i.e., the last candidate, which always fits), to estimate the temporary space (i.e., the source is not probed per candidate).
+            - If a scratch directory fits, action(s) are re-planned within it, once (i.e., planned path(s) are embedded in command(s), and concat list(s), hence, are not rebased).
+            '''
+            f_baseDir = None
+            while True:
+                f_tmpDir = stagingBackend.acquire(f_baseDir)
+                try:
+                    commandList, f_finalTmpDst = INTERNAL_VideoProcessing.FFMPEGWrapper.planActions(f_src, f_tmpDir, actions, generalInfo, encodingProfile)
+                except:
+                    stagingBackend.release(f_tmpDir)
+                    raise
+                
+                if f_baseDir is not None:
+                    return commandList, f_finalTmpDst, f_tmpDir
+                
+                # ? Pick the first scratch directory that fits (i.e., otherwise, keep the system's temporary directory).
+                requiredBytes = RenderPlan(commandList, f_finalTmpDst).getTemporaryBytes()
+                f_baseDir = next((f_scratchDir for f_scratchDir in stagingBackend.getCandidates() if (f_scratchDir is not None) and stagingBackend.isFitting(f_scratchDir, requiredBytes)), None)
+                if f_baseDir is None:
+                    return commandList, f_finalTmpDst, f_tmpDir
+                stagingBackend.release(f_tmpDir)
+        
+        @staticmethod
+        def processActions(f_src:FileUtils.File, f_dst:FileUtils.File, actions:list, generalInfo:dict, workerCount:int=None, encodingProfile:EncodingProfile=None, progressCallout=None, metrics:RenderMetrics=None, stagingBackend:StagingBackend=None):
+            stagingBackend = StagingBackend() if (stagingBackend is None) else stagingBackend
+            commandList, f_finalTmpDst, f_tmpDir = INTERNAL_VideoProcessing.FFMPEGWrapper.planActionsStaged(f_src, actions, generalInfo, encodingProfile, stagingBackend)
             
             try:
                 # Execute command-list.
-                INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommands(commandList)
+                INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommands(commandList, workerCount, progressCallout=progressCallout, metrics=metrics)
                 
-                # Copy into (actual) destination, and delete temporary directory.
+                # Copy into (actual) destination.
                 FileUtils.File.Utils.copy(f_finalTmpDst, f_dst)
-                FileUtils.File.Utils.recycle(f_tmpDir)
+            finally:
+                # Delete temporary directory (i.e., also before propagating error).
+                stagingBackend.release(f_tmpDir)
+            
+        class ProgressReader:
+            '''
+            Parses (line-by-line) the output of ffmpeg's '-progress' option, calling the callout with a `ProgressEvent` at the end of every block.
+            '''
+            
+            def __init__(self, command, callout):
+                self.command = command
+                self.callout = callout
+                self.progress = {}
+                self.lastEvent = None
+            
+            @staticmethod
+            def INTERNAL_parseValue(value:str, parser):
+                '''
+                Parses a value (e.g., '1.5x', '123.4kbits/s'), returning `None` if it is not available.
+                '''
+                try:
+                    return parser(value)
+                except (TypeError, ValueError):
+                    return None
+            
+            def feed(self, line:str):
+                key, separator, value = line.partition('=')
+                if separator == '':
+                    return
+                key, value = key.strip(), value.strip()
+                self.progress[key] = value
                 
-            except ExceptionUtils.BackendError as e:
-                # Delete temporary directory, before propagating error.
-                FileUtils.File.Utils.recycle(f_tmpDir)
-                raise
+                # A block ends with a 'progress' key (i.e., 'continue', or 'end').
+                if key == 'progress':
+                    progress, self.progress = self.progress, {}
+                    parseValue = INTERNAL_VideoProcessing.FFMPEGWrapper.ProgressReader.INTERNAL_parseValue
+                    outTime = parseValue(progress.get('out_time_us'), int)
+                    self.lastEvent = ProgressEvent(
+                        command=str(self.command),
+                        frame=parseValue(progress.get('frame'), int),
+                        fps=parseValue(progress.get('fps'), float),
+                        outTime=None if (outTime is None) else TimeUtils.Time(outTime),
+                        speed=parseValue(progress.get('speed'), lambda x: float(x.rstrip('x'))),
+                        bitrate=parseValue(progress.get('bitrate'), lambda x: float(x.replace('kbits/s', ''))),
+                        isEnd=(value == 'end'),
+                    )
+                    if self.callout is not None:
+                        self.callout(self.lastEvent)
+
+        @staticmethod
+        def executeCommand(command, progressCallout=None, metrics:RenderMetrics=None) -> ProcessUtils.Process:
+            '''
+            Executes a single command, and waits for it to complete.
+            
+            Note,
+            - If specified, progress callout is called with every `ProgressEvent` (i.e., if the command reports progress).
+            - If specified, execution is recorded into the metrics.
+            '''
+            def runCommand(commandString:str) -> ProcessUtils.Process:
+                progressReader = INTERNAL_VideoProcessing.FFMPEGWrapper.ProgressReader(command, progressCallout)
+                startTime = time.perf_counter()
+                proc = ProcessUtils.Process(commandString, STDOUTCallout=progressReader.feed)
+                proc.wait()
+                if metrics is not None:
+                    metrics.INTERNAL_recordCommand(commandString, TimeUtils.Time.createFromSeconds(time.perf_counter() - startTime), progressReader.lastEvent)
+                return proc
+            
+            proc = runCommand(str(command))
             
+            # ? Fall back, while output exceeds its maximum size (if any).
+            fallbackCommands = command.fallbackCommands if isinstance(command, INTERNAL_VideoProcessing.FFMPEGWrapper.Command) else []
+            for fallbackCommand in fallbackCommands:
+                if (proc.wait() != 0) or (command.f_dst.getSize() <= command.maxBytes):
+                    break
+                FileUtils.File.Utils.delete(command.f_dst)
+                proc = runCommand(fallbackCommand)
+            
+            return proc
+
         @staticmethod
-        def executeCommands(commandList):
-            for command in commandList:
-                proc = ProcessUtils.Process(str(command))
-                if (proc.wait() != 0):
-                    raise ExceptionUtils.BackendError(proc.STDERR())
+        def executeCommands(commandList:list, workerCount:int=None, completedCommands:set=None, completionCallout=None, progressCallout=None, metrics:RenderMetrics=None):
+            '''
+            Executes a list of `Command`(s), concurrently, where a command is started only once all its dependencies are complete.
+            
+            Note that,
+            - By default, worker count is the CPU count.
+            - If a command fails, no further command(s) are started, and a `BackendError` is raised once all running command(s) complete.
+            - Command(s) in `completedCommands` (if specified) are considered complete, and are not executed.
+            - If specified, completion callout is called with every command that completes (from the calling thread).
+            - If specified, progress callout is called with every `ProgressEvent` (from any thread).
+            - If specified, execution is recorded into the metrics.
+            '''
+            workerCount = os.cpu_count() if (workerCount is None) else workerCount
+            startTime = time.perf_counter()
+            
+            completedCommands = set() if (completedCommands is None) else set(completedCommands)
+            pendingCommands = [command for command in commandList if (command not in completedCommands)]
+            runningCommands = {}
+            failedProc = None
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workerCount) as executor:
+                while True:
+                    # ? Start all command(s) whose dependencies are complete (unless a command has failed).
+                    if failedProc is None:
+                        readyCommands = [command for command in pendingCommands if all((dependency in completedCommands) for dependency in command.dependencies)]
+                        for command in readyCommands:
+                            pendingCommands.remove(command)
+                            future = executor.submit(INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommand, command, progressCallout, metrics)
+                            runningCommands[future] = command
+                    
+                    if len(runningCommands) == 0:
+                        break
+                    
+                    # ? Wait for any command to complete.
+                    doneFutures, _ = concurrent.futures.wait(runningCommands, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in doneFutures:
+                        command = runningCommands.pop(future)
+                        proc = future.result()
+                        if proc.wait() != 0:
+                            failedProc = proc if (failedProc is None) else failedProc
+                        else:
+                            completedCommands.add(command)
+                            if completionCallout is not None:
+                                completionCallout(command)
+            
+            if metrics is not None:
+                metrics.INTERNAL_recordWallTime(TimeUtils.Time.createFromSeconds(time.perf_counter() - startTime))
+            
+            if failedProc is not None:
+                raise ExceptionUtils.BackendError(failedProc.STDERR())
+            
+            if len(pendingCommands) > 0:
+                raise ExceptionUtils.ImplementationError('Command-list contains command(s) with unsatisfiable dependencies.')
 
-# Deals in 'Action'(s) and General-Info
-class Video:
-    '''
-    Video-handler.
+class INTERNAL_VideoAnalysis:
     
-    Note, currently only 'mp4' format is supported.
-    '''
-
-    def __init__(self, f:FileUtils.File):
-        self.f_src = f
+    class SceneDetection:
+        
+        # Per channel, bit-shift (i.e., '8' bins, per channel).
+        HistogramShift = 5
+        HistogramBinCount = 512
+        
+        @staticmethod
+        def computeHistogram(imgHandler) -> np.ndarray:
+            '''
+            Computes a (normalized) color histogram, of a (BGR) frame, where the channel(s) are quantized into a single bin index.
+            '''
+            shift = INTERNAL_VideoAnalysis.SceneDetection.HistogramShift
+            quantized = (imgHandler >> shift).astype(np.uint16)
+            binIndices = (quantized[:, :, 0] << 6) | (quantized[:, :, 1] << 3) | quantized[:, :, 2]
+            histogram = np.bincount(binIndices.ravel(), minlength=INTERNAL_VideoAnalysis.SceneDetection.HistogramBinCount)
+            return histogram / binIndices.size
+        
+        @staticmethod
+        def detectCuts(imgHandlers, frameTimes, threshold:float, minSceneDuration:TimeUtils.Time=None) -> list:
+            '''
+            Returns a list of cut time(s), where a cut is a frame whose histogram differs from that of the preceding frame by more than the threshold.
+            
+            Note,
+            - Difference is the total-variation distance between histogram(s) (i.e., in '[0, 1]').
+            - Only the histogram of the preceding frame is kept (i.e., constant memory).
+            '''
+            cuts = []
+            previousHistogram = None
+            for imgHandler, frameTime in zip(imgHandlers, frameTimes):
+                histogram = INTERNAL_VideoAnalysis.SceneDetection.computeHistogram(imgHandler)
+                if previousHistogram is not None:
+                    difference = 0.5 * np.abs(histogram - previousHistogram).sum()
+                    isCut = difference > threshold
+                    if isCut and (minSceneDuration is not None) and (len(cuts) > 0):
+                        isCut = (frameTime - cuts[-1]) >= minSceneDuration
+                    if isCut:
+                        cuts.append(frameTime)
+                previousHistogram = histogram
+            return cuts
+
+    class Fingerprinting:
+        
+        # A frame is downscaled to '(W + 1, H)', to compute a 'W * H' bit hash.
+        HashSize = (8, 8)
+        
+        @staticmethod
+        def computeDHash(imgHandler) -> np.ndarray:
+            '''
+            Computes the difference-hash (i.e., dHash) of a (downscaled, BGR) frame, as an array of bit(s).
+            '''
+            luma = (imgHandler[:, :, 0] * 0.114) + (imgHandler[:, :, 1] * 0.587) + (imgHandler[:, :, 2] * 0.299)
+            return (luma[:, 1:] > luma[:, :-1]).ravel()
+
+class VideoFingerprint:
+    '''
+    A perceptual fingerprint of a video (i.e., the dHash(s) of frame(s) sampled at equi-distant interval(s)), stored as a bit-packed array.
+    
+    Note,
+    - Fingerprint(s) are resolution-independent (i.e., re-encoded, or re-sized, duplicate(s) have near (or, identical) fingerprint(s)).
+    - Distance is the Hamming distance (i.e., count of differing bit(s)), and is only defined between fingerprint(s) of the same sample count.
+    '''
+    
+    def __init__(self, packedBits:np.ndarray):
+        self.packedBits = packedBits
+    
+    @staticmethod
+    def INTERNAL_createFromBits(bits:np.ndarray) -> 'VideoFingerprint':
+        return VideoFingerprint(np.packbits(bits))
+    
+    @staticmethod
+    def createFromBytes(data:bytes) -> 'VideoFingerprint':
+        return VideoFingerprint(np.frombuffer(data, dtype=np.uint8))
+    
+    def toBytes(self) -> bytes:
+        return self.packedBits.tobytes()
+    
+    def distance(self, fingerprint:'VideoFingerprint') -> int:
+        return int(np.bitwise_count(np.bitwise_xor(self.packedBits, fingerprint.packedBits)).sum())
+    
+    def __len__(self):
+        '''
+        Returns the count of bit(s).
+        '''
+        return self.packedBits.size * 8
+
+class VideoFingerprintIndex:
+    '''
+    An index of `VideoFingerprint`(s), to find near-duplicate(s) (i.e., within a Hamming distance), backed by a BK-tree.
+    
+    Note,
+    - Key(s) are arbitrary (e.g., file path(s)).
+    - A look-up only visits sub-tree(s) that may contain a match (i.e., by the triangle inequality), rather than all fingerprint(s).
+    '''
+    
+    def __init__(self):
+        # A node is a list of '[key, fingerprint, children]', where children are keyed by distance.
+        self.root = None
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def add(self, key, fingerprint:VideoFingerprint):
+        '''
+        Adds a fingerprint, under a key.
+        '''
+        self.count += 1
+        node = [key, fingerprint, {}]
+        if self.root is None:
+            self.root = node
+            return
+        
+        currentNode = self.root
+        while True:
+            distance = currentNode[1].distance(fingerprint)
+            childNode = currentNode[2].get(distance)
+            if childNode is None:
+                currentNode[2][distance] = node
+                return
+            currentNode = childNode
+    
+    def findNearDuplicates(self, fingerprint:VideoFingerprint, maxDistance:int) -> list:
+        '''
+        Returns a list of `(key, distance)` tuple(s), for all fingerprint(s) within the distance (all-inclusive), ordered by distance.
+        '''
+        matches = []
+        pendingNodes = [] if (self.root is None) else [self.root]
+        while len(pendingNodes) > 0:
+            key, nodeFingerprint, children = pendingNodes.pop()
+            distance = nodeFingerprint.distance(fingerprint)
+            if distance <= maxDistance:
+                matches.append((key, distance))
+            for childDistance, childNode in children.items():
+                if abs(childDistance - distance) <= maxDistance:
+                    pendingNodes.append(childNode)
+        
+        return sorted(matches, key=lambda match: match[1])
+
+class KeyframeIndex:
+    '''
+    An (ordered) index of key-frame(s), with logarithmic-time look-up(s).
+    
+    Note,
+    - Key-frame(s) are stored as microseconds, in a NumPy 'int64' array.
+    - If the index is partial (i.e., probed within a time window), look-up(s) are only reliable within that window.
+    '''
+    
+    def __init__(self, keyframes, window:tuple=None):
+        self.keyframes = np.sort(np.fromiter((int(keyframe) for keyframe in keyframes), dtype=np.int64))
+        self.window = window
+    
+    @staticmethod
+    def createFromProbe(f:FileUtils.File, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None) -> 'KeyframeIndex':
+        '''
+        Probe a video for key-frame(s), either in full, or (partially) within a time window.
+        '''
+        window = None
+        if (startTime is not None) or (endTime is not None):
+            window = (startTime, endTime)
+        return KeyframeIndex(INTERNAL_VideoProcessing.FFMPEGWrapper.queryKeyframes(f, startTime, endTime), window)
+    
+    def isPartial(self) -> bool:
+        return self.window is not None
+    
+    def __len__(self):
+        return len(self.keyframes)
+    
+    def toList(self) -> list:
+        '''
+        Get a list of all key-frame(s).
+        '''
+        return [TimeUtils.Time(int(microseconds)) for microseconds in self.keyframes]
+    
+    def nearestBefore(self, time:TimeUtils.Time, isInclusive:bool=True) -> TimeUtils.Time:
+        '''
+        Returns the last key-frame before (or, at, if inclusive) a time, or `None` if there is none.
+        '''
+        idx = np.searchsorted(self.keyframes, int(time), side=('right' if isInclusive else 'left')) - 1
+        if idx < 0:
+            return None
+        return TimeUtils.Time(int(self.keyframes[idx]))
+    
+    def nearestAfter(self, time:TimeUtils.Time, isInclusive:bool=True) -> TimeUtils.Time:
+        '''
+        Returns the first key-frame after (or, at, if inclusive) a time, or `None` if there is none.
+        '''
+        idx = np.searchsorted(self.keyframes, int(time), side=('left' if isInclusive else 'right'))
+        if idx >= len(self.keyframes):
+            return None
+        return TimeUtils.Time(int(self.keyframes[idx]))
+    
+    def keyframesInRange(self, startTime:TimeUtils.Time, endTime:TimeUtils.Time) -> list:
+        '''
+        Get a list of all key-frame(s) within a time range (all-inclusive).
+        '''
+        startIdx = np.searchsorted(self.keyframes, int(startTime), side='left')
+        endIdx = np.searchsorted(self.keyframes, int(endTime), side='right')
+        return [TimeUtils.Time(int(microseconds)) for microseconds in self.keyframes[startIdx:endIdx]]
+
+class MetadataCache:
+    '''
+    A persistent (i.e., on-disk) cache of video metadata, namely general info, and key-frame(s).
+    
+    Note,
+    - Entries are keyed by file path, and are invalidated automatically if the file's size, or modification time, changes.
+    - Hit/Miss statistic(s) are counted since creation.
+    - It may be shared between thread(s).
+    '''
+    
+    class INTERNAL_Serializers:
+        
+        @staticmethod
+        def serializeGeneralInfo(generalInfo:dict) -> str:
+            data = dict(generalInfo)
+            data['duration'] = int(generalInfo['duration'])
+            return json.dumps(data)
+        
+        @staticmethod
+        def deserializeGeneralInfo(value:str) -> dict:
+            generalInfo = json.loads(value)
+            generalInfo['duration'] = TimeUtils.Time(generalInfo['duration'])
+            return generalInfo
+        
+        @staticmethod
+        def serializeKeyframes(keyframes:list) -> str:
+            return json.dumps([int(keyframe) for keyframe in keyframes])
+        
+        @staticmethod
+        def deserializeKeyframes(value:str) -> list:
+            return [TimeUtils.Time(microseconds) for microseconds in json.loads(value)]
+    
+    def __init__(self, f:FileUtils.File):
+        self.connection = sqlite3.connect(str(f), check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS Metadata '
+            '(path TEXT, kind TEXT, size INTEGER, mtime INTEGER, value TEXT, PRIMARY KEY (path, kind))'
+        )
+        self.connection.commit()
+        self.mutex = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def INTERNAL_fetch(self, f:FileUtils.File, kind:str, queryFcn, serializeFcn, deserializeFcn):
+        '''
+        Fetch an entry from cache, or (if missing, or invalid) query and store it.
+        '''
+        path = FileUtils.File.Utils.Path.getAbsolute(str(f))
+        size = f.getSize()
+        mtime = int(f.getModificationTime())
+        
+        # ? Look-up entry.
+        with self.mutex:
+            row = self.connection.execute(
+                'SELECT value FROM Metadata WHERE path = ? AND kind = ? AND size = ? AND mtime = ?',
+                (path, kind, size, mtime)
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                return deserializeFcn(row[0])
+            self.misses += 1
+        
+        # ? Query (outside lock), and store entry.
+        value = queryFcn(f)
+        with self.mutex:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO Metadata (path, kind, size, mtime, value) VALUES (?, ?, ?, ?, ?)',
+                (path, kind, size, mtime, serializeFcn(value))
+            )
+            self.connection.commit()
+        
+        return value
+    
+    def getGeneralInfo(self, f:FileUtils.File) -> dict:
+        '''
+        Get general info of a video (see `Video`).
+        '''
+        return self.INTERNAL_fetch(f, 'general-info',
+                                   INTERNAL_VideoProcessing.FFMPEGWrapper.queryGeneralInfo,
+                                   MetadataCache.INTERNAL_Serializers.serializeGeneralInfo,
+                                   MetadataCache.INTERNAL_Serializers.deserializeGeneralInfo)
+    
+    def getKeyframes(self, f:FileUtils.File) -> list:
+        '''
+        Get a list of all key-frame(s) of a video.
+        '''
+        return self.INTERNAL_fetch(f, 'keyframes',
+                                   INTERNAL_VideoProcessing.FFMPEGWrapper.queryKeyframes,
+                                   MetadataCache.INTERNAL_Serializers.serializeKeyframes,
+                                   MetadataCache.INTERNAL_Serializers.deserializeKeyframes)
+    
+    def getStatistics(self) -> dict:
+        '''
+        Returns a dictionary, with,
+        
+        - Number of hit(s), as `hits`
+        - Number of miss(es), as `misses`
+        - Number of entries, as `entries`
+        '''
+        with self.mutex:
+            entryCount = self.connection.execute('SELECT COUNT(*) FROM Metadata').fetchone()[0]
+            return {
+                'hits' : self.hits,
+                'misses' : self.misses,
+                'entries' : entryCount,
+            }
+    
+    def clear(self):
+        '''
+        Remove all entries.
+        '''
+        with self.mutex:
+            self.connection.execute('DELETE FROM Metadata')
+            self.connection.commit()
+    
+    def close(self):
+        '''
+        Close cache (i.e., it may no longer be used).
+        '''
+        self.connection.close()
+
+class EncodeBenchmark:
+    '''
+    A (small) local benchmark of the machine's encode speed, used to estimate the runtime of a `RenderPlan`.
+    
+    Note,
+    - Re-encoding speed is measured in pixel(s) per second, and stream-copying speed in byte(s) per second.
+    - Overhead is the (fixed) time it takes to start, and tear down, an ffmpeg invocation.
+    - Via `get`, the benchmark is run once per encoding profile (i.e., it is cached, for the lifetime of the process).
+    '''
+    
+    INTERNAL_cache = {}
+    INTERNAL_cacheMutex = threading.Lock()
+    
+    def __init__(self, overhead:TimeUtils.Time, pixelRate:float, byteRate:float):
+        self.overhead = overhead
+        self.pixelRate = pixelRate
+        self.byteRate = byteRate
+    
+    @staticmethod
+    def run(encodingProfile:EncodingProfile=None, size:tuple=(640, 360), frameCount:int=60) -> 'EncodeBenchmark':
+        '''
+        Runs the benchmark, by encoding (a synthetic) video of the specified size, then stream-copying it.
+        '''
+        f_tmpDir = FileUtils.File.Utils.getTemporaryDirectory()
+        try:
+            # ? Measure overhead.
+            command_BenchmarkOverhead = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['BenchmarkOverhead'].createFormatter()
+            overhead = EncodeBenchmark.INTERNAL_timeCommand(command_BenchmarkOverhead)
+            
+            # ? Measure re-encoding.
+            f_encodeDst = f_tmpDir.traverseDirectory('benchmark.mp4')
+            command_BenchmarkEncode = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['BenchmarkEncode'].createFormatter()
+            command_BenchmarkEncode.assertParameter('width', str(size[0]))
+            command_BenchmarkEncode.assertParameter('height', str(size[1]))
+            command_BenchmarkEncode.assertParameter('fps', '25')
+            command_BenchmarkEncode.assertParameter('frame-count', str(frameCount))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.formatEncoding(command_BenchmarkEncode, Actions.Trim(None, None), encodingProfile)
+            command_BenchmarkEncode.assertParameter('output-file', str(f_encodeDst))
+            encodeTime = EncodeBenchmark.INTERNAL_timeCommand(command_BenchmarkEncode)
+            
+            # ? Measure stream-copying.
+            f_copyDst = f_tmpDir.traverseDirectory('benchmark-copy.mp4')
+            command_VideoRemux = INTERNAL_VideoProcessing.FFMPEGWrapper.CommandTemplates['VideoRemux'].createFormatter()
+            command_VideoRemux.assertParameter('input-file', str(f_encodeDst))
+            INTERNAL_VideoProcessing.FFMPEGWrapper.Utils.formatOutputOptions(command_VideoRemux, [])
+            command_VideoRemux.assertParameter('output-file', str(f_copyDst))
+            copyTime = EncodeBenchmark.INTERNAL_timeCommand(command_VideoRemux)
+            
+            # Overhead is excluded from rate(s) (i.e., bounded, in case of noisy measurement(s)).
+            minSeconds = 0.001
+            pixelRate = (size[0] * size[1] * frameCount) / max(minSeconds, (encodeTime - overhead).toSeconds())
+            byteRate = f_encodeDst.getSize() / max(minSeconds, (copyTime - overhead).toSeconds())
+        finally:
+            FileUtils.File.Utils.delete(f_tmpDir)
+        
+        return EncodeBenchmark(overhead, pixelRate, byteRate)
+    
+    @staticmethod
+    def get(encodingProfile:EncodingProfile=None) -> 'EncodeBenchmark':
+        '''
+        Returns the (cached) benchmark of an encoding profile, running it if necessary.
+        '''
+        encodingProfile = EncodingProfile() if (encodingProfile is None) else encodingProfile
+        key = (
+            encodingProfile.codec,
+            encodingProfile.preset,
+            encodingProfile.CRF,
+            encodingProfile.tune,
+            encodingProfile.threadCount,
+            tuple(sorted(encodingProfile.codecParams.items())),
+        )
+        with EncodeBenchmark.INTERNAL_cacheMutex:
+            if key not in EncodeBenchmark.INTERNAL_cache:
+                EncodeBenchmark.INTERNAL_cache[key] = EncodeBenchmark.run(encodingProfile)
+            return EncodeBenchmark.INTERNAL_cache[key]
+    
+    @staticmethod
+    def INTERNAL_timeCommand(command) -> TimeUtils.Time:
+        '''
+        Runs a command, and returns the time it took.
+        '''
+        startTime = time.perf_counter()
+        proc = ProcessUtils.Process(str(command))
+        if proc.wait() != 0:
+            raise ExceptionUtils.BackendError(proc.STDERR())
+        return TimeUtils.Time.createFromSeconds(time.perf_counter() - startTime)
+
+class RenderPlan:
+    '''
+    A plan of the command(s) that render the registered action(s) of a video (i.e., inspected before, or instead of, running it).
+    
+    Note,
+    - Size(s) are estimated from the (average) byte-rate of the source.
+    - Intermediate I/O counts every intermediate file twice (i.e., written, then read by the command(s) that depend on it).
+    - Runtime is estimated from an `EncodeBenchmark` (i.e., of the encoding profile the plan was made with).
+    '''
+    
+    def __init__(self, commandList:list, f_output:FileUtils.File, generalInfo:dict=None, encodingProfile:EncodingProfile=None):
+        self.commandList = commandList
+        self.f_output = f_output
+        self.generalInfo = generalInfo
+        self.encodingProfile = encodingProfile
+    
+    def getSteps(self) -> list:
+        '''
+        Returns a list of step(s) (i.e., one per ffmpeg invocation, in order), each a `dict` of,
+        - 'command': The command, as a string.
+        - 'dependencies': Index(es) of the step(s) it depends on.
+        - 'is-reencode': Whether it re-encodes, or stream-copies.
+        - 'estimated-bytes': Size of its output, or `None` if unknown.
+        '''
+        commandToIndex = {command : idx for idx, command in enumerate(self.commandList)}
+        steps = []
+        for command in self.commandList:
+            steps.append({
+                'command' : str(command),
+                'dependencies' : [commandToIndex[dependency] for dependency in command.dependencies],
+                'is-reencode' : command.isReencode,
+                'estimated-bytes' : command.estimatedBytes,
+            })
+        return steps
+    
+    def getPassCount(self) -> int:
+        '''
+        Returns the count of ffmpeg invocation(s).
+        '''
+        return len(self.commandList)
+    
+    def getIntermediateBytes(self) -> int:
+        '''
+        Returns the (estimated) intermediate I/O, in bytes, or `None` if it can not be estimated.
+        '''
+        intermediateCommands = set()
+        for command in self.commandList:
+            intermediateCommands.update(command.dependencies)
+        
+        if any((command.estimatedBytes is None) for command in intermediateCommands):
+            return None
+        return 2 * sum(command.estimatedBytes for command in intermediateCommands)
+    
+    def getTemporaryBytes(self) -> int:
+        '''
+        Returns the (estimated) temporary space, in bytes, or `None` if it can not be estimated.
+        
+        Note, all output(s), including the final one, are kept in the temporary directory until rendering completes.
+        '''
+        if any((command.estimatedBytes is None) for command in self.commandList):
+            return None
+        return sum(command.estimatedBytes for command in self.commandList)
+    
+    def isFittingInto(self, f_dir:FileUtils.File) -> bool:
+        '''
+        Checks whether the (estimated) temporary space fits into the free space of a directory (e.g., scratch disk).
+        
+        Note, if temporary space can not be estimated, it is assumed not to fit.
+        '''
+        temporaryBytes = self.getTemporaryBytes()
+        if temporaryBytes is None:
+            return False
+        return temporaryBytes <= shutil.disk_usage(str(f_dir)).free
+    
+    def estimateRuntime(self, workerCount:int=None, benchmark:EncodeBenchmark=None) -> TimeUtils.Time:
+        '''
+        Estimates the (wall) runtime, or `None` if it can not be estimated.
+        
+        Note,
+        - By default, the (cached) benchmark of the plan's encoding profile is used (i.e., it is run, if necessary).
+        - Command(s) are scheduled as in `Video.saveAs` (i.e., up to `workerCount` at a time, each once its dependencies are complete), assuming worker(s) do not contend.
+        '''
+        workerCount = os.cpu_count() if (workerCount is None) else workerCount
+        benchmark = EncodeBenchmark.get(self.encodingProfile) if (benchmark is None) else benchmark
+        
+        commandToRuntime = {}
+        for command in self.commandList:
+            runtime = self.INTERNAL_estimateCommandRuntime(command, benchmark)
+            if runtime is None:
+                return None
+            commandToRuntime[command] = runtime
+        
+        # ? Simulate execution (i.e., list-scheduling, in order).
+        commandToEndTime = {}
+        workerEndTimes = [0.0] * workerCount
+        pendingCommands = list(self.commandList)
+        while len(pendingCommands) > 0:
+            command = next(command for command in pendingCommands if all((dependency in commandToEndTime) for dependency in command.dependencies))
+            pendingCommands.remove(command)
+            workerIdx = min(range(workerCount), key=lambda idx: workerEndTimes[idx])
+            startTime = max([workerEndTimes[workerIdx]] + [commandToEndTime[dependency] for dependency in command.dependencies])
+            commandToEndTime[command] = workerEndTimes[workerIdx] = startTime + commandToRuntime[command]
+        
+        return TimeUtils.Time.createFromSeconds(max(commandToEndTime.values(), default=0.0))
+    
+    def INTERNAL_estimateCommandRuntime(self, command, benchmark:EncodeBenchmark) -> float:
+        '''
+        Estimates the runtime of a command (in seconds), or `None` if it can not be estimated.
+        '''
+        if command.isReencode:
+            if (command.duration is None) or (self.generalInfo is None):
+                return None
+            pixelCount = command.duration.toSeconds() * self.generalInfo['fps'] * self.generalInfo['width'] * self.generalInfo['height']
+            return benchmark.overhead.toSeconds() + (pixelCount / benchmark.pixelRate)
+        if command.estimatedBytes is None:
+            return None
+        return benchmark.overhead.toSeconds() + (command.estimatedBytes / benchmark.byteRate)
+
+# Deals in 'Action'(s) and General-Info
+class Video:
+    '''
+    Video-handler.
+    
+    Note, currently only 'mp4' format is supported.
+    '''
+
+    def __init__(self, f:FileUtils.File, metadataCache:MetadataCache=None):
+        self.f_src = f
         self.actions = []
-        self.generalInfo = INTERNAL_VideoProcessing.FFMPEGWrapper.queryGeneralInfo(self.f_src)
+        self.metadataCache = metadataCache
+        self.keyframeIndex = None
+        if metadataCache is None:
+            self.generalInfo = INTERNAL_VideoProcessing.FFMPEGWrapper.queryGeneralInfo(self.f_src)
+        else:
+            self.generalInfo = metadataCache.getGeneralInfo(self.f_src)
         
     def getFPS(self):
         return self.generalInfo['fps']
@@ -929,7 +3002,39 @@ class Video:
         '''
         Get a list of all key-frame(s).
         '''
-        return INTERNAL_VideoProcessing.FFMPEGWrapper.queryKeyframes(self.f_src)
+        return self.getKeyframeIndex().toList()
+    
+    def getKeyframeIndex(self, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None) -> KeyframeIndex:
+        '''
+        Get an index of key-frame(s) (see `KeyframeIndex`).
+        
+        Note,
+        - The (full) index is probed once, and is cached.
+        - If a time window is specified, and the (full) index is not cached, only the window is probed (i.e., a partial index, which is not cached).
+        '''
+        if self.keyframeIndex is not None:
+            return self.keyframeIndex
+        
+        if (startTime is not None) or (endTime is not None):
+            return KeyframeIndex.createFromProbe(self.f_src, startTime, endTime)
+        
+        if self.metadataCache is None:
+            self.keyframeIndex = KeyframeIndex.createFromProbe(self.f_src)
+        else:
+            self.keyframeIndex = KeyframeIndex(self.metadataCache.getKeyframes(self.f_src))
+        return self.keyframeIndex
+
+    def INTERNAL_getPlanningInfo(self) -> dict:
+        '''
+        Returns general info, to plan registered action(s) with.
+        
+        Note, the (full) key-frame index is included as `keyframe-index`, if it is cached, or if it is cache'able (i.e., by the metadata cache) and a 'Trim' action is a smart-cut.
+        '''
+        planningInfo = dict(self.generalInfo)
+        isSmartCut = any(isinstance(action, Actions.Join) and any(trimAction.isSmartCut for trimAction in action.trimActions) for action in self.actions)
+        if (self.keyframeIndex is not None) or (isSmartCut and (self.metadataCache is not None)):
+            planningInfo['keyframe-index'] = self.getKeyframeIndex()
+        return planningInfo
 
     def getDimensions(self):
         '''
@@ -942,19 +3047,42 @@ class Video:
         Register an action.
         
         Note,
-        - Only a single 'Join' (mandatory), which consists of one or more 'Trim' action(s), and a 'GIF' (optional) are supported.
+        - Only a single 'Join' (mandatory), which consists of one or more 'Trim' action(s), and a 'GIF' or a 'Ladder' (optional) are supported.
+        - For a 'Ladder', the destination (see `saveAs`) is a directory.
         - Modifier(s) may be applied to 'Trim' action(s).
         - All action(s) and modifier(s) are order-sensitive.
         '''
         self.actions.append(action)
     
-    def saveAs(self, f_dst:FileUtils.File):
+    def saveAs(self, f_dst:FileUtils.File, workerCount:int=None, encodingProfile:EncodingProfile=None, progressCallout=None, metrics:RenderMetrics=None, stagingBackend:StagingBackend=None):
         '''
         Processes registered action(s), and save end-file.
+        
+        Note,
+        - Independent command(s) (e.g., each 'Trim' of a 'Join') are executed concurrently, by up to `workerCount` worker(s) (by default, the CPU count).
+        - Encoding profile applies to all re-encoded 'Trim' action(s), except those with an encoding profile of their own.
+        - If specified, progress callout is called with every `ProgressEvent` (from any thread).
+        - If specified, execution is recorded into the metrics.
+        - Intermediate file(s) are staged as per the staging backend (by default, in the system's temporary directory, see `StagingBackend`).
         '''
         if f_dst.isExists():
             raise ExceptionUtils.ValidationError('Destination file must not exist.')
-        INTERNAL_VideoProcessing.FFMPEGWrapper.processActions(self.f_src, f_dst, self.actions, self.generalInfo)
+        INTERNAL_VideoProcessing.FFMPEGWrapper.processActions(self.f_src, f_dst, self.actions, self.INTERNAL_getPlanningInfo(), workerCount, encodingProfile, progressCallout, metrics, stagingBackend)
+    
+    def plan(self, encodingProfile:EncodingProfile=None) -> RenderPlan:
+        '''
+        Plans registered action(s), without running them (see `RenderPlan`).
+        
+        Note,
+        - Planning may still probe the source (e.g., for smart-cut key-frame(s), or loudness).
+        - Encoding profile is as in `saveAs` (i.e., it is also the one runtime is estimated with).
+        '''
+        f_tmpDir = FileUtils.File.Utils.getTemporaryDirectory()
+        try:
+            commandList, f_finalTmpDst = INTERNAL_VideoProcessing.FFMPEGWrapper.planActions(self.f_src, f_tmpDir, self.actions, self.INTERNAL_getPlanningInfo(), encodingProfile)
+        finally:
+            FileUtils.File.Utils.delete(f_tmpDir)
+        return RenderPlan(commandList, f_finalTmpDst, self.generalInfo, encodingProfile)
     
     def clearActions(self):
         '''
@@ -962,9 +3090,89 @@ class Video:
         '''
         self.actions.clear()
     
-    def generateThumbnails(self, f_dstDir:FileUtils.File, N:int, timestampAttribs:ThumbnailTimestampAttributes=None):
+    def iterFrames(self, fps:float=None, size=None, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None, isReuseBuffer:bool=True):
+        '''
+        Yields frame(s) as `Image`(s), decoded and streamed (i.e., with no intermediate file(s)).
+        
+        Note,
+        - By default, frame(s) are at the video's FPS, and dimension(s).
+        - Size is a '(W, H)' tuple. If either set to '-1', aspect ratio is preserved.
+        - If `isReuseBuffer` is set, all yielded `Image`(s) share a single buffer, which is overwritten by every next frame (i.e., copy it, if it is to be kept).
+        '''
+        for imgHandler in INTERNAL_VideoProcessing.FFMPEGWrapper.streamFrames(self.f_src, self.generalInfo, fps, size, startTime, endTime, isReuseBuffer):
+            yield ImageUtils.Image.INTERNAL_createFromCV2(imgHandler)
+
+    def INTERNAL_sampleTimes(self, N:int, isSnapToKeyframe:bool=False) -> list:
+        '''
+        Returns N equi-distant time-stamp(s), optionally snapped to the nearest (preceding) key-frame.
+        
+        Note, snapped time-stamp(s) are exact (i.e., key-frame time(s) are rounded to the microsecond), hence, seeking to them does not decode the preceding GOP.
+        '''
+        times = [TimeUtils.Time(int(self.getDuration()) * idx // N) for idx in range(N)]
+        if isSnapToKeyframe:
+            keyframeIndex = self.getKeyframeIndex()
+            times = [(keyframeIndex.nearestBefore(time) or time) for time in times]
+        return times
+    
+    def extractAudio(self, f_dst:FileUtils.File, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None, progressCallout=None):
+        '''
+        Extract audio (i.e., of the first audio stream) into a file (e.g., 'm4a', 'mp3', 'wav').
+        
+        Note,
+        - Audio is stream-copied (i.e., not re-encoded) if its codec is compatible with the destination's extension (e.g., AAC into 'm4a').
+        - If specified, progress callout is called with every `ProgressEvent` (from another thread).
+        '''
+        if f_dst.isExists():
+            raise ExceptionUtils.ValidationError('Destination file must not exist.')
+        INTERNAL_VideoProcessing.FFMPEGWrapper.extractAudio(self.f_src, f_dst, startTime, endTime, progressCallout)
+    
+    def measureLoudness(self, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None) -> dict:
+        '''
+        Measures loudness (as per EBU R128), decoding audio only (see `INTERNAL_VideoProcessing.FFMPEGWrapper.measureLoudness`).
+        '''
+        return INTERNAL_VideoProcessing.FFMPEGWrapper.measureLoudness(self.f_src, startTime, endTime)
+
+    def detectScenes(self, threshold:float=0.4, minSceneDuration:TimeUtils.Time=None, startTime:TimeUtils.Time=None, endTime:TimeUtils.Time=None, isFast:bool=False) -> list:
+        '''
+        Detects scene (i.e., shot) boundaries, and returns a list of cut time-stamp(s).
+        
+        Note,
+        - Consecutive time-stamp(s) (along with the start and end of the video) delimit scene(s) (e.g., `Actions.Trim(cuts[0], cuts[1])`).
+        - Threshold is in '[0, 1]', and is compared against the color-histogram difference of consecutive frame(s) (i.e., lower is more sensitive).
+        - If specified, cut(s) that are closer than `minSceneDuration` to the preceding cut are ignored.
+        - Frame(s) are streamed (i.e., constant memory), and analyzed at a low resolution. If `isFast` is set, resolution is lower still, and frame(s) are sampled at a reduced FPS (i.e., cut(s) are less precise).
+        - Time-stamp(s) are derived from frame index(es), and FPS (i.e., they assume a constant frame-rate).
+        '''
+        size, fps = ((64, -1), min(self.getFPS(), 5.0)) if isFast else ((160, -1), None)
+        frameTimeStep = 1 / (self.getFPS() if (fps is None) else fps)
+        startTimeSeconds = 0.0 if (startTime is None) else startTime.toSeconds()
+        
+        imgHandlers = INTERNAL_VideoProcessing.FFMPEGWrapper.streamFrames(self.f_src, self.generalInfo, fps, size, startTime, endTime)
+        frameTimes = (TimeUtils.Time.createFromSeconds(startTimeSeconds + idx * frameTimeStep) for idx in itertools.count())
+        return INTERNAL_VideoAnalysis.SceneDetection.detectCuts(imgHandlers, frameTimes, threshold, minSceneDuration)
+
+    def computeFingerprint(self, sampleCount:int=16, workerCount:int=None) -> VideoFingerprint:
+        '''
+        Computes a perceptual fingerprint (see `VideoFingerprint`), from frame(s) sampled at equi-distant interval(s).
+        
+        Note,
+        - Each frame is captured by seeking (and downscaled by ffmpeg), concurrently, by up to `workerCount` worker(s) (by default, the CPU count).
+        - Sample(s) are centered within their interval(s) (i.e., the first, and last, frame(s) are avoided).
+        '''
+        hashWidth, hashHeight = INTERNAL_VideoAnalysis.Fingerprinting.HashSize
+        times = [TimeUtils.Time(int(self.getDuration()) * (2 * idx + 1) // (2 * sampleCount)) for idx in range(sampleCount)]
+        images = self.captureFrames(times, size=(hashWidth + 1, hashHeight), workerCount=workerCount)
+        bits = np.concatenate([INTERNAL_VideoAnalysis.Fingerprinting.computeDHash(image.EXTERNAL_toCV2()) for image in images])
+        return VideoFingerprint.INTERNAL_createFromBits(bits)
+
+    def generateThumbnails(self, f_dstDir:FileUtils.File, N:int, timestampAttribs:ThumbnailTimestampAttributes=None, progressCallout=None, isSeek:bool=False, isSnapToKeyframe:bool=False, workerCount:int=None):
         '''
         Generate thumb-nails at equi-distant interval(s).
+        
+        Note,
+        - If specified, progress callout is called with every `ProgressEvent` (from another thread).
+        - By default, the whole video is decoded once (i.e., sampled via a filter). If `isSeek` is set, each thumb-nail is captured by seeking instead, concurrently, by up to `workerCount` worker(s) (by default, the CPU count), which is much faster for long video(s).
+        - If `isSnapToKeyframe` is set (along with `isSeek`), time-stamp(s) are snapped to the nearest (preceding) key-frame (i.e., a seek decodes a single frame).
         '''
         if f_dstDir.isExists():
             raise ExceptionUtils.ValidationError('Destination directory must not exist.')
@@ -973,17 +3181,47 @@ class Video:
         f_dstDir.makeDirectory()
         
         # ? Generate thumbnail(s).
-        INTERNAL_VideoProcessing.FFMPEGWrapper.generateThumbnails(self.f_src, f_dstDir, N, timestampAttribs, self.generalInfo)
+        if isSeek:
+            times = self.INTERNAL_sampleTimes(N, isSnapToKeyframe)
+            INTERNAL_VideoProcessing.FFMPEGWrapper.generateThumbnailsBySeeking(self.f_src, f_dstDir, times, timestampAttribs, workerCount, progressCallout)
+        else:
+            INTERNAL_VideoProcessing.FFMPEGWrapper.generateThumbnails(self.f_src, f_dstDir, N, timestampAttribs, self.generalInfo, progressCallout)
+    
+    def captureFrames(self, times:list, size=None, workerCount:int=None) -> list:
+        '''
+        Captures a frame per time-stamp, as `Image`(s) (i.e., with no intermediate file(s)).
+        
+        Note,
+        - Each frame is captured by seeking, concurrently, by up to `workerCount` worker(s) (by default, the CPU count).
+        - Size is a '(W, H)' tuple. If either set to '-1', aspect ratio is preserved.
+        '''
+        workerCount = os.cpu_count() if (workerCount is None) else workerCount
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workerCount) as executor:
+            imgHandlers = list(executor.map(lambda time: INTERNAL_VideoProcessing.FFMPEGWrapper.captureFrame(self.f_src, self.generalInfo, time, size), times))
+        return [ImageUtils.Image.INTERNAL_createFromCV2(imgHandler) for imgHandler in imgHandlers]
+    
+    def generateContactSheet(self, rows:int, columns:int, size=None, isSnapToKeyframe:bool=False, workerCount:int=None) -> ImageUtils.Image:
+        '''
+        Generate a contact sheet (i.e., a grid of frame(s), at equi-distant interval(s)), as an `Image`.
+        
+        Note,
+        - Size is that of each frame (see `captureFrames`).
+        - If `isSnapToKeyframe` is set, time-stamp(s) are snapped to the nearest (preceding) key-frame.
+        '''
+        images = self.captureFrames(self.INTERNAL_sampleTimes(rows * columns, isSnapToKeyframe), size, workerCount)
+        return ImageUtils.Image.createByTilingImages(images, rows, columns)
 
-    def generateThumbnail(self, f_dst:FileUtils.File, time:TimeUtils.Time, timestampAttribs:ThumbnailTimestampAttributes=None):
+    def generateThumbnail(self, f_dst:FileUtils.File, time:TimeUtils.Time, timestampAttribs:ThumbnailTimestampAttributes=None, progressCallout=None):
         '''
         Generate thumb-nail at a specific time-stamp.
+        
+        Note, if specified, progress callout is called with every `ProgressEvent` (from another thread).
         '''
         if f_dst.isExists():
             raise ExceptionUtils.ValidationError('Destination file must not exist.')
 
         # ? Generate thumbnail.
-        INTERNAL_VideoProcessing.FFMPEGWrapper.generateThumbnail(self.f_src, f_dst, time, timestampAttribs)
+        INTERNAL_VideoProcessing.FFMPEGWrapper.generateThumbnail(self.f_src, f_dst, time, timestampAttribs, progressCallout)
     
     class Utils:
         
@@ -1007,3 +3245,377 @@ class Video:
             Note, currently only 'mp4' format is supported.
             '''
             return f.getExtension() in Video.Utils.SupportedExtensions
+
+        @staticmethod
+        def probeMany(f_list:list, workerCount:int=None, metadataCache:MetadataCache=None):
+            '''
+            Query general info of many video(s), concurrently.
+            
+            Yields a tuple `(f, generalInfo, error)` per video, as soon as it is complete (i.e., not in order), where either `generalInfo` or `error` is `None`.
+            
+            Note,
+            - By default, worker count is the CPU count.
+            - A failure is captured as `error` (i.e., it does not abort the remaining video(s)).
+            '''
+            workerCount = os.cpu_count() if (workerCount is None) else workerCount
+            queryFcn = INTERNAL_VideoProcessing.FFMPEGWrapper.queryGeneralInfo if (metadataCache is None) else metadataCache.getGeneralInfo
+            
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=workerCount)
+            try:
+                futureToFile = {executor.submit(queryFcn, f) : f for f in f_list}
+                for future in concurrent.futures.as_completed(futureToFile):
+                    generalInfo = None
+                    error = None
+                    try:
+                        generalInfo = future.result()
+                    except Exception as e:
+                        error = e
+                    yield (futureToFile[future], generalInfo, error)
+            finally:
+                # If iteration is abandoned, pending (i.e., not started) queries are cancelled.
+                executor.shutdown(wait=True, cancel_futures=True)
+
+class RenderJob:
+    '''
+    A resumable render, of the registered action(s) of a video.
+    
+    Note that,
+    - Command(s), and their completion state, are persisted to a journal (within the job directory). If a render is interrupted, it is resumed by creating a job with the same job directory, and running it.
+    - On resume, the journal'ed command(s) are used (i.e., registered action(s) are ignored), and the output(s) of completed command(s) are reused.
+    - Once the render is complete, the journal and the intermediate file(s) of the job are deleted (and, so is the job directory, if left empty).
+    - A new job requires its job directory to either not exist, or be empty.
+    '''
+    
+    JournalFileName = 'journal.json'
+    
+    def __init__(self, video:Video, f_dst:FileUtils.File, f_jobDir:FileUtils.File, workerCount:int=None, encodingProfile:EncodingProfile=None):
+        self.f_dst = f_dst
+        self.f_jobDir = f_jobDir
+        self.workerCount = workerCount
+        self.lock = threading.Lock()
+        
+        f_journal = self.getJournalFile()
+        self.isResumed = f_journal.isExists()
+        if self.isResumed:
+            self.INTERNAL_loadJournal()
+        else:
+            if not f_jobDir.isExists():
+                f_jobDir.makeDirectory()
+            elif not f_jobDir.isEmptyDirectory():
+                raise ExceptionUtils.ValidationError('Job directory must either not exist, or be empty (i.e., if not resuming a job).')
+            self.commandList, self.f_finalTmpDst = INTERNAL_VideoProcessing.FFMPEGWrapper.planActions(video.f_src, f_jobDir, video.actions, video.INTERNAL_getPlanningInfo(), encodingProfile)
+            # Any file created while planning (e.g., a concat list), is an intermediate file of the job.
+            self.plannedFiles = f_jobDir.listDirectory()
+            self.completedCommands = set()
+            self.INTERNAL_saveJournal()
+    
+    def getJournalFile(self) -> FileUtils.File:
+        return self.f_jobDir.traverseDirectory(RenderJob.JournalFileName)
+    
+    def INTERNAL_saveJournal(self):
+        '''
+        (Atomically) writes the journal.
+        '''
+        commandToIdx = {command : idx for idx, command in enumerate(self.commandList)}
+        journal = {
+            'output-file' : str(self.f_finalTmpDst),
+            'planned-files' : [str(f) for f in self.plannedFiles],
+            'commands' : [
+                {
+                    'command' : command.command,
+                    'dependencies' : [commandToIdx[dependency] for dependency in command.dependencies],
+                    'output-file' : None if (command.f_dst is None) else str(command.f_dst),
+                    'max-bytes' : command.maxBytes,
+                    'fallback-commands' : command.fallbackCommands,
+                } for command in self.commandList
+            ],
+            'completed' : sorted(commandToIdx[command] for command in self.completedCommands),
+        }
+        
+        f_journal = self.getJournalFile()
+        f_journalTmp = FileUtils.File(str(f_journal) + '.tmp')
+        with open(str(f_journalTmp), mode='w', encoding='utf-8') as journalFile:
+            json.dump(journal, journalFile, indent=4)
+        os.replace(str(f_journalTmp), str(f_journal))
+    
+    def INTERNAL_loadJournal(self):
+        with open(str(self.getJournalFile()), mode='r', encoding='utf-8') as journalFile:
+            journal = json.load(journalFile)
+        
+        self.commandList = []
+        for entry in journal['commands']:
+            dependencies = [self.commandList[idx] for idx in entry['dependencies']]
+            f_dst = None if (entry['output-file'] is None) else FileUtils.File(entry['output-file'])
+            self.commandList.append(INTERNAL_VideoProcessing.FFMPEGWrapper.Command(entry['command'], dependencies, f_dst, maxBytes=entry.get('max-bytes'), fallbackCommands=entry.get('fallback-commands')))
+        self.completedCommands = set(self.commandList[idx] for idx in journal['completed'])
+        self.f_finalTmpDst = FileUtils.File(journal['output-file'])
+        self.plannedFiles = [FileUtils.File(path) for path in journal.get('planned-files', [])]
+    
+    def getProgress(self) -> tuple:
+        '''
+        Returns a tuple `(completed-count, total-count)` of command(s).
+        '''
+        with self.lock:
+            return (len(self.completedCommands), len(self.commandList))
+    
+    def run(self, progressCallout=None, metrics:RenderMetrics=None):
+        '''
+        Runs (or, resumes) the render.
+        
+        Note,
+        - If specified, progress callout is called with `(completed-count, total-count, event)`, where `event` is the latest `ProgressEvent` of a running command, or `None` (i.e., once a command completes). It may be called from any thread.
+        - If specified, execution is recorded into the metrics.
+        '''
+        if self.f_dst.isExists():
+            raise ExceptionUtils.ValidationError('Destination file must not exist.')
+        
+        # ? A command that is not complete may have left a partial output.
+        for command in self.commandList:
+            if (command not in self.completedCommands) and (command.f_dst is not None) and command.f_dst.isExists():
+                FileUtils.File.Utils.delete(command.f_dst)
+        
+        def completionCallout(command):
+            with self.lock:
+                self.completedCommands.add(command)
+                self.INTERNAL_saveJournal()
+            if progressCallout is not None:
+                progressCallout(*self.getProgress(), None)
+        
+        commandProgressCallout = None
+        if progressCallout is not None:
+            commandProgressCallout = lambda event: progressCallout(*self.getProgress(), event)
+        
+        INTERNAL_VideoProcessing.FFMPEGWrapper.executeCommands(self.commandList, self.workerCount, self.completedCommands, completionCallout, commandProgressCallout, metrics)
+        
+        # Copy into (actual) destination.
+        FileUtils.File.Utils.copy(self.f_finalTmpDst, self.f_dst)
+        
+        # ? Delete intermediate file(s), then journal, then job directory (i.e., only if left empty).
+        for command in self.commandList:
+            if command.f_dst is not None:
+                FileUtils.File.Utils.delete(command.f_dst)
+        for f in self.plannedFiles:
+            FileUtils.File.Utils.delete(f)
+        FileUtils.File.Utils.delete(self.getJournalFile())
+        if self.f_jobDir.isEmptyDirectory():
+            FileUtils.File.Utils.delete(self.f_jobDir)
+    
+    def runIteratively(self, metrics:RenderMetrics=None):
+        '''
+        Runs (or, resumes) the render, in the background, yielding `(completed-count, total-count, event)` (see `run`).
+        
+        Note,
+        - Any error is raised once all yielded progress is consumed.
+        '''
+        progressQueue = queue.Queue()
+        errors = []
+        
+        def runnable():
+            try:
+                self.run(lambda *progress: progressQueue.put(progress), metrics)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                # ? Signals the end of the render.
+                progressQueue.put(None)
+        
+        thread = threading.Thread(target=runnable, daemon=True)
+        thread.start()
+        while True:
+            progress = progressQueue.get()
+            if progress is None:
+                break
+            yield progress
+        thread.join()
+        
+        if len(errors) > 0:
+            raise errors[0]
+
+class BatchTranscoder:
+    '''
+    Transcodes every video of a source tree (i.e., applies an action template to it), into a destination tree of the same structure.
+    
+    Note that,
+    - Action template is a list of action(s) (see `Video.registerAction`), copied for every video. If its last action is a 'GIF', output(s) are '.gif', and if it is a 'Ladder', output(s) are directories (i.e., with no extension).
+    - Video(s) are transcoded concurrently, where each worker drives its own ffmpeg process(es). By default, worker count is bounded by both the CPU count, and the available memory (i.e., `memoryPerWorker` each).
+    - An output is up-to-date (i.e., skipped) if it is newer than its source. If `isHashCheck` is set, it is rather up-to-date if the (SHA-256) hash of its source matches the one recorded when it was transcoded (i.e., in a manifest, within the destination tree).
+    - Output(s) are written under a temporary name, then renamed (i.e., an interrupted transcode never leaves an up-to-date looking output).
+    - A failure is captured (i.e., it does not abort the remaining video(s)).
+    '''
+    
+    ManifestFileName = '.transcode-manifest.json'
+    
+    class Status:
+        Transcoded = 'transcoded'
+        Skipped = 'skipped'
+        Failed = 'failed'
+    
+    def __init__(self, f_srcDir:FileUtils.File, f_dstDir:FileUtils.File, actionTemplate:list, workerCount:int=None, memoryPerWorker:int=512 * 1024 * 1024, encodingProfile:EncodingProfile=None, isHashCheck:bool=False, metadataCache:MetadataCache=None, stagingBackend:StagingBackend=None):
+        if (not f_srcDir.isDirectory()):
+            raise ExceptionUtils.ValidationError('Source directory does not exist.')
+        self.f_srcDir = f_srcDir
+        self.f_dstDir = f_dstDir
+        self.actionTemplate = actionTemplate
+        self.workerCount = BatchTranscoder.INTERNAL_computeWorkerCount(memoryPerWorker) if (workerCount is None) else workerCount
+        self.encodingProfile = encodingProfile
+        self.isHashCheck = isHashCheck
+        self.metadataCache = metadataCache
+        self.stagingBackend = stagingBackend
+        self.mutex = threading.Lock()
+        self.manifest = {}
+    
+    @staticmethod
+    def INTERNAL_computeWorkerCount(memoryPerWorker:int) -> int:
+        '''
+        Computes worker count, as the CPU count, bounded by the available memory (if it can be queried).
+        '''
+        workerCount = os.cpu_count()
+        availableMemory = BatchTranscoder.INTERNAL_queryAvailableMemory()
+        if availableMemory is not None:
+            workerCount = min(workerCount, availableMemory // memoryPerWorker)
+        return max(1, workerCount)
+    
+    @staticmethod
+    def INTERNAL_queryAvailableMemory() -> int:
+        '''
+        Returns the available memory (in bytes), or `None` if it can not be queried (e.g., on Windows).
+        '''
+        # ? Linux reports available memory (i.e., including reclaimable cache).
+        f_memInfo = FileUtils.File('/proc/meminfo')
+        if f_memInfo.isExists():
+            with open(str(f_memInfo), mode='r') as memInfoFile:
+                for line in memInfoFile:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) * 1024
+        try:
+            return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except (AttributeError, ValueError, OSError):
+            return None
+    
+    @staticmethod
+    def INTERNAL_hashFile(f:FileUtils.File) -> str:
+        hashObject = hashlib.sha256()
+        with open(str(f), mode='rb') as fileHandler:
+            for chunk in iter(lambda: fileHandler.read(1024 * 1024), b''):
+                hashObject.update(chunk)
+        return hashObject.hexdigest()
+    
+    def getManifestFile(self) -> FileUtils.File:
+        return self.f_dstDir.traverseDirectory(BatchTranscoder.ManifestFileName)
+    
+    def INTERNAL_loadManifest(self):
+        f_manifest = self.getManifestFile()
+        if f_manifest.isExists():
+            with open(str(f_manifest), mode='r', encoding='utf-8') as manifestFile:
+                self.manifest = json.load(manifestFile)
+    
+    def INTERNAL_saveManifest(self):
+        '''
+        (Atomically) writes the manifest.
+        '''
+        f_manifest = self.getManifestFile()
+        f_manifestTmp = FileUtils.File(str(f_manifest) + '.tmp')
+        with open(str(f_manifestTmp), mode='w', encoding='utf-8') as manifestFile:
+            json.dump(self.manifest, manifestFile, indent=4)
+        os.replace(str(f_manifestTmp), str(f_manifest))
+    
+    def INTERNAL_getDestination(self, relPath:str) -> FileUtils.File:
+        f_dst = self.f_dstDir.traverseDirectory(relPath)
+        if (len(self.actionTemplate) > 0) and isinstance(self.actionTemplate[-1], Actions.GIF):
+            f_dst = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_dst), extension='gif'))
+        if (len(self.actionTemplate) > 0) and isinstance(self.actionTemplate[-1], Actions.Ladder):
+            f_dst = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_dst), extension=''))
+        return f_dst
+    
+    def INTERNAL_transcode(self, relPath:str) -> dict:
+        '''
+        Transcodes a single video (unless it is up-to-date), and returns its result.
+        '''
+        f_src = self.f_srcDir.traverseDirectory(relPath)
+        f_dst = self.INTERNAL_getDestination(relPath)
+        result = {
+            'source' : f_src,
+            'destination' : f_dst,
+            'status' : None,
+            'duration' : TimeUtils.Time(0),
+            'error' : None,
+        }
+        startTime = time.perf_counter()
+        
+        try:
+            # ? Check if up-to-date.
+            srcHash = None
+            if self.isHashCheck:
+                srcHash = BatchTranscoder.INTERNAL_hashFile(f_src)
+                with self.mutex:
+                    isUpToDate = f_dst.isExists() and (self.manifest.get(relPath) == srcHash)
+            else:
+                isUpToDate = f_dst.isExists() and (f_src.getModificationTime() <= f_dst.getModificationTime())
+            
+            if isUpToDate:
+                result['status'] = BatchTranscoder.Status.Skipped
+            else:
+                # ? Transcode (i.e., into a temporary name, then rename).
+                f_dst.makeAncestorDirectories()
+                f_partialDst = FileUtils.File(FileUtils.File.Utils.Path.modifyName(str(f_dst), suffix='.partial'))
+                FileUtils.File.Utils.delete(f_partialDst)
+                
+                video = Video(f_src, self.metadataCache)
+                for action in copy.deepcopy(self.actionTemplate):
+                    video.registerAction(action)
+                video.saveAs(f_partialDst, workerCount=1, encodingProfile=self.encodingProfile, stagingBackend=self.stagingBackend)
+                if f_dst.isDirectory():
+                    FileUtils.File.Utils.delete(f_dst)
+                os.replace(str(f_partialDst), str(f_dst))
+                
+                if self.isHashCheck:
+                    with self.mutex:
+                        self.manifest[relPath] = srcHash
+                        self.INTERNAL_saveManifest()
+                result['status'] = BatchTranscoder.Status.Transcoded
+        except Exception as e:
+            result['status'] = BatchTranscoder.Status.Failed
+            result['error'] = e
+        
+        result['duration'] = TimeUtils.Time.createFromSeconds(time.perf_counter() - startTime)
+        return result
+    
+    def run(self, progressCallout=None) -> dict:
+        '''
+        Transcodes all video(s), and returns a summary, as a dictionary, with,
+        
+        - Result of every video, as `files`, each a `dict` with `source`, `destination`, `status` (see `BatchTranscoder.Status`), `duration`, and `error` (i.e., `None` unless failed)
+        - Count of video(s) per status, as `transcoded`, `skipped`, and `failed`
+        - Wall-time, as `wall-time`
+        
+        Note, if specified, progress callout is called with the result of every video, as soon as it is complete (from the calling thread).
+        '''
+        startTime = time.perf_counter()
+        self.f_dstDir.makeAncestorDirectories()
+        self.f_dstDir.makeDirectory()
+        if self.isHashCheck:
+            self.INTERNAL_loadManifest()
+        
+        relPaths = sorted(self.f_srcDir.listDirectoryRelatively(isRecursive=True, conditional=lambda f: f.isFile() and Video.Utils.isVideo(f)))
+        
+        results = []
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workerCount)
+        try:
+            futures = [executor.submit(self.INTERNAL_transcode, relPath) for relPath in relPaths]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if progressCallout is not None:
+                    progressCallout(result)
+        finally:
+            # If interrupted, pending (i.e., not started) video(s) are cancelled.
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        results.sort(key=lambda result: str(result['source']))
+        return {
+            'files' : results,
+            BatchTranscoder.Status.Transcoded : sum(1 for result in results if (result['status'] == BatchTranscoder.Status.Transcoded)),
+            BatchTranscoder.Status.Skipped : sum(1 for result in results if (result['status'] == BatchTranscoder.Status.Skipped)),
+            BatchTranscoder.Status.Failed : sum(1 for result in results if (result['status'] == BatchTranscoder.Status.Failed)),
+            'wall-time' : TimeUtils.Time.createFromSeconds(time.perf_counter() - startTime),
+        }
@@ -10,6 +10,7 @@ from send2trash import send2trash
 
 # Internal libraries
 import automatey.Utils.RandomUtils as RandomUtils
+import automatey.Utils.TimeUtils as TimeUtils
 import automatey.Utils.ExceptionUtils as ExceptionUtils
 import automatey.OS.Utils as OSUtils
 
@@ -129,6 +130,12 @@ class File:
             size = os.path.getsize(str(self))
         return size
 
+    def getModificationTime(self) -> TimeUtils.Time:
+        '''
+        Get the (last) modification time of a file or directory, as an Epoch time.
+        '''
+        return TimeUtils.Time(os.stat(self.path).st_mtime_ns // 1000)
+
     def openFile(self, mode:str) -> typing.Self:
         '''
         Opens a file, for read/write operation(s).
@@ -242,11 +249,14 @@ class File:
             return File(os.getcwd())
         
         @staticmethod
-        def getTemporaryDirectory() -> "File":
+        def getTemporaryDirectory(baseDir:"File"=None) -> "File":
             '''
             Returns a *File* object, of the temporary directory.
+            
+            Note that,
+            - By default, it is created under the system's temporary directory.
             '''
-            baseTmpDir = File(tempfile.gettempdir())
+            baseTmpDir = File(tempfile.gettempdir()) if (baseDir is None) else baseDir
             newTmpDirName = RandomUtils.Generation.String(INTERNAL_Constants.MINIMUM_RANDOM_LENGTH)
             newTmpDir = baseTmpDir.traverseDirectory(newTmpDirName)
             newTmpDir.makeDirectory()
@@ -322,6 +332,16 @@ class File:
                     path = path.replace('/', '\\')
                 send2trash(path)
         
+        @staticmethod
+        def delete(f):
+            '''
+            Delete file/directory (i.e., permanently, unlike `recycle`).
+            '''
+            if f.isDirectory():
+                shutil.rmtree(str(f))
+            elif f.isExists():
+                os.remove(str(f))
+        
         @staticmethod
         def replicateDirectoryStructure(srcDir:"File", dstDir:"File"):
             '''
@@ -114,9 +114,13 @@ class CommandTemplate:
 class Process:
     '''
     Creates and manages a process.
+    
+    Note,
+    - If `isStreamSTDOUT` is set, STDOUT is not collected, but is rather read (as binary) via `readSTDOUT`.
+    - If `STDOUTCallout` is specified, it is called with every line of STDOUT (i.e., as it is collected, from another thread).
     '''
     
-    def __init__(self, *args):
+    def __init__(self, *args, isStreamSTDOUT:bool=False, STDOUTCallout=None):
 
         command = StringUtils.Split.asCommand(*args)
         
@@ -124,24 +128,29 @@ class Process:
         creationFlags = 0
         if OSUtils.GetOSType() == OSUtils.OSType.Windows:
             creationFlags = subprocess.CREATE_NO_WINDOW
-        self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, creationflags=creationFlags)
+        self.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=(not isStreamSTDOUT), creationflags=creationFlags)
         
         self.status = None
+        self.isStreamSTDOUT = isStreamSTDOUT
 
         self.STDOUT_lines = []
         self.STDERR_lines = []
         self.stdout = None
         self.stderr = None
         
-        self.STDOUT_thread = threading.Thread(target=Process.INTERNAL_runnable_PIPEReader, args=(self.process.stdout, self.STDOUT_lines), daemon=True)
         self.STDERR_thread = threading.Thread(target=Process.INTERNAL_runnable_PIPEReader, args=(self.process.stderr, self.STDERR_lines), daemon=True)
-        self.STDOUT_thread.start()
         self.STDERR_thread.start()
+        if not isStreamSTDOUT:
+            self.STDOUT_thread = threading.Thread(target=Process.INTERNAL_runnable_PIPEReader, args=(self.process.stdout, self.STDOUT_lines, STDOUTCallout), daemon=True)
+            self.STDOUT_thread.start()
 
     @staticmethod
-    def INTERNAL_runnable_PIPEReader(pipe, lines):
-        for line in iter(pipe.readline, ''):
+    def INTERNAL_runnable_PIPEReader(pipe, lines, callout=None):
+        for line in pipe:
+            line = line if isinstance(line, str) else line.decode(errors='replace')
             lines.append(line)
+            if callout is not None:
+                callout(line)
         pipe.close()
 
     def wait(self) -> int:
@@ -169,9 +178,27 @@ class Process:
         Note: This allows for graceful termination.
         '''
         if self.status is None:
+            # ? Unblock process, if blocked on writing to a (streamed) STDOUT.
+            if self.isStreamSTDOUT:
+                self.process.stdout.close()
             handler = self.process.kill if SIGKILL else self.process.terminate
             handler()
-            self.process.wait()
+            self.status = self.process.wait()
+
+    def readSTDOUT(self, buffer) -> int:
+        '''
+        Reads (streamed) STDOUT into a writable buffer (e.g., a `bytearray`), until it is full, or EOF is reached.
+        
+        Returns the number of byte(s) read.
+        '''
+        view = memoryview(buffer).cast('B')
+        count = 0
+        while count < len(view):
+            newCount = self.process.stdout.readinto(view[count:])
+            if not newCount:
+                break
+            count += newCount
+        return count
 
     def STDOUT(self) -> str:
         if self.stdout is None:
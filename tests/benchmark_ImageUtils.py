@@ -0,0 +1,52 @@
+'''
+Benchmarks `CV2Wrapper` against `PillowWrapper` (i.e., including the frame conversion(s) the 'Pillow' path used to need).
+
+Run as `python tests/benchmark_ImageUtils.py` (i.e., not collected by `pytest`).
+'''
+
+import sys
+import os
+import time
+import numpy as np
+import cv2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from automatey.Media import ImageUtils
+from automatey.Abstract import Graphics as AbstractGraphics
+from automatey.Utils import ColorUtils
+
+def measure(fcn, repeatCount:int=7):
+    '''
+    Returns the best run-time (in milliseconds).
+    '''
+    durations = []
+    for _ in range(repeatCount):
+        startTime = time.perf_counter()
+        fcn()
+        durations.append(time.perf_counter() - startTime)
+    return min(durations) * 1000
+
+def main():
+    rng = np.random.default_rng(0)
+    imgHandler = cv2.resize(cv2.GaussianBlur(rng.integers(0, 256, (300, 400, 3), dtype=np.uint8), (5, 5), 0), (1600, 1200))
+    border = AbstractGraphics.Border(12, ColorUtils.Colors.ORANGE)
+    operations = [
+        ('brightnessContrast', (1.3, 1.4)),
+        ('sharpen', (2.5,)),
+        ('findEdges', ()),
+        ('emboss', ()),
+        ('addBorder', (border,)),
+    ]
+    
+    frameConversion = ImageUtils.INTERNAL_FrameConversion
+    for name, args in operations:
+        pillowFcn = lambda: frameConversion.PillowToCV2(getattr(ImageUtils.INTERNAL_FrameProcessing.PillowWrapper, name)(frameConversion.CV2ToPillow(imgHandler), *args))
+        cv2Fcn = lambda: getattr(ImageUtils.INTERNAL_FrameProcessing.CV2Wrapper, name)(imgHandler, *args)
+        maxDifference = np.abs(pillowFcn().astype(int) - cv2Fcn().astype(int)).max()
+        pillowDuration = measure(pillowFcn)
+        cv2Duration = measure(cv2Fcn)
+        print(f'{name:20s} Pillow {pillowDuration:7.2f}ms | CV2 {cv2Duration:7.2f}ms | x{pillowDuration / cv2Duration:5.1f} | max-difference {maxDifference}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+import math
+import numpy as np
+import cv2
+import pytest
+import PIL.Image
+
+from automatey.Media import ImageUtils
+from automatey.Abstract import Graphics as AbstractGraphics
+from automatey.Utils import ColorUtils
+from automatey.Utils import ExceptionUtils
+from automatey.OS import FileUtils
+
+def createImgHandler(seed:int=0, width:int=160, height:int=120):
+    '''
+    Creates a (smooth) random BGR image.
+    '''
+    rng = np.random.default_rng(seed)
+    return cv2.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (9, 9), 0)
+
+def createRandomOperation(rng):
+    kind = rng.integers(0, 9)
+    if kind == 0:
+        return ('invert', ())
+    if kind == 1:
+        return ('sepiaTone', ())
+    if kind == 2:
+        return ('grayscale', ())
+    if kind == 3:
+        return ('brightnessContrast', (round(float(rng.uniform(0.5, 1.6)), 1), 1.0))
+    if kind == 4:
+        return ('brightnessContrast', (round(float(rng.uniform(0.5, 1.6)), 1), round(float(rng.uniform(0.5, 1.6)), 1)))
+    if kind == 5:
+        return ('blackWhite', (round(float(rng.uniform(0.2, 0.8)), 2),))
+    if kind == 6:
+        return ('resize', (80, -1))
+    if kind == 7:
+        return ('crop', (AbstractGraphics.Point(11, 11), AbstractGraphics.Point(100, 90)))
+    return ('gaussianBlur', (3,))
+
+def applyOperations(imgHandler, operations, isLazy:bool):
+    image = ImageUtils.Image(None, INTERNAL_imgHandler=imgHandler.copy(), isLazy=isLazy)
+    for name, args in operations:
+        getattr(image, name)(*args)
+    return image.EXTERNAL_toCV2()
+
+def iterateRandomChains(count:int):
+    for seed in range(count):
+        rng = np.random.default_rng(seed)
+        yield [createRandomOperation(rng) for _ in range(rng.integers(1, 6))]
+
+def iterateValidChains(imgHandler, count:int):
+    for operations in iterateRandomChains(count):
+        try:
+            eagerImgHandler = applyOperations(imgHandler, operations, isLazy=False)
+        except cv2.error:
+            # Chain is invalid (e.g., sepia-tone of a grayscale).
+            continue
+        yield operations, eagerImgHandler
+
+def test_lazy_matches_eager_exactly_unless_downscale_is_reordered():
+    imgHandler = createImgHandler()
+    for operations, eagerImgHandler in iterateValidChains(imgHandler, 500):
+        lazyImgHandler = applyOperations(imgHandler, operations, isLazy=True)
+        assert lazyImgHandler.shape == eagerImgHandler.shape
+        if any((name == 'resize') for name, _ in operations):
+            assert np.abs(lazyImgHandler.astype(int) - eagerImgHandler.astype(int)).max() <= 4, operations
+        else:
+            assert np.array_equal(lazyImgHandler, eagerImgHandler), operations
+
+def test_lazy_matches_eager_exactly_up_to_thresholding():
+    imgHandler = createImgHandler()
+    for operations in iterateRandomChains(500):
+        operations = operations + [('grayscale', ()), ('blackWhite', (0.5,))]
+        try:
+            eagerImgHandler = applyOperations(imgHandler, operations, isLazy=False)
+        except cv2.error:
+            continue
+        lazyImgHandler = applyOperations(imgHandler, operations, isLazy=True)
+        assert np.array_equal(lazyImgHandler, eagerImgHandler), operations
+
+@pytest.mark.parametrize('operations', [
+    [('brightnessContrast', (1.3, 1.0)), ('brightnessContrast', (0.8, 0.6)), ('brightnessContrast', (1.3, 1.0)), ('brightnessContrast', (1.3, 1.0))],
+    [('invert', ()), ('brightnessContrast', (1.2, 1.4)), ('invert', ()), ('blackWhite', (0.3,))],
+    [('grayscale', ()), ('invert', ()), ('brightnessContrast', (0.7, 1.5)), ('brightnessContrast', (1.0, 0.6)), ('invert', ())],
+    [('gaussianBlur', (5,)), ('invert', ()), ('brightnessContrast', (1.4, 1.0))],
+    [('invert', ()), ('invert', ())],
+    [('sepiaTone', ())],
+])
+def test_lazy_matches_eager_exactly_if_fused(operations):
+    imgHandler = createImgHandler()
+    assert np.array_equal(applyOperations(imgHandler, operations, isLazy=True), applyOperations(imgHandler, operations, isLazy=False))
+
+def test_lazy_does_not_modify_input():
+    imgHandler = createImgHandler()
+    srcImgHandler = imgHandler.copy()
+    image = ImageUtils.Image(None, INTERNAL_imgHandler=imgHandler, isLazy=True)
+    image.crop(AbstractGraphics.Point(11, 11), AbstractGraphics.Point(100, 90))
+    image.invert()
+    image.brightnessContrast(1.2, 1.0)
+    image.EXTERNAL_toCV2()
+    assert np.array_equal(imgHandler, srcImgHandler)
+
+def applyPillowWrapper(name, imgHandler, *args):
+    pillowImgHandler = PIL.Image.fromarray(cv2.cvtColor(imgHandler, cv2.COLOR_BGR2RGB))
+    pillowImgHandler = getattr(ImageUtils.INTERNAL_FrameProcessing.PillowWrapper, name)(pillowImgHandler, *args)
+    return cv2.cvtColor(np.array(pillowImgHandler), cv2.COLOR_RGB2BGR)
+
+def applyCV2Wrapper(name, imgHandler, *args):
+    return getattr(ImageUtils.INTERNAL_FrameProcessing.CV2Wrapper, name)(imgHandler.copy(), *args)
+
+def computeMaxDifference(imgHandler1, imgHandler2):
+    assert imgHandler1.shape == imgHandler2.shape
+    return np.abs(imgHandler1.astype(int) - imgHandler2.astype(int)).max()
+
+FACTORS = [0.0, 0.3, 0.5, 0.9, 1.0, 1.1, 1.5, 2.0, 2.75, 3.5, 4.0, 6.0, 9.0]
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('brightness', FACTORS)
+@pytest.mark.parametrize('contrast', FACTORS)
+def test_cv2_matches_pillow_brightnessContrast(seed, brightness, contrast):
+    imgHandler = createImgHandler(seed)
+    assert computeMaxDifference(applyCV2Wrapper('brightnessContrast', imgHandler, brightness, contrast), applyPillowWrapper('brightnessContrast', imgHandler, brightness, contrast)) == 0
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('factor', [-1.0] + FACTORS + [11.0])
+def test_cv2_matches_pillow_sharpen(seed, factor):
+    imgHandler = createImgHandler(seed)
+    # ? Bound as documented in `CV2Wrapper.sharpen`.
+    bound = math.ceil((abs(factor - 1) + 1) / 2)
+    assert computeMaxDifference(applyCV2Wrapper('sharpen', imgHandler, factor), applyPillowWrapper('sharpen', imgHandler, factor)) <= bound
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('name', ['findEdges', 'emboss'])
+def test_cv2_matches_pillow_filter(seed, name):
+    imgHandler = createImgHandler(seed)
+    assert computeMaxDifference(applyCV2Wrapper(name, imgHandler), applyPillowWrapper(name, imgHandler)) == 0
+
+@pytest.mark.parametrize('thickness', [1, 7])
+def test_cv2_matches_pillow_addBorder(thickness):
+    imgHandler = createImgHandler()
+    border = AbstractGraphics.Border(thickness, ColorUtils.Colors.ORANGE)
+    assert computeMaxDifference(applyCV2Wrapper('addBorder', imgHandler, border), applyPillowWrapper('addBorder', imgHandler, border)) == 0
+
+def createGIF(tmp_path, frameCount:int=6):
+    '''
+    Creates a GIF, where each frame is a solid gray of its index.
+    '''
+    f = tmp_path / 'src.gif'
+    frames = [PIL.Image.new('RGB', (16, 12), (i * 40,) * 3) for i in range(frameCount)]
+    frames[0].save(str(f), save_all=True, append_images=frames[1:], duration=100)
+    return FileUtils.File(str(f))
+
+def test_streamed_gif_selects_forward_ranges(tmp_path):
+    gif = ImageUtils.GIF(createGIF(tmp_path), isStreamed=True)
+    gif.selectFrames([(2, 3), (5, 6)])
+    assert gif.getFrameCount() == 4
+    assert [int(gif.asImage(i).EXTERNAL_toCV2()[0, 0, 0]) for i in range(1, 5)] == [40, 80, 160, 200]
+
+def test_streamed_gif_rejects_backward_ranges(tmp_path):
+    gif = ImageUtils.GIF(createGIF(tmp_path), isStreamed=True)
+    with pytest.raises(ExceptionUtils.ValidationError):
+        gif.selectFrames([(1, 2), (6, 3)])